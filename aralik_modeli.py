@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Aralık değişkenli program modeli modülü
+Ders programını (ilişki, gün, saat, derslik) hücreleri yerine her ilişkinin
+her günkü ders bloğu için isteğe bağlı aralık değişkenleriyle kurar. Öğretmen,
+sınıf ve derslik çakışmaları gün bazında AddNoOverlap ile modellenir; blok
+dersler tek bir aralık olduğu için ardışıklık kısıtlarına gerek kalmaz.
+"""
+
+import time
+import logging
+import numpy as np
+from ortools.sat.python import cp_model
+
+from algorithm.sezgisel import HizliProgramOlusturucu
+from algorithm.profil import kurma_olcumu, profil_kaydi
+
+class AralikModeli:
+    """
+    İsteğe bağlı aralık değişkenleriyle kurulan CP-SAT program modeli
+    
+    Her (ilişki, gün) için blok ders açıksa en fazla max_blok_ders saatlik bir,
+    kapalıysa günlük en fazla ders saati kadar blok oluşturulur. Bloğun başlangıcı, uzunluğu (0: yok) ve
+    dersliği değişkendir; her izinli derslik için aynı başlangıç ve uzunluğu
+    paylaşan isteğe bağlı bir aralık o dersliğin çakışma kısıtına girer.
+    Öğretmenin uygun olmadığı saatler öğretmen çakışma kısıtına sabit aralık
+    olarak eklenir.
+    
+    Model, verileri yüklenmiş ve compute_domains çağrılmış ProgramOlusturucu
+    üzerinde kurulur ve olusturucu.model olarak atanır; böylece olusturucu.solve()
+    ile çözülür. Onarım ve açıklama modları bu modelde desteklenmez.
+    """
+    
+    def __init__(self, olusturucu):
+        """
+        Modeli başlatır
+        
+        Args:
+            olusturucu (ProgramOlusturucu): Verileri yüklenmiş ve compute_domains çağrılmış program oluşturucu
+        """
+        self.olusturucu = olusturucu
+        self.logger = logging.getLogger(__name__)
+        
+        self.model = None
+        self.gun_sayisi = olusturucu.gun_sayisi
+        self.saat_sayisi = olusturucu.saat_sayisi
+        
+        # Bloklar: her biri r, gun, baslangic, uzunluk, bitis, var (BoolVar), aralik ve
+        # derslikler ((derslik sırası, BoolVar, aralık) listesi) alanlarını taşıyan sözlükler
+        self.bloklar = []
+        self.iliski_bloklari = {}
+        
+        # (ogretmen_id, gun) -> o gün dersi var mı (BoolVar)
+        self.ogretmen_gun_var = {}
+        
+        # Kurma profili olusturucu.kurma_profili ile paylaşılır (bkz. profil.kurma_olcumu)
+        self.kurma_profili = []
+        self._kurma_derinligi = 0
+    
+    def kur(self):
+        """
+        Modeli kurar ve program oluşturucunun modeli olarak atar
+        
+        Returns:
+            bool: Başarılı mı?
+        """
+        try:
+            baslangic = time.time()
+            o = self.olusturucu
+            self.model = cp_model.CpModel()
+            o.model = self.model
+            o.ipucu_tamamlanacak = False
+            self.kurma_profili = o.kurma_profili = []
+            self._kurma_derinligi = 0
+            
+            self.create_block_variables()
+            self.add_weekly_hours_constraints()
+            self.add_no_overlap_constraints()
+            self.add_daily_hours_constraints()
+            self.add_same_course_daily_constraints()
+            self.add_objective()
+            
+            if o.sicak_baslangic:
+                self.add_solution_hints()
+            
+            self.logger.info(profil_kaydi(self.model, self.kurma_profili, time.time() - baslangic))
+            self.logger.info(f"Aralık modeli oluşturuldu: {len(self.bloklar)} blok")
+            return True
+        except Exception as e:
+            self.logger.error(f"Aralık modeli oluşturulurken hata oluştu: {str(e)}")
+            raise
+    
+    def _gun_ust_siniri(self, iliski):
+        """
+        Bir ilişkinin bir günde alabileceği en fazla ders saati
+        
+        Blok ders açıksa günlük tek blok en fazla max_blok_ders saat sürebilir.
+        """
+        o = self.olusturucu
+        ust = min(iliski["haftalik_saat"], o.ayni_ders_tekrar, o.ogretmen_gunluk_max, o.sinif_gunluk_max, self.saat_sayisi)
+        return min(ust, o.max_blok_ders) if o.blok_ders_arka_arkaya else ust
+    
+    @kurma_olcumu
+    def create_block_variables(self):
+        """
+        Her (ilişki, gün) için blok değişkenlerini ve derslik aralıklarını oluşturur
+        """
+        o = self.olusturucu
+        for r, iliski in enumerate(o.ders_sinif_iliskileri):
+            ust = self._gun_ust_siniri(iliski)
+            derslikler = np.flatnonzero(o.uygun_derslikler[r]).tolist()
+            blok_sayisi = 1 if o.blok_ders_arka_arkaya else ust
+            
+            for gun in range(self.gun_sayisi):
+                # Öğretmenin o gün hiç uygun saati yoksa ya da izinli derslik yoksa blok oluşturulmaz
+                if ust <= 0 or not derslikler or not o.uygun_zamanlar[r, gun].any():
+                    continue
+                
+                gun_bloklari = []
+                for b in range(blok_sayisi):
+                    ad = f"iliski_{iliski['id']}_gun_{gun}_blok_{b}"
+                    var = self.model.NewBoolVar(f"{ad}_var")
+                    baslangic = self.model.NewIntVar(0, self.saat_sayisi - 1, f"{ad}_baslangic")
+                    uzunluk = self.model.NewIntVar(0, ust, f"{ad}_uzunluk")
+                    bitis = self.model.NewIntVar(0, self.saat_sayisi, f"{ad}_bitis")
+                    aralik = self.model.NewOptionalIntervalVar(baslangic, uzunluk, bitis, var, f"{ad}_aralik")
+                    
+                    # Blok varsa en az bir saat sürer, yoksa uzunluğu 0'dır
+                    self.model.Add(bitis == baslangic + uzunluk)
+                    self.model.Add(uzunluk >= 1).OnlyEnforceIf(var)
+                    self.model.Add(uzunluk == 0).OnlyEnforceIf(var.Not())
+                    
+                    # Derslik seçimi: tek izinli derslik varsa bloğun kendisi kullanılır
+                    if len(derslikler) == 1:
+                        derslik_secimleri = [(derslikler[0], var, aralik)]
+                    else:
+                        derslik_secimleri = []
+                        for k in derslikler:
+                            secim = self.model.NewBoolVar(f"{ad}_derslik_{k}")
+                            derslik_secimleri.append((k, secim, self.model.NewOptionalIntervalVar(baslangic, uzunluk, bitis, secim, f"{ad}_derslik_{k}_aralik")))
+                        self.model.Add(sum(secim for _, secim, _ in derslik_secimleri) == var)
+                    
+                    blok = {
+                        "r": r, "gun": gun, "var": var, "baslangic": baslangic, "uzunluk": uzunluk,
+                        "bitis": bitis, "aralik": aralik, "derslikler": derslik_secimleri
+                    }
+                    
+                    # Aynı gündeki bloklar sıralıdır (simetri kırma)
+                    if gun_bloklari:
+                        onceki = gun_bloklari[-1]
+                        self.model.AddImplication(var, onceki["var"])
+                        self.model.Add(onceki["bitis"] <= baslangic).OnlyEnforceIf(var)
+                    
+                    gun_bloklari.append(blok)
+                    self.bloklar.append(blok)
+                
+                self.iliski_bloklari[(r, gun)] = gun_bloklari
+        
+        self.logger.info(f"{len(self.bloklar)} blok için aralık değişkenleri oluşturuldu")
+    
+    def _bloklar(self, iliskiler, gun):
+        """
+        Verilen ilişkilerin bir gündeki bloklarını döndürür
+        """
+        return [blok for r in iliskiler for blok in self.iliski_bloklari.get((r, gun), [])]
+    
+    @kurma_olcumu
+    def add_weekly_hours_constraints(self):
+        """
+        Her ilişkinin blok uzunlukları toplamı haftalık ders saatine eşit olmalı
+        """
+        o = self.olusturucu
+        for r, iliski in enumerate(o.ders_sinif_iliskileri):
+            uzunluklar = [blok["uzunluk"] for gun in range(self.gun_sayisi) for blok in self.iliski_bloklari.get((r, gun), [])]
+            self.model.Add(sum(uzunluklar) == iliski["haftalik_saat"])
+    
+    @kurma_olcumu
+    def add_no_overlap_constraints(self):
+        """
+        Öğretmen, sınıf ve derslik başına her gün için AddNoOverlap kısıtı ekler
+        """
+        o = self.olusturucu
+        
+        for gun in range(self.gun_sayisi):
+            # Öğretmen: bloklar ve uygun olmayan saatler çakışamaz
+            for ogretmen_id, iliskiler in o.ogretmen_iliskileri.items():
+                araliklar = [blok["aralik"] for blok in self._bloklar(iliskiler, gun)]
+                if not araliklar:
+                    continue
+                
+                # Uygunluk öğretmene bağlıdır; öğretmenin ilk ilişkisinin satırı kullanılır
+                uygun = o.uygun_zamanlar[iliskiler[0], gun]
+                saat = 0
+                while saat < self.saat_sayisi:
+                    if uygun[saat]:
+                        saat += 1
+                        continue
+                    son = saat
+                    while son < self.saat_sayisi and not uygun[son]:
+                        son += 1
+                    araliklar.append(self.model.NewFixedSizeIntervalVar(saat, son - saat, f"ogretmen_{ogretmen_id}_gun_{gun}_uygun_degil_{saat}"))
+                    saat = son
+                
+                if len(araliklar) > 1:
+                    self.model.AddNoOverlap(araliklar)
+            
+            # Sınıf
+            for iliskiler in o.sinif_iliskileri.values():
+                araliklar = [blok["aralik"] for blok in self._bloklar(iliskiler, gun)]
+                if len(araliklar) > 1:
+                    self.model.AddNoOverlap(araliklar)
+            
+            # Derslik
+            derslik_araliklari = {}
+            for blok in self.bloklar:
+                if blok["gun"] != gun:
+                    continue
+                for k, _, aralik in blok["derslikler"]:
+                    derslik_araliklari.setdefault(k, []).append(aralik)
+            for araliklar in derslik_araliklari.values():
+                if len(araliklar) > 1:
+                    self.model.AddNoOverlap(araliklar)
+    
+    @kurma_olcumu
+    def add_daily_hours_constraints(self):
+        """
+        Öğretmen ve sınıfların günlük en fazla ve en az ders saati kısıtları
+        """
+        o = self.olusturucu
+        self.ogretmen_gun_var = {}
+        
+        for gun in range(self.gun_sayisi):
+            for ogretmen_id, iliskiler in o.ogretmen_iliskileri.items():
+                bloklar = self._bloklar(iliskiler, gun)
+                if not bloklar:
+                    continue
+                
+                toplam = sum(blok["uzunluk"] for blok in bloklar)
+                self.model.Add(toplam <= o.ogretmen_gunluk_max)
+                
+                # O gün dersi varsa en az ogretmen_gunluk_min saat
+                ders_var = self.model.NewBoolVar(f"ogretmen_{ogretmen_id}_gun_{gun}_ders_var")
+                self.model.AddMaxEquality(ders_var, [blok["var"] for blok in bloklar])
+                self.model.Add(toplam >= o.ogretmen_gunluk_min).OnlyEnforceIf(ders_var)
+                self.ogretmen_gun_var[(ogretmen_id, gun)] = ders_var
+            
+            for iliskiler in o.sinif_iliskileri.values():
+                bloklar = self._bloklar(iliskiler, gun)
+                if not bloklar:
+                    # O gün bloğu olmayan sınıfta da en az kısıtı geçerlidir (model çözümsüz olur)
+                    if o.sinif_gunluk_min > 0:
+                        self.model.Add(self.model.NewConstant(0) >= o.sinif_gunluk_min)
+                    continue
+                
+                toplam = sum(blok["uzunluk"] for blok in bloklar)
+                self.model.Add(toplam <= o.sinif_gunluk_max)
+                self.model.Add(toplam >= o.sinif_gunluk_min)
+    
+    @kurma_olcumu
+    def add_same_course_daily_constraints(self):
+        """
+        Bir sınıfta aynı ders günde en fazla ayni_ders_tekrar saat yapılabilir
+        """
+        o = self.olusturucu
+        sinif_dersleri = {}
+        for r, iliski in enumerate(o.ders_sinif_iliskileri):
+            sinif_dersleri.setdefault((iliski["sinif_id"], iliski["ders_id"]), []).append(r)
+        
+        for iliskiler in sinif_dersleri.values():
+            # Tek ilişkide sınır blok uzunluğunun üst sınırıyla zaten sağlanır
+            if len(iliskiler) == 1:
+                continue
+            for gun in range(self.gun_sayisi):
+                bloklar = self._bloklar(iliskiler, gun)
+                if bloklar:
+                    self.model.Add(sum(blok["uzunluk"] for blok in bloklar) <= o.ayni_ders_tekrar)
+    
+    @kurma_olcumu
+    def add_objective(self):
+        """
+        Amaç fonksiyonunu ekler (öğretmen boş saatleri ve sınıf derslik değişimleri)
+        """
+        o = self.olusturucu
+        terimler = []
+        
+        minimize = o.ogretmen_bos_saat_tercihi == "minimize"
+        terimler.extend(self.get_teacher_idle_hours_terms(minimize=minimize))
+        
+        if o.derslik_degisim_minimize:
+            terimler.extend(self.get_classroom_change_terms())
+        
+        if terimler:
+            self.model.Minimize(sum(terimler))
+    
+    @kurma_olcumu
+    def get_teacher_idle_hours_terms(self, minimize=True):
+        """
+        Öğretmen boş saat terimlerini döndürür
+        
+        Her öğretmen ve gün için ilk ders başlangıcı ve son ders bitişi blokların
+        en küçük başlangıcı ve en büyük bitişidir; boş saat sayısı aradaki sürenin
+        ders saatleri toplamından farkıdır.
+        
+        Args:
+            minimize (bool): True ise boş saatler minimize edilir, False ise maximize edilir
+            
+        Returns:
+            list: Amaç fonksiyonu terimleri
+        """
+        o = self.olusturucu
+        terimler = []
+        
+        for (ogretmen_id, gun), ders_var in self.ogretmen_gun_var.items():
+            bloklar = self._bloklar(o.ogretmen_iliskileri[ogretmen_id], gun)
+            ad = f"ogretmen_{ogretmen_id}_gun_{gun}"
+            
+            # Olmayan bloklar en küçük başlangıç ve en büyük bitişi etkilemez
+            baslangiclar = []
+            bitisler = []
+            for i, blok in enumerate(bloklar):
+                baslangic = self.model.NewIntVar(0, self.saat_sayisi, f"{ad}_blok_{i}_baslangic")
+                self.model.Add(baslangic == blok["baslangic"]).OnlyEnforceIf(blok["var"])
+                self.model.Add(baslangic == self.saat_sayisi).OnlyEnforceIf(blok["var"].Not())
+                baslangiclar.append(baslangic)
+                
+                bitis = self.model.NewIntVar(0, self.saat_sayisi, f"{ad}_blok_{i}_bitis")
+                self.model.Add(bitis == blok["bitis"]).OnlyEnforceIf(blok["var"])
+                self.model.Add(bitis == 0).OnlyEnforceIf(blok["var"].Not())
+                bitisler.append(bitis)
+            
+            ilk = self.model.NewIntVar(0, self.saat_sayisi, f"{ad}_ilk")
+            son = self.model.NewIntVar(0, self.saat_sayisi, f"{ad}_son")
+            self.model.AddMinEquality(ilk, baslangiclar)
+            self.model.AddMaxEquality(son, bitisler)
+            
+            bos_saat = self.model.NewIntVar(0, self.saat_sayisi, f"{ad}_bos_saat")
+            self.model.Add(bos_saat == son - ilk - sum(blok["uzunluk"] for blok in bloklar)).OnlyEnforceIf(ders_var)
+            self.model.Add(bos_saat == 0).OnlyEnforceIf(ders_var.Not())
+            
+            terimler.append(bos_saat if minimize else -bos_saat)
+        
+        return terimler
+    
+    @kurma_olcumu
+    def get_classroom_change_terms(self):
+        """
+        Derslik değişim terimlerini döndürür
+        
+        Saat geçişlerini izlemek yerine her sınıfın bir günde kullandığı farklı
+        derslik sayısının bir eksiği cezalandırılır (bir günde k derslik
+        kullanan sınıf en az k - 1 kez derslik değiştirir).
+        
+        Returns:
+            list: Amaç fonksiyonu terimleri
+        """
+        o = self.olusturucu
+        terimler = []
+        
+        for sinif_id, iliskiler in o.sinif_iliskileri.items():
+            for gun in range(self.gun_sayisi):
+                bloklar = self._bloklar(iliskiler, gun)
+                derslik_secimleri = {}
+                for blok in bloklar:
+                    for k, secim, _ in blok["derslikler"]:
+                        derslik_secimleri.setdefault(k, []).append(secim)
+                if len(derslik_secimleri) <= 1:
+                    continue
+                
+                kullanilan = []
+                for k, secimler in derslik_secimleri.items():
+                    kullanildi = self.model.NewBoolVar(f"sinif_{sinif_id}_gun_{gun}_derslik_{k}_kullanildi")
+                    for secim in secimler:
+                        self.model.AddImplication(secim, kullanildi)
+                    kullanilan.append(kullanildi)
+                
+                ders_var = self.model.NewBoolVar(f"sinif_{sinif_id}_gun_{gun}_ders_var")
+                self.model.AddMaxEquality(ders_var, [blok["var"] for blok in bloklar])
+                terimler.append(sum(kullanilan) - ders_var)
+        
+        return terimler
+    
+    @kurma_olcumu
+    def add_solution_hints(self):
+        """
+        Mevcut programı (yoksa ve ayar açıksa sezgisel taslağı) blok ipuçlarına çevirir
+        
+        Her (ilişki, gün) için aynı derslikteki ardışık saatler bir blok olarak
+        sırayla bloklara yerleştirilir; blok sayısını aşan günler ipucusuz bırakılır.
+        İpucu solve() başında ProgramOlusturucu.ipucunu_tamamla ile tüm değişkenlere genişletilir.
+        """
+        o = self.olusturucu
+        atamalar = o.mevcut_atamalar()
+        if not atamalar and o.sezgisel_ipucu:
+            atamalar, _ = HizliProgramOlusturucu(o).olustur()
+        
+        if not atamalar:
+            self.logger.info("Sıcak başlangıç için kullanılabilir program kaydı yok")
+            return
+        
+        saatler = {}
+        for r, gun, saat, k in atamalar:
+            saatler.setdefault((r, gun), []).append((saat, k))
+        
+        ipuclu = 0
+        for (r, gun), gun_bloklari in self.iliski_bloklari.items():
+            # Ardışık ve aynı derslikteki saatler tek blok
+            parcalar = []
+            for saat, k in sorted(saatler.get((r, gun), [])):
+                if parcalar and parcalar[-1][0] + parcalar[-1][1] == saat and parcalar[-1][2] == k:
+                    parcalar[-1][1] += 1
+                else:
+                    parcalar.append([saat, 1, k])
+            
+            if len(parcalar) > len(gun_bloklari):
+                continue
+            
+            for i, blok in enumerate(gun_bloklari):
+                if i < len(parcalar):
+                    saat, uzunluk, k = parcalar[i]
+                    self.model.AddHint(blok["var"], True)
+                    self.model.AddHint(blok["baslangic"], saat)
+                    self.model.AddHint(blok["uzunluk"], uzunluk)
+                    for derslik, secim, _ in blok["derslikler"]:
+                        if secim is not blok["var"]:
+                            self.model.AddHint(secim, derslik == k)
+                else:
+                    self.model.AddHint(blok["var"], False)
+            ipuclu += 1
+        
+        self.logger.info(f"Sıcak başlangıç: {len(atamalar)} ders saati {ipuclu} ilişki-gün için ipucu olarak eklendi")
+        o.ipucu_tamamlanacak = True
+    
+    def atamalar(self, cozum):
+        """
+        Çözümdeki blokları saat bazında atamalara çevirir
+        
+        Args:
+            cozum (CpSolver): Çözüm bulmuş çözücü
+            
+        Returns:
+            list: (iliski_id, gun, saat, derslik_id) demetleri
+        """
+        o = self.olusturucu
+        atamalar = []
+        for blok in self.bloklar:
+            if not cozum.BooleanValue(blok["var"]):
+                continue
+            
+            k = next(k for k, secim, _ in blok["derslikler"] if cozum.BooleanValue(secim))
+            baslangic = cozum.Value(blok["baslangic"])
+            for saat in range(baslangic, baslangic + cozum.Value(blok["uzunluk"])):
+                atamalar.append((o.ders_sinif_iliskileri[blok["r"]]["id"], blok["gun"], saat, o.derslikler[k]["id"]))
+        return atamalar
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çözücü arka uçları modülü
+Program oluşturmanın farklı yollarını (tek modelli CP-SAT, iki aşamalı CP-SAT,
+aralık modelli CP-SAT, sezgisel taslak, taslak + yerel arama) aynı arayüz arkasında toplar. Her arka
+uç verileri yüklenmiş bir ProgramOlusturucu alır ve bir CozumSonucu döndürür.
+"""
+
+import time
+import logging
+
+from algorithm.yerel_arama import YerelAramaIyilestirici
+from algorithm.aralik_modeli import AralikModeli
+
+class CozumSonucu:
+    """
+    Bir arka ucun çalışma sonucu
+    
+    Süreçler arasında aktarılabilmesi için yalnızca temel tipler tutar.
+    """
+    
+    def __init__(self, arka_uc, atamalar=None, durum="", sure=0.0, eksikler=None, bilgiler=None):
+        """
+        Sonucu oluşturur
+        
+        Args:
+            arka_uc (str): Arka uç adı
+            atamalar (list, optional): (iliski_id, gun, saat, derslik_id) demetleri, çözüm yoksa None
+            durum (str): Çözüm durumu (OPTIMAL, FEASIBLE, INFEASIBLE, TASLAK...)
+            sure (float): Çalışma süresi (saniye)
+            eksikler (list, optional): Yerleştirilemeyen ders saatleri: {"iliski_id", "eksik_saat"} sözlükleri
+            bilgiler (list, optional): Kullanıcıya gösterilecek ek satırlar
+        """
+        self.arka_uc = arka_uc
+        self.atamalar = atamalar
+        self.durum = durum
+        self.sure = sure
+        self.eksikler = eksikler or []
+        self.bilgiler = bilgiler or []
+        
+        # Arka uçlar arasında karşılaştırma için ortak değerlendirme (bkz. degerlendir)
+        self.amac = None
+        self.ihlal = None
+    
+    @property
+    def basarili(self):
+        """
+        Kaydedilebilir bir program bulundu mu?
+        """
+        return self.atamalar is not None
+    
+    @property
+    def tam(self):
+        """
+        Tüm ders saatleri yerleştirildi ve hiçbir kısıt ihlal edilmedi mi?
+        """
+        return self.basarili and not self.eksikler and not self.ihlal
+    
+    def degerlendir(self, olusturucu):
+        """
+        Programı tüm arka uçlar için aynı ölçütle (boş saat ve derslik değişimi) puanlar
+        
+        Args:
+            olusturucu (ProgramOlusturucu): Verileri yüklenmiş ve compute_domains çağrılmış program oluşturucu
+        """
+        if self.basarili:
+            self.amac, self.ihlal = YerelAramaIyilestirici(olusturucu).degerlendir(self.atamalar)
+    
+    def siralama_anahtari(self):
+        """
+        Yarışta en iyi sonucu seçmek için sıralama anahtarı (küçük olan iyidir)
+        """
+        return (not self.basarili, sum(eksik["eksik_saat"] for eksik in self.eksikler), self.ihlal or 0, self.amac or 0, self.sure)
+
+class CozucuArkaUcu:
+    """
+    Çözücü arka uçlarının temel sınıfı
+    
+    Alt sınıflar ad, aciklama ve _coz'u tanımlar.
+    """
+    
+    ad = ""
+    aciklama = ""
+    
+    def __init__(self):
+        """
+        Arka ucu başlatır
+        """
+        self.logger = logging.getLogger(__name__)
+    
+    def coz(self, olusturucu, ilerleme_geri_cagirma=None):
+        """
+        Programı oluşturur ve sonucu ortak ölçütle değerlendirir
+        
+        Args:
+            olusturucu (ProgramOlusturucu): Verileri yüklenmiş program oluşturucu
+            ilerleme_geri_cagirma (callable, optional): ProgramOlusturucu.solve() ile aynı
+            
+        Returns:
+            CozumSonucu: Sonuç
+        """
+        baslangic = time.time()
+        olusturucu.compute_domains()
+        sonuc = self._coz(olusturucu, ilerleme_geri_cagirma)
+        sonuc.sure = time.time() - baslangic
+        sonuc.degerlendir(olusturucu)
+        
+        self.logger.info(
+            f"{self.aciklama}: {sonuc.durum}, {sonuc.sure:.2f} saniye, amaç: {sonuc.amac}, "
+            f"eksik: {sum(eksik['eksik_saat'] for eksik in sonuc.eksikler)} saat"
+        )
+        return sonuc
+    
+    def _coz(self, olusturucu, ilerleme_geri_cagirma):
+        """
+        Arka uca özgü çözüm adımı
+        """
+        raise NotImplementedError
+
+class CpSatArkaUcu(CozucuArkaUcu):
+    """
+    Tek modelli CP-SAT arka ucu
+    
+    Ayarlarda açıksa bileşenlere ayırma ve iki aşamalı çözüm de bu arka uçtan kullanılır.
+    """
+    
+    ad = "cp_sat"
+    aciklama = "CP-SAT"
+    
+    def _coz(self, olusturucu, ilerleme_geri_cagirma):
+        """
+        Modeli kurup çözer (bileşenlere ayırma açıksa bileşenleri ayrı çözer)
+        """
+        if olusturucu.bilesen_ayristirma:
+            atamalar = olusturucu.solve_components(ilerleme_geri_cagirma)
+            bilgiler = [
+                f"Bileşen {rapor['bilesen']}: {rapor['iliski_sayisi']} ilişki, kurma {rapor['kurma_suresi']:.2f} sn, "
+                f"çözme {rapor['cozum_suresi']:.2f} sn, {rapor['durum']}"
+                for rapor in olusturucu.bilesen_raporu
+            ]
+            return CozumSonucu(self.ad, atamalar, olusturucu.bilesen_durumu, bilgiler=bilgiler)
+        
+        iki_asamali = olusturucu.iki_asamali
+        olusturucu.create_model()
+        basarili = olusturucu.solve(ilerleme_geri_cagirma)
+        
+        # solve() derslikleri eşleştiremezse iki aşamalı çözümü kapatıp tek aşamalı modele döner
+        bilgiler = []
+        if iki_asamali and not olusturucu.iki_asamali:
+            bilgiler.append("Derslikler eşleştirmeyle atanamadığı için tek aşamalı modele geçildi")
+        
+        return CozumSonucu(
+            self.ad,
+            olusturucu.cozum_atamalari() if basarili else None,
+            olusturucu.solver.StatusName(olusturucu.son_durum) if olusturucu.son_durum is not None else "UNKNOWN",
+            bilgiler=bilgiler
+        )
+
+class IkiAsamaliArkaUcu(CpSatArkaUcu):
+    """
+    Önce zamanları CP-SAT ile, sonra derslikleri eşleştirmeyle atayan arka uç
+    """
+    
+    ad = "iki_asamali"
+    aciklama = "İki aşamalı CP-SAT"
+    
+    def _coz(self, olusturucu, ilerleme_geri_cagirma):
+        """
+        İki aşamalı çözümü bu çalışma için açarak CP-SAT arka ucunu çalıştırır
+        """
+        onceki = olusturucu.iki_asamali
+        olusturucu.iki_asamali = True
+        try:
+            return super()._coz(olusturucu, ilerleme_geri_cagirma)
+        finally:
+            olusturucu.iki_asamali = onceki
+
+class AralikArkaUcu(CozucuArkaUcu):
+    """
+    Ders bloklarını aralık değişkenleri ve AddNoOverlap ile modelleyen CP-SAT arka ucu
+    """
+    
+    ad = "aralik"
+    aciklama = "CP-SAT aralık modeli (NoOverlap)"
+    
+    def _coz(self, olusturucu, ilerleme_geri_cagirma):
+        """
+        Aralık modelini kurup çözer
+        """
+        model = AralikModeli(olusturucu)
+        model.kur()
+        basarili = olusturucu.solve(ilerleme_geri_cagirma)
+        return CozumSonucu(
+            self.ad,
+            model.atamalar(olusturucu.cozum) if basarili else None,
+            olusturucu.solver.StatusName(olusturucu.son_durum) if olusturucu.son_durum is not None else "UNKNOWN"
+        )
+
+class SezgiselArkaUcu(CozucuArkaUcu):
+    """
+    Açgözlü sezgisel taslak arka ucu (yerleştirilemeyen dersler eksik olarak raporlanır)
+    """
+    
+    ad = "sezgisel"
+    aciklama = "Hızlı taslak"
+    
+    def _coz(self, olusturucu, ilerleme_geri_cagirma):
+        """
+        Sezgisel taslağı oluşturur
+        """
+        atamalar = olusturucu.create_draft()
+        return CozumSonucu(self.ad, atamalar, "TASLAK", eksikler=_eksik_sozlukleri(olusturucu.taslak_eksikleri))
+
+class YerelAramaArkaUcu(CozucuArkaUcu):
+    """
+    Sezgisel taslağı algoritma süre sınırı boyunca yerel aramayla iyileştiren arka uç
+    """
+    
+    ad = "yerel_arama"
+    aciklama = "Taslak + yerel arama"
+    
+    def _coz(self, olusturucu, ilerleme_geri_cagirma):
+        """
+        Taslağı oluşturur ve kalan süre boyunca iyileştirir
+        """
+        baslangic = time.time()
+        atamalar = olusturucu.create_draft()
+        kalan_sure = max(0.0, olusturucu.algoritma_sure_siniri - (time.time() - baslangic))
+        atamalar = YerelAramaIyilestirici(olusturucu).iyilestir(atamalar, kalan_sure)
+        return CozumSonucu(self.ad, atamalar, "TASLAK", eksikler=_eksik_sozlukleri(olusturucu.taslak_eksikleri))
+
+def _eksik_sozlukleri(eksikler):
+    """
+    Taslak eksiklerini süreçler arasında aktarılabilir sözlüklere çevirir
+    """
+    return [{"iliski_id": eksik["iliski"]["id"], "eksik_saat": eksik["eksik_saat"]} for eksik in eksikler]
+
+# Ayarlarda ve arayüzde kullanılan ad -> arka uç sınıfı eşlemesi
+ARKA_UCLAR = {
+    arka_uc.ad: arka_uc
+    for arka_uc in (CpSatArkaUcu, IkiAsamaliArkaUcu, AralikArkaUcu, SezgiselArkaUcu, YerelAramaArkaUcu)
+}
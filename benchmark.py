@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Program oluşturucu performans ölçüm modülü
+Farklı model seçeneklerini aynı veri üzerinde kurma süresi, model boyutu ve
+ilk çözüme ulaşma süresi bakımından karşılaştırır; sentetik okullarla farklı
+boyutlarda ölçekleme ölçümü yapar
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import shutil
+import logging
+import tempfile
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from ortools.sat.python import cp_model
+
+try:
+    import resource
+except ImportError:  # Windows'ta tepe bellek ölçülmez
+    resource = None
+
+from data.database import Database
+from algorithm.scheduler import ProgramOlusturucu
+from algorithm.sentetik_okul import SentetikOkulUretici
+from algorithm.aralik_modeli import AralikModeli
+
+class IlkCozumZamanlayici(cp_model.CpSolverSolutionCallback):
+    """
+    İlk çözümün bulunduğu anı kaydeden çözüm geri çağırma sınıfı
+    """
+    
+    def __init__(self):
+        """
+        Zamanlayıcıyı başlatır
+        """
+        super().__init__()
+        self.baslangic = time.time()
+        self.ilk_cozum_suresi = None
+        self.cozum_sayisi = 0
+    
+    def on_solution_callback(self):
+        """
+        Her çözümde çağrılır
+        """
+        self.cozum_sayisi += 1
+        if self.ilk_cozum_suresi is None:
+            self.ilk_cozum_suresi = time.time() - self.baslangic
+
+def model_olc(db, sure_siniri, **secenekler):
+    """
+    Verilen seçeneklerle modeli kurar, çözer ve ölçümleri döndürür
+    
+    Args:
+        db (Database): Veritabanı bağlantısı
+        sure_siniri (float): Çözücü süre sınırı (saniye)
+        **secenekler: ProgramOlusturucu üzerinde ayarlanacak öznitelikler; model="aralik"
+            verilirse hücre modeli yerine aralık modeli kurulur
+            
+    Returns:
+        dict: Ölçüm sonuçları
+    """
+    olusturucu = ProgramOlusturucu(db, None)
+    for anahtar, deger in secenekler.items():
+        if anahtar != "model":
+            setattr(olusturucu, anahtar, deger)
+    
+    baslangic = time.time()
+    olusturucu.load_data()
+    if secenekler.get("model") == "aralik":
+        olusturucu.compute_domains()
+        aralik_modeli = AralikModeli(olusturucu)
+        aralik_modeli.kur()
+    else:
+        aralik_modeli = None
+        olusturucu.create_model()
+    kurma_suresi = time.time() - baslangic
+    
+    # Sıcak başlangıç ipucu solve()'daki gibi çözümden önce tamamlanır ve ayrı ölçülür
+    baslangic = time.time()
+    if olusturucu.ipucu_tamamlanacak:
+        olusturucu.ipucunu_tamamla()
+    ipucu_suresi = time.time() - baslangic
+    
+    proto = olusturucu.model.Proto()
+    
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = sure_siniri
+    zamanlayici = IlkCozumZamanlayici()
+    durum = solver.Solve(olusturucu.model, zamanlayici)
+    cozum_suresi = time.time() - zamanlayici.baslangic
+    
+    # Atamaları çıkar (iki aşamalı çözümde derslik eşleştirmesi burada yapılır)
+    atama_suresi = None
+    derslik_degisimi = None
+    if zamanlayici.cozum_sayisi:
+        olusturucu.cozum = solver
+        baslangic = time.time()
+        atamalar = aralik_modeli.atamalar(solver) if aralik_modeli else olusturucu.cozum_atamalari()
+        atama_suresi = time.time() - baslangic
+        # Eşleştirme bulunamazsa (iç içe olmayan derslik kümeleri) değişim sayılmaz
+        if atamalar is not None:
+            derslik_degisimi = derslik_degisimlerini_say(olusturucu, atamalar)
+    
+    return {
+        "secenekler": secenekler,
+        "kurma_suresi": kurma_suresi,
+        "ipucu_suresi": ipucu_suresi,
+        "degisken_sayisi": len(proto.variables),
+        "kisit_sayisi": len(proto.constraints),
+        "ilk_cozum_suresi": zamanlayici.ilk_cozum_suresi,
+        "cozum_suresi": cozum_suresi,
+        "atama_suresi": atama_suresi,
+        "derslik_degisimi": derslik_degisimi,
+        "durum": solver.StatusName(durum),
+        "amac_degeri": solver.ObjectiveValue() if zamanlayici.cozum_sayisi else None
+    }
+
+def derslik_degisimlerini_say(olusturucu, atamalar):
+    """
+    Sınıfların ardışık saatlerde derslik değiştirme sayısını hesaplar
+    
+    Args:
+        olusturucu (ProgramOlusturucu): Verileri yüklenmiş program oluşturucu
+        atamalar (list): (iliski_id, gun, saat, derslik_id) demetleri
+        
+    Returns:
+        int: Derslik değişimi sayısı
+    """
+    sinif_derslikleri = {}
+    for iliski_id, gun, saat, derslik_id in atamalar:
+        sinif_id = olusturucu.iliski_sozlugu[iliski_id]["sinif_id"]
+        sinif_derslikleri[(sinif_id, gun, saat)] = derslik_id
+    
+    return sum(
+        1 for (sinif_id, gun, saat), derslik_id in sinif_derslikleri.items()
+        if sinif_derslikleri.get((sinif_id, gun, saat - 1), derslik_id) != derslik_id
+    )
+
+def bos_saat_modellerini_karsilastir(db, sure_siniri):
+    """
+    Klasik ve kompakt öğretmen boş saat modellerini karşılaştırır
+    
+    Args:
+        db (Database): Veritabanı bağlantısı
+        sure_siniri (float): Çözücü süre sınırı (saniye)
+        
+    Returns:
+        list: Her model için ölçüm sonuçları
+    """
+    return [model_olc(db, sure_siniri, bos_saat_modeli=model) for model in ("klasik", "kompakt")]
+
+def iki_asamali_cozumu_karsilastir(db, sure_siniri):
+    """
+    Tek modelli çözümü iki aşamalı (önce zaman, sonra derslik eşleştirmesi) çözümle karşılaştırır
+    
+    Args:
+        db (Database): Veritabanı bağlantısı
+        sure_siniri (float): Çözücü süre sınırı (saniye)
+        
+    Returns:
+        list: Her mod için ölçüm sonuçları
+    """
+    return [model_olc(db, sure_siniri, iki_asamali=iki_asamali) for iki_asamali in (False, True)]
+
+def tepe_bellek_mb():
+    """
+    Sürecin şimdiye kadarki en yüksek bellek kullanımını (RSS) döndürür
+    
+    Returns:
+        float: Megabayt cinsinden tepe bellek, ölçülemiyorsa None
+    """
+    if resource is None:
+        return None
+    
+    # ru_maxrss Linux'ta kilobayt, macOS'ta bayt cinsindendir
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return tepe / (1024 * 1024) if sys.platform == "darwin" else tepe / 1024
+
+def kisit_aileleri(olusturucu):
+    """
+    Model kurma profilini yöntem bazında toplar
+    
+    Yalnızca başka bir ölçülen yöntemi çağırmayan yöntemler alınır (add_constraints ve
+    add_objective gibi kapsayıcı yöntemler alınmaz); böylece aileler birbirinin süresini içermez.
+    
+    Args:
+        olusturucu (ProgramOlusturucu): Modeli kurulmuş program oluşturucu
+        
+    Returns:
+        dict: {yöntem: {"sure", "degisken", "kisit", "bellek_mb"}}
+    """
+    profil = olusturucu.kurma_profili
+    aileler = {}
+    for i, kayit in enumerate(profil):
+        if i + 1 < len(profil) and profil[i + 1]["derinlik"] > kayit["derinlik"]:
+            continue
+        olcum = aileler.setdefault(kayit["yontem"], {"sure": 0.0, "degisken": 0, "kisit": 0, "bellek_mb": 0.0})
+        olcum["sure"] += kayit["sure"]
+        olcum["degisken"] += kayit["degisken"]
+        olcum["kisit"] += kayit["kisit"]
+        olcum["bellek_mb"] = None if olcum["bellek_mb"] is None or kayit["bellek_mb"] is None else olcum["bellek_mb"] + kayit["bellek_mb"]
+    return aileler
+
+def olcekleme_olc(parametreler, sure_siniri):
+    """
+    Sentetik bir okul üretir, modeli kurup çözer ve ölçümleri döndürür
+    
+    Tepe belleğin yalnızca bu ölçümü yansıtması için ayrı bir süreçte çalıştırılmalıdır.
+    
+    Args:
+        parametreler (dict): SentetikOkulUretici parametreleri
+        sure_siniri (float): Çözücü süre sınırı (saniye)
+        
+    Returns:
+        dict: Ölçüm sonuçları
+    """
+    uretici = SentetikOkulUretici(**parametreler)
+    
+    baslangic = time.time()
+    db = uretici.olustur()
+    uretim_suresi = time.time() - baslangic
+    
+    try:
+        olusturucu = ProgramOlusturucu(db, None)
+        
+        baslangic = time.time()
+        olusturucu.load_data()
+        yukleme_suresi = time.time() - baslangic
+        
+        baslangic = time.time()
+        olusturucu.create_model()
+        kurma_suresi = time.time() - baslangic
+        
+        baslangic = time.time()
+        if olusturucu.ipucu_tamamlanacak:
+            olusturucu.ipucunu_tamamla()
+        ipucu_suresi = time.time() - baslangic
+        
+        proto = olusturucu.model.Proto()
+        
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = sure_siniri
+        zamanlayici = IlkCozumZamanlayici()
+        durum = solver.Solve(olusturucu.model, zamanlayici)
+        cozum_suresi = time.time() - zamanlayici.baslangic
+        
+        return {
+            "parametreler": uretici.parametreler(),
+            "iliski_sayisi": len(olusturucu.ders_sinif_iliskileri),
+            "uretim_suresi": uretim_suresi,
+            "yukleme_suresi": yukleme_suresi,
+            "kurma_suresi": kurma_suresi,
+            "ipucu_suresi": ipucu_suresi,
+            "aileler": kisit_aileleri(olusturucu),
+            "degisken_sayisi": len(proto.variables),
+            "kisit_sayisi": len(proto.constraints),
+            "ilk_cozum_suresi": zamanlayici.ilk_cozum_suresi,
+            "cozum_suresi": cozum_suresi,
+            "durum": solver.StatusName(durum),
+            "amac_degeri": solver.ObjectiveValue() if zamanlayici.cozum_sayisi else None,
+            "tepe_bellek_mb": tepe_bellek_mb()
+        }
+    finally:
+        db.close()
+        shutil.rmtree(os.path.dirname(db.db_path), ignore_errors=True)
+
+def olceklemeyi_karsilastir(boyutlar, sure_siniri, **parametreler):
+    """
+    Farklı sınıf sayılarındaki sentetik okullar için ölçekleme ölçümü yapar
+    
+    Her boyut, tepe belleğin önceki ölçümlerden etkilenmemesi için yeni bir süreçte ölçülür.
+    
+    Args:
+        boyutlar (list): Sınıf sayıları
+        sure_siniri (float): Çözücü süre sınırı (saniye)
+        **parametreler: Diğer SentetikOkulUretici parametreleri
+        
+    Returns:
+        list: Her boyut için ölçüm sonuçları
+    """
+    sonuclar = []
+    for sinif_sayisi in boyutlar:
+        with ProcessPoolExecutor(max_workers=1) as havuz:
+            sonuclar.append(havuz.submit(olcekleme_olc, dict(parametreler, sinif_sayisi=sinif_sayisi), sure_siniri).result())
+    return sonuclar
+
+def _duzlestir(sozluk, onek=""):
+    """
+    İç içe sözlüğü CSV sütunları için tek düzeye indirir
+    """
+    satir = {}
+    for anahtar, deger in sozluk.items():
+        if isinstance(deger, dict):
+            satir.update(_duzlestir(deger, f"{onek}{anahtar}_"))
+        else:
+            satir[f"{onek}{anahtar}"] = deger
+    return satir
+
+def sonuclari_kaydet(sonuclar, yol):
+    """
+    Ölçüm sonuçlarını uzantıya göre JSON veya CSV dosyasına yazar
+    
+    Args:
+        sonuclar (list): Ölçüm sonuçları
+        yol (str): Çıktı dosyası (.json veya .csv)
+    """
+    if yol.lower().endswith(".json"):
+        with open(yol, "w", encoding="utf-8") as dosya:
+            json.dump(sonuclar, dosya, ensure_ascii=False, indent=2)
+        return
+    
+    satirlar = [_duzlestir(sonuc) for sonuc in sonuclar]
+    sutunlar = list(dict.fromkeys(anahtar for satir in satirlar for anahtar in satir))
+    with open(yol, "w", encoding="utf-8", newline="") as dosya:
+        yazici = csv.DictWriter(dosya, fieldnames=sutunlar)
+        yazici.writeheader()
+        yazici.writerows(satirlar)
+
+def olcekleme_sonuclarini_yazdir(sonuclar):
+    """
+    Ölçekleme sonuçlarını ve her boyut için kısıt ailelerinin kurma sürelerini yazdırır
+    
+    Args:
+        sonuclar (list): Ölçekleme sonuçları
+    """
+    print(f"{'Sınıf':>6} {'İlişki':>7} {'Yükleme (s)':>12} {'Kurma (s)':>10} {'İpucu (s)':>10} {'Değişken':>10} {'Kısıt':>10} {'İlk çözüm (s)':>14} {'Amaç':>8} {'Bellek (MB)':>12} Durum")
+    for sonuc in sonuclar:
+        ilk_cozum = f"{sonuc['ilk_cozum_suresi']:.2f}" if sonuc["ilk_cozum_suresi"] is not None else "-"
+        amac = f"{sonuc['amac_degeri']:.0f}" if sonuc["amac_degeri"] is not None else "-"
+        bellek = f"{sonuc['tepe_bellek_mb']:.0f}" if sonuc["tepe_bellek_mb"] is not None else "-"
+        print(f"{sonuc['parametreler']['sinif_sayisi']:>6} {sonuc['iliski_sayisi']:>7} {sonuc['yukleme_suresi']:>12.2f} {sonuc['kurma_suresi']:>10.2f} {sonuc['ipucu_suresi']:>10.2f} "
+              f"{sonuc['degisken_sayisi']:>10} {sonuc['kisit_sayisi']:>10} {ilk_cozum:>14} {amac:>8} {bellek:>12} {sonuc['durum']}")
+    
+    for sonuc in sonuclar:
+        print(f"\n{sonuc['parametreler']['sinif_sayisi']} sınıf - kısıt aileleri:")
+        for ad, olcum in sorted(sonuc["aileler"].items(), key=lambda oge: oge[1]["sure"], reverse=True):
+            bellek = f"{olcum['bellek_mb']:>+8.1f} MB" if olcum["bellek_mb"] is not None else ""
+            print(f"  {ad:<45} {olcum['sure']:>8.2f} s {olcum['degisken']:>10} değişken {olcum['kisit']:>10} kısıt {bellek}")
+
+def aralik_modelini_karsilastir(db, sure_siniri):
+    """
+    Hücre (0/1 atama) modelini aralık (NoOverlap) modeliyle karşılaştırır
+    
+    Args:
+        db (Database): Veritabanı bağlantısı
+        sure_siniri (float): Çözücü süre sınırı (saniye)
+        
+    Returns:
+        list: Her model için ölçüm sonuçları
+    """
+    return [model_olc(db, sure_siniri, model=model) for model in ("hucre", "aralik")]
+
+def ev_dersligi_modunu_karsilastir(db, sure_siniri):
+    """
+    Tüm derslerin derslik seçtiği modeli ev dersliği moduyla (yalnızca özel
+    derslik gerektiren dersler derslik seçer) karşılaştırır
+    
+    Args:
+        db (Database): Veritabanı bağlantısı
+        sure_siniri (float): Çözücü süre sınırı (saniye)
+        
+    Returns:
+        list: Her mod için ölçüm sonuçları
+    """
+    return [model_olc(db, sure_siniri, ev_dersligi_modu=ev_dersligi_modu) for ev_dersligi_modu in (False, True)]
+
+def kesmeleri_karsilastir(db, sure_siniri):
+    """
+    Ek kesme ailelerinin etkisini ölçer: kesmesiz model, her aile tek başına ve hepsi birlikte
+    
+    Args:
+        db (Database): Veritabanı bağlantısı
+        sure_siniri (float): Çözücü süre sınırı (saniye)
+        
+    Returns:
+        list: Her kesme seçimi için ölçüm sonuçları
+    """
+    aileler = ("kesme_ogretmen_haftalik", "kesme_sinif_gunluk", "kesme_klik")
+    secimler = [()] + [(aile,) for aile in aileler] + [aileler]
+    return [model_olc(db, sure_siniri, **{aile: aile in secim for aile in aileler}) for secim in secimler]
+
+def bilesen_olc(db, sure_siniri, bilesen_ayristirma):
+    """
+    Ev dersliği modunda modeli tek parça veya bağımsız bileşenlere ayırarak çözer ve ölçer
+    
+    Bileşenler alt süreçlerde ayarları veritabanından okuduğundan ölçüm, ayarları
+    yazılmış geçici bir veritabanı kopyası üzerinde yapılır.
+    
+    Args:
+        db (Database): Veritabanı bağlantısı
+        sure_siniri (float): Çözücü süre sınırı (saniye, bileşen başına)
+        bilesen_ayristirma (bool): Bileşenlere ayrılarak çözülsün mü?
+        
+    Returns:
+        dict: Ölçüm sonuçları
+    """
+    dizin = tempfile.mkdtemp(prefix="bilesen_olcumu_")
+    shutil.copyfile(db.db_path, os.path.join(dizin, "okul.db"))
+    kopya = Database(os.path.join(dizin, "okul.db"))
+    try:
+        kopya.ayar_ekle_veya_guncelle("ev_dersligi_modu", "1")
+        kopya.ayar_ekle_veya_guncelle("bilesen_ayristirma", "1" if bilesen_ayristirma else "0")
+        kopya.ayar_ekle_veya_guncelle("algoritma_sure_siniri", str(max(1, int(sure_siniri))))
+        kopya.ayar_ekle_veya_guncelle("onbellek_kullan", "0")
+        
+        olusturucu = ProgramOlusturucu(kopya, None)
+        olusturucu.load_settings()
+        olusturucu.load_data()
+        olusturucu.compute_domains()
+        bilesenler = olusturucu.bilesenleri_bul()
+        
+        baslangic = time.time()
+        if bilesen_ayristirma:
+            atamalar = olusturucu.solve_components()
+        else:
+            olusturucu.create_model()
+            atamalar = olusturucu.cozum_atamalari() if olusturucu.solve() else None
+        toplam_sure = time.time() - baslangic
+        
+        # Tek bileşen varsa veya ayrıştırma kapalıysa model bu süreçte çözülmüştür
+        raporlar = olusturucu.bilesen_raporu or [{
+            "degisken_sayisi": len(olusturucu.degiskenler),
+            "kurma_suresi": sum(olcum["sure"] for olcum in olusturucu.kurma_profili if olcum["derinlik"] == 0),
+            "durum": olusturucu.solver.StatusName(olusturucu.son_durum) if olusturucu.son_durum is not None else "UNKNOWN",
+            "amac": olusturucu.solver.ObjectiveValue() if olusturucu.cozum else None
+        }]
+        amaclar = [rapor["amac"] for rapor in raporlar]
+        
+        return {
+            "secenekler": {"bilesen_ayristirma": bilesen_ayristirma},
+            "iliski_sayisi": len(olusturucu.ders_sinif_iliskileri),
+            "bilesen_sayisi": len(bilesenler),
+            "en_buyuk_bilesen": len(bilesenler[0]) if bilesenler else 0,
+            "degisken_sayisi": sum(rapor["degisken_sayisi"] for rapor in raporlar),
+            "kurma_suresi": sum(rapor["kurma_suresi"] for rapor in raporlar),
+            "toplam_sure": toplam_sure,
+            "durum": ",".join(sorted({rapor["durum"] for rapor in raporlar})) if atamalar is not None else "UNKNOWN",
+            "amac_degeri": sum(amaclar) if atamalar is not None and None not in amaclar else None
+        }
+    finally:
+        kopya.close()
+        shutil.rmtree(dizin, ignore_errors=True)
+
+def bilesenleri_karsilastir(db, sure_siniri):
+    """
+    Ev dersliği modunda tek parça modeli bağımsız bileşenlere ayırmayla karşılaştırır
+    
+    Bileşenler ancak sınıflar ev dersliklerinde, özel derslik gerektiren dersler
+    de izinli derslik kümelerinde kaldığında ayrışır (ör. öğretmen ve derslik
+    paylaşmayan kampüsler).
+    
+    Args:
+        db (Database): Veritabanı bağlantısı
+        sure_siniri (float): Çözücü süre sınırı (saniye)
+        
+    Returns:
+        list: Her seçenek için ölçüm sonuçları
+    """
+    return [bilesen_olc(db, sure_siniri, bilesen_ayristirma) for bilesen_ayristirma in (False, True)]
+
+def bilesen_sonuclarini_yazdir(sonuclar):
+    """
+    Bileşen ölçümü sonuçlarını tablo olarak yazdırır
+    
+    Args:
+        sonuclar (list): Bileşen ölçümü sonuçları
+    """
+    print(f"{'Seçenekler':<22} {'İlişki':>7} {'Bileşen':>8} {'En büyük':>9} {'Değişken':>10} {'Kurma (s)':>10} {'Toplam (s)':>11} {'Amaç':>8} Durum")
+    for sonuc in sonuclar:
+        secenekler = "bilesen_ayristirma" if sonuc["secenekler"]["bilesen_ayristirma"] else "-"
+        amac = f"{sonuc['amac_degeri']:.0f}" if sonuc["amac_degeri"] is not None else "-"
+        print(f"{secenekler:<22} {sonuc['iliski_sayisi']:>7} {sonuc['bilesen_sayisi']:>8} {sonuc['en_buyuk_bilesen']:>9} {sonuc['degisken_sayisi']:>10} "
+              f"{sonuc['kurma_suresi']:>10.2f} {sonuc['toplam_sure']:>11.2f} {amac:>8} {sonuc['durum']}")
+
+def sonuclari_yazdir(sonuclar):
+    """
+    Ölçüm sonuçlarını tablo olarak yazdırır
+    
+    Args:
+        sonuclar (list): Ölçüm sonuçları
+    """
+    print(f"{'Seçenekler':<40} {'Kurma (s)':>10} {'İpucu (s)':>10} {'Değişken':>10} {'Kısıt':>10} {'İlk çözüm (s)':>14} {'Çözüm (s)':>10} {'Atama (s)':>10} {'Amaç':>8} {'D. değişimi':>12} Durum")
+    for sonuc in sonuclar:
+        # Açık/kapalı seçeneklerde yalnızca açık olanlar yazılır
+        secenekler = ", ".join(
+            k if v is True else f"{k}={v}" for k, v in sonuc["secenekler"].items() if v is not False
+        ) or "-"
+        ilk_cozum = f"{sonuc['ilk_cozum_suresi']:.2f}" if sonuc["ilk_cozum_suresi"] is not None else "-"
+        atama = f"{sonuc['atama_suresi']:.2f}" if sonuc["atama_suresi"] is not None else "-"
+        amac = f"{sonuc['amac_degeri']:.0f}" if sonuc["amac_degeri"] is not None else "-"
+        degisim = sonuc["derslik_degisimi"] if sonuc["derslik_degisimi"] is not None else "-"
+        print(f"{secenekler:<40} {sonuc['kurma_suresi']:>10.2f} {sonuc['ipucu_suresi']:>10.2f} {sonuc['degisken_sayisi']:>10} {sonuc['kisit_sayisi']:>10} {ilk_cozum:>14} {sonuc['cozum_suresi']:>10.2f} {atama:>10} {amac:>8} {degisim:>12} {sonuc['durum']}")
+
+def main():
+    """
+    Komut satırından performans ölçümünü çalıştırır
+    """
+    parser = argparse.ArgumentParser(description="Program oluşturucu performans ölçümü")
+    parser.add_argument("veritabani", nargs="?", help="Ölçümde kullanılacak veritabanı dosyası (olcekleme dışında gerekli; "
+                        "bilesenler için verilmezse sentetik okul üretilir)")
+    parser.add_argument("--sure", type=float, default=60, help="Her çözüm için süre sınırı (saniye)")
+    parser.add_argument("--karsilastirma", choices=["bos_saat", "iki_asamali", "aralik", "ev_dersligi", "kesmeler", "bilesenler", "olcekleme"], default="bos_saat",
+                        help="Karşılaştırılacak model seçenekleri veya sentetik okullarla ölçekleme")
+    parser.add_argument("--boyutlar", default="10,20,40", help="Ölçeklemede kullanılacak sınıf sayıları (virgülle)")
+    parser.add_argument("--lab-orani", type=float, default=0.15, help="Sentetik okulda laboratuvar olan dersliklerin oranı")
+    parser.add_argument("--uygunsuzluk", type=float, default=0.1, help="Sentetik okulda öğretmenlerin uygun olmadığı saatlerin oranı")
+    parser.add_argument("--haftalik-saat", type=int, default=30, help="Sentetik okulda sınıfların haftalık ders saati")
+    parser.add_argument("--sinif", type=int, default=12, help="bilesenler karşılaştırmasında üretilecek sentetik okulun sınıf sayısı")
+    parser.add_argument("--kampus", type=int, default=1, help="Sentetik okulda öğretmen ve derslik paylaşmayan kampüs sayısı")
+    parser.add_argument("--tohum", type=int, default=1, help="Sentetik okul üretiminde rastgele sayı tohumu")
+    parser.add_argument("--cikti", help="Sonuçların yazılacağı .json veya .csv dosyası")
+    args = parser.parse_args()
+    
+    karsilastirmalar = {
+        "bos_saat": bos_saat_modellerini_karsilastir,
+        "iki_asamali": iki_asamali_cozumu_karsilastir,
+        "aralik": aralik_modelini_karsilastir,
+        "ev_dersligi": ev_dersligi_modunu_karsilastir,
+        "kesmeler": kesmeleri_karsilastir
+    }
+    
+    logging.basicConfig(level=logging.WARNING)
+    
+    if args.karsilastirma == "olcekleme":
+        sonuclar = olceklemeyi_karsilastir(
+            [int(boyut) for boyut in args.boyutlar.split(",")], args.sure,
+            lab_orani=args.lab_orani, uygunsuzluk_yogunlugu=args.uygunsuzluk,
+            haftalik_saat=args.haftalik_saat, kampus_sayisi=args.kampus, tohum=args.tohum
+        )
+        olcekleme_sonuclarini_yazdir(sonuclar)
+    elif args.karsilastirma == "bilesenler":
+        if args.veritabani:
+            db = Database(args.veritabani)
+        else:
+            db = SentetikOkulUretici(
+                sinif_sayisi=args.sinif, lab_orani=args.lab_orani, uygunsuzluk_yogunlugu=args.uygunsuzluk,
+                haftalik_saat=args.haftalik_saat, kampus_sayisi=args.kampus, tohum=args.tohum
+            ).olustur()
+        try:
+            sonuclar = bilesenleri_karsilastir(db, args.sure)
+            bilesen_sonuclarini_yazdir(sonuclar)
+        finally:
+            db.close()
+            if not args.veritabani:
+                shutil.rmtree(os.path.dirname(db.db_path), ignore_errors=True)
+    else:
+        if not args.veritabani:
+            parser.error("Bu karşılaştırma için veritabanı dosyası gereklidir")
+        
+        db = Database(args.veritabani)
+        try:
+            sonuclar = karsilastirmalar[args.karsilastirma](db, args.sure)
+            sonuclari_yazdir(sonuclar)
+        finally:
+            db.close()
+    
+    if args.cikti:
+        sonuclari_kaydet(sonuclar, args.cikti)
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -75,9 +75,11 @@ class Database:
                     ad TEXT NOT NULL,
                     sube TEXT NOT NULL,
                     haftalik_toplam_saat INTEGER NOT NULL,
+                    ev_derslik_id INTEGER,
                     olusturma_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     guncelleme_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(ad, sube)
+                    UNIQUE(ad, sube),
+                    FOREIGN KEY (ev_derslik_id) REFERENCES derslikler(id) ON DELETE SET NULL
                 )
             ''')
             
@@ -100,6 +102,7 @@ class Database:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     ad TEXT NOT NULL,
                     haftalik_saat INTEGER NOT NULL,
+                    derslik_turu TEXT NOT NULL DEFAULT 'normal',  -- normal: herhangi bir derslik, ozel: özel derslik
                     olusturma_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     guncelleme_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     UNIQUE(ad)
@@ -118,6 +121,19 @@ class Database:
                 )
             ''')
             
+            # Ders-Derslik tablosu (dersin yapılabileceği derslikler; kayıt yoksa türüne uyan tüm derslikler)
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS ders_derslik (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ders_id INTEGER NOT NULL,
+                    derslik_id INTEGER NOT NULL,
+                    olusturma_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (ders_id) REFERENCES dersler(id) ON DELETE CASCADE,
+                    FOREIGN KEY (derslik_id) REFERENCES derslikler(id) ON DELETE CASCADE,
+                    UNIQUE(ders_id, derslik_id)
+                )
+            ''')
+            
             # Ders-Sınıf ilişki tablosu
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS ders_sinif (
@@ -184,7 +200,7 @@ class Database:
             # Varsayılan ayarları ekle
             self.cursor.execute('''
                 INSERT OR IGNORE INTO ayarlar (anahtar, deger, aciklama)
-                VALUES 
+                VALUES
                 ('ders_suresi', '40', 'Ders süresi (dakika)'),
                 ('gunluk_ders_baslangic', '8:30', 'Günlük ders başlangıç saati'),
                 ('gunluk_ders_bitis', '16:00', 'Günlük ders bitiş saati'),
@@ -195,12 +211,38 @@ class Database:
                 ('max_haftalik_ders', '40', 'Haftalık maksimum ders saati')
             ''')
             
+            # Eski veritabanlarına sonradan eklenen sütunlar
+            self.sutun_ekle("siniflar", "ev_derslik_id", "INTEGER REFERENCES derslikler(id) ON DELETE SET NULL")
+            if self.sutun_ekle("dersler", "derslik_turu", "TEXT NOT NULL DEFAULT 'normal'"):
+                # Eski sürümlerde adında "lab" geçen dersler özel derslik gerektirir sayılıyordu
+                self.cursor.execute("UPDATE dersler SET derslik_turu='ozel' WHERE lower(ad) LIKE '%lab%'")
+            
             self.commit()
             self.logger.info("Veritabanı tabloları başarıyla oluşturuldu")
         except sqlite3.Error as e:
             self.logger.error(f"Tablo oluşturma hatası: {str(e)}")
             raise
     
+    def sutun_ekle(self, tablo, sutun, tanim):
+        """
+        Tabloda sütun yoksa ekler (eski veritabanlarının taşınması için)
+        
+        Args:
+            tablo (str): Tablo adı
+            sutun (str): Sütun adı
+            tanim (str): Sütunun SQL tanımı
+            
+        Returns:
+            bool: Sütun eklendiyse True, zaten varsa False
+        """
+        self.cursor.execute(f"PRAGMA table_info({tablo})")
+        if any(satir["name"] == sutun for satir in self.cursor.fetchall()):
+            return False
+        
+        self.cursor.execute(f"ALTER TABLE {tablo} ADD COLUMN {sutun} {tanim}")
+        self.logger.info(f"{tablo} tablosuna {sutun} sütunu eklendi")
+        return True
+    
     def execute(self, query, params=None):
         """
         SQL sorgusu çalıştırır
@@ -251,7 +293,7 @@ class Database:
         return self.cursor.lastrowid
     
     # Sınıf işlemleri
-    def sinif_ekle(self, ad, sube, haftalik_toplam_saat):
+    def sinif_ekle(self, ad, sube, haftalik_toplam_saat, ev_derslik_id=None):
         """
         Yeni sınıf ekler
         
@@ -259,14 +301,15 @@ class Database:
             ad (str): Sınıf adı
             sube (str): Şube
             haftalik_toplam_saat (int): Haftalık toplam ders saati
+            ev_derslik_id (int, optional): Sınıfın kendi dersliğinin ID'si
             
         Returns:
             int: Eklenen sınıfın ID'si
         """
         try:
             self.execute(
-                "INSERT INTO siniflar (ad, sube, haftalik_toplam_saat) VALUES (?, ?, ?)",
-                (ad, sube, haftalik_toplam_saat)
+                "INSERT INTO siniflar (ad, sube, haftalik_toplam_saat, ev_derslik_id) VALUES (?, ?, ?, ?)",
+                (ad, sube, haftalik_toplam_saat, ev_derslik_id)
             )
             self.commit()
             return self.lastrowid()
@@ -274,7 +317,7 @@ class Database:
             self.logger.warning(f"Bu sınıf zaten mevcut: {ad} {sube}")
             raise ValueError(f"Bu sınıf zaten mevcut: {ad} {sube}")
     
-    def sinif_guncelle(self, id, ad, sube, haftalik_toplam_saat):
+    def sinif_guncelle(self, id, ad, sube, haftalik_toplam_saat, ev_derslik_id=None):
         """
         Sınıf bilgilerini günceller
         
@@ -283,14 +326,15 @@ class Database:
             ad (str): Sınıf adı
             sube (str): Şube
             haftalik_toplam_saat (int): Haftalık toplam ders saati
+            ev_derslik_id (int, optional): Sınıfın kendi dersliğinin ID'si
             
         Returns:
             bool: Başarılı ise True
         """
         try:
             self.execute(
-                "UPDATE siniflar SET ad=?, sube=?, haftalik_toplam_saat=?, guncelleme_tarihi=CURRENT_TIMESTAMP WHERE id=?",
-                (ad, sube, haftalik_toplam_saat, id)
+                "UPDATE siniflar SET ad=?, sube=?, haftalik_toplam_saat=?, ev_derslik_id=?, guncelleme_tarihi=CURRENT_TIMESTAMP WHERE id=?",
+                (ad, sube, haftalik_toplam_saat, ev_derslik_id, id)
             )
             self.commit()
             return True
@@ -421,21 +465,39 @@ class Database:
         return self.fetchall()
     
     # Ders işlemleri
-    def ders_ekle(self, ad, haftalik_saat):
+    @staticmethod
+    def varsayilan_derslik_turu(ad):
+        """
+        Derslik türü verilmeyen ders için adından varsayılan türü çıkarır
+        
+        Args:
+            ad (str): Ders adı
+            
+        Returns:
+            str: Adında "lab" (laboratuvar) geçiyorsa "ozel", değilse "normal"
+        """
+        return "ozel" if "lab" in ad.lower() else "normal"
+    
+    def ders_ekle(self, ad, haftalik_saat, derslik_turu=None):
         """
         Yeni ders ekler
         
         Args:
             ad (str): Ders adı
             haftalik_saat (int): Haftalık ders saati
-            
+            derslik_turu (str, optional): Gereken derslik türü ("normal" veya "ozel");
+                verilmezse ders adından çıkarılır
+                
         Returns:
             int: Eklenen dersin ID'si
         """
+        if derslik_turu is None:
+            derslik_turu = self.varsayilan_derslik_turu(ad)
+        
         try:
             self.execute(
-                "INSERT INTO dersler (ad, haftalik_saat) VALUES (?, ?)",
-                (ad, haftalik_saat)
+                "INSERT INTO dersler (ad, haftalik_saat, derslik_turu) VALUES (?, ?, ?)",
+                (ad, haftalik_saat, derslik_turu)
             )
             self.commit()
             return self.lastrowid()
@@ -443,7 +505,7 @@ class Database:
             self.logger.warning(f"Bu ders zaten mevcut: {ad}")
             raise ValueError(f"Bu ders zaten mevcut: {ad}")
     
-    def ders_guncelle(self, id, ad, haftalik_saat):
+    def ders_guncelle(self, id, ad, haftalik_saat, derslik_turu=None):
         """
         Ders bilgilerini günceller
         
@@ -451,14 +513,15 @@ class Database:
             id (int): Ders ID'si
             ad (str): Ders adı
             haftalik_saat (int): Haftalık ders saati
+            derslik_turu (str, optional): Gereken derslik türü; verilmezse değiştirilmez
             
         Returns:
             bool: Başarılı ise True
         """
         try:
             self.execute(
-                "UPDATE dersler SET ad=?, haftalik_saat=?, guncelleme_tarihi=CURRENT_TIMESTAMP WHERE id=?",
-                (ad, haftalik_saat, id)
+                "UPDATE dersler SET ad=?, haftalik_saat=?, derslik_turu=COALESCE(?, derslik_turu), guncelleme_tarihi=CURRENT_TIMESTAMP WHERE id=?",
+                (ad, haftalik_saat, derslik_turu, id)
             )
             self.commit()
             return True
@@ -503,6 +566,46 @@ class Database:
         self.execute("SELECT * FROM dersler ORDER BY ad")
         return self.fetchall()
     
+    def ders_dersliklerini_getir(self, ders_id):
+        """
+        Dersin yapılabileceği derslikleri getirir
+        
+        Args:
+            ders_id (int): Ders ID'si
+            
+        Returns:
+            list: Derslik ID'leri (boşsa türüne uyan tüm derslikler kullanılabilir)
+        """
+        self.execute("SELECT derslik_id FROM ders_derslik WHERE ders_id=? ORDER BY derslik_id", (ders_id,))
+        return [satir["derslik_id"] for satir in self.fetchall()]
+    
+    def ders_dersliklerini_ayarla(self, ders_id, derslik_idleri):
+        """
+        Dersin yapılabileceği derslikleri verilen kümeyle değiştirir
+        
+        Args:
+            ders_id (int): Ders ID'si
+            derslik_idleri (list): Derslik ID'leri (boş liste kısıtlamayı kaldırır)
+            
+        Returns:
+            bool: Başarılı ise True
+        """
+        self.execute("DELETE FROM ders_derslik WHERE ders_id=?", (ders_id,))
+        for derslik_id in derslik_idleri:
+            self.execute("INSERT INTO ders_derslik (ders_id, derslik_id) VALUES (?, ?)", (ders_id, derslik_id))
+        self.commit()
+        return True
+    
+    def tum_ders_dersliklerini_getir(self):
+        """
+        Tüm ders-derslik kayıtlarını getirir
+        
+        Returns:
+            list: ders_id ve derslik_id alanlı kayıtlar
+        """
+        self.execute("SELECT ders_id, derslik_id FROM ders_derslik ORDER BY ders_id, derslik_id")
+        return self.fetchall()
+    
     # Derslik işlemleri
     def derslik_ekle(self, ad, tur="normal"):
         """
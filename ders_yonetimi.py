@@ -86,7 +86,7 @@ class DersYonetimi:
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Treeview
-        self.tree = ttk.Treeview(self.list_frame_inner, columns=("ad", "haftalik_saat"), 
+        self.tree = ttk.Treeview(self.list_frame_inner, columns=("ad", "haftalik_saat"),
                                 show="headings", selectmode="browse", yscrollcommand=self.scrollbar.set)
         self.tree.pack(fill=tk.BOTH, expand=True)
         
@@ -136,9 +136,32 @@ class DersYonetimi:
         self.haftalik_saat_spinbox = ttk.Spinbox(self.form_frame, from_=1, to=20, textvariable=self.haftalik_saat_var)
         self.haftalik_saat_spinbox.grid(row=1, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
         
+        # Gereken Derslik Türü
+        ttk.Label(self.form_frame, text="Derslik Türü:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.derslik_turu_var = tk.StringVar(value="normal")
+        
+        self.derslik_turu_frame = ttk.Frame(self.form_frame)
+        self.derslik_turu_frame.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        self.normal_radio = ttk.Radiobutton(self.derslik_turu_frame, text="Normal", variable=self.derslik_turu_var, value="normal", command=self.on_derslik_turu_select)
+        self.normal_radio.pack(side=tk.LEFT, padx=5)
+        
+        self.ozel_radio = ttk.Radiobutton(self.derslik_turu_frame, text="Özel", variable=self.derslik_turu_var, value="ozel", command=self.on_derslik_turu_select)
+        self.ozel_radio.pack(side=tk.LEFT, padx=5)
+        
+        # Yeni derste tür, elle seçilene kadar adından tahmin edilir
+        self.derslik_turu_elle_secildi = False
+        self.ad_var.trace("w", lambda name, index, mode: self.on_ad_change())
+        
+        # İzinli Derslikler (hiçbiri seçilmezse türüne uyan tüm derslikler kullanılabilir)
+        ttk.Label(self.form_frame, text="İzinli Derslikler:").grid(row=3, column=0, sticky=tk.NW, padx=5, pady=5)
+        self.derslik_listbox = tk.Listbox(self.form_frame, selectmode=tk.MULTIPLE, height=5, exportselection=False)
+        self.derslik_listbox.grid(row=3, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        self.derslik_listbox.derslik_ids = []
+        
         # Butonlar
         self.form_button_frame = ttk.Frame(self.form_frame)
-        self.form_button_frame.grid(row=2, column=0, columnspan=2, pady=10)
+        self.form_button_frame.grid(row=4, column=0, columnspan=2, pady=10)
         
         self.save_button = ttk.Button(self.form_button_frame, text="Kaydet", command=self.save_ders)
         self.save_button.pack(side=tk.LEFT, padx=5)
@@ -147,11 +170,11 @@ class DersYonetimi:
         self.cancel_button.pack(side=tk.LEFT, padx=5)
         
         # Ders-Sınıf-Öğretmen İlişkileri
-        ttk.Label(self.form_frame, text="Ders-Sınıf-Öğretmen İlişkileri:", font=("TkDefaultFont", 10, "bold")).grid(row=3, column=0, columnspan=2, sticky=tk.W, padx=5, pady=10)
+        ttk.Label(self.form_frame, text="Ders-Sınıf-Öğretmen İlişkileri:", font=("TkDefaultFont", 10, "bold")).grid(row=5, column=0, columnspan=2, sticky=tk.W, padx=5, pady=10)
         
         # İlişki listesi çerçevesi
         self.iliski_frame = ttk.Frame(self.form_frame)
-        self.iliski_frame.grid(row=4, column=0, columnspan=2, sticky=tk.W+tk.E+tk.N+tk.S, padx=5, pady=5)
+        self.iliski_frame.grid(row=6, column=0, columnspan=2, sticky=tk.W+tk.E+tk.N+tk.S, padx=5, pady=5)
         
         # İlişki listesi
         self.iliski_tree_frame = ttk.Frame(self.iliski_frame)
@@ -162,7 +185,7 @@ class DersYonetimi:
         self.iliski_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Treeview
-        self.iliski_tree = ttk.Treeview(self.iliski_tree_frame, columns=("sinif", "ogretmen", "saat"), 
+        self.iliski_tree = ttk.Treeview(self.iliski_tree_frame, columns=("sinif", "ogretmen", "saat"),
                                     show="headings", selectmode="browse", yscrollcommand=self.iliski_scrollbar.set)
         self.iliski_tree.pack(fill=tk.BOTH, expand=True)
         
@@ -193,7 +216,25 @@ class DersYonetimi:
         
         # Form alanlarını genişlet
         self.form_frame.columnconfigure(1, weight=1)
-        self.form_frame.rowconfigure(4, weight=1)
+        self.form_frame.rowconfigure(6, weight=1)
+    
+    def refresh_derslik_list(self):
+        """
+        İzinli derslik listesini yeniler
+        """
+        self.derslik_listbox.delete(0, tk.END)
+        
+        try:
+            derslikler = self.db.tum_derslikleri_getir()
+            for derslik in derslikler:
+                tur_text = "Özel" if derslik["tur"] == "ozel" else "Normal"
+                self.derslik_listbox.insert(tk.END, f"{derslik['ad']} ({tur_text})")
+            
+            # Liste sırasıyla derslik ID'lerini sakla
+            self.derslik_listbox.derslik_ids = [derslik["id"] for derslik in derslikler]
+        except Exception as e:
+            self.logger.error(f"Derslik listesi yükleme hatası: {str(e)}")
+            messagebox.showerror("Hata", f"Derslik listesi yüklenirken bir hata oluştu:\n{str(e)}")
     
     def refresh_list(self):
         """
@@ -203,13 +244,16 @@ class DersYonetimi:
         for item in self.tree.get_children():
             self.tree.delete(item)
         
+        # Derslikler başka sekmede değişmiş olabilir
+        self.refresh_derslik_list()
+        
         try:
             # Dersleri getir
             dersler = self.db.tum_dersleri_getir()
             
             # Listeye ekle
             for ders in dersler:
-                self.tree.insert("", tk.END, values=(ders["ad"], ders["haftalik_saat"]), 
+                self.tree.insert("", tk.END, values=(ders["ad"], ders["haftalik_saat"]),
                                 tags=(ders["id"],))
             
             self.logger.info(f"{len(dersler)} ders listelendi")
@@ -234,12 +278,25 @@ class DersYonetimi:
             # Filtrele ve listeye ekle
             for ders in dersler:
                 if search_term in ders["ad"].lower():
-                    self.tree.insert("", tk.END, values=(ders["ad"], ders["haftalik_saat"]), 
+                    self.tree.insert("", tk.END, values=(ders["ad"], ders["haftalik_saat"]),
                                     tags=(ders["id"],))
         except Exception as e:
             self.logger.error(f"Ders listesi filtreleme hatası: {str(e)}")
             messagebox.showerror("Hata", f"Ders listesi filtrelenirken bir hata oluştu:\n{str(e)}")
     
+    def on_ad_change(self):
+        """
+        Ders adı değiştiğinde çağrılır; yeni dersin derslik türünü adından tahmin eder
+        """
+        if self.selected_id is None and not self.derslik_turu_elle_secildi:
+            self.derslik_turu_var.set(self.db.varsayilan_derslik_turu(self.ad_var.get()))
+    
+    def on_derslik_turu_select(self):
+        """
+        Derslik türü elle seçildiğinde çağrılır
+        """
+        self.derslik_turu_elle_secildi = True
+    
     def on_select(self, event):
         """
         Ders seçildiğinde çağrılır
@@ -265,6 +322,14 @@ class DersYonetimi:
             # Form alanlarını doldur
             self.ad_var.set(ders["ad"])
             self.haftalik_saat_var.set(ders["haftalik_saat"])
+            self.derslik_turu_var.set(ders["derslik_turu"])
+            
+            # İzinli derslikleri işaretle
+            izinli = set(self.db.ders_dersliklerini_getir(self.selected_id))
+            self.derslik_listbox.selection_clear(0, tk.END)
+            for i, derslik_id in enumerate(self.derslik_listbox.derslik_ids):
+                if derslik_id in izinli:
+                    self.derslik_listbox.selection_set(i)
             
             # Ders-sınıf-öğretmen ilişkilerini getir
             self.refresh_iliski_list()
@@ -301,7 +366,7 @@ class DersYonetimi:
             # Listeye ekle
             for iliski in iliskiler:
                 sinif_adi = f"{iliski['sinif_adi']} {iliski['sinif_sube']}"
-                self.iliski_tree.insert("", tk.END, values=(sinif_adi, iliski["ogretmen_adi"], iliski["haftalik_saat"]), 
+                self.iliski_tree.insert("", tk.END, values=(sinif_adi, iliski["ogretmen_adi"], iliski["haftalik_saat"]),
                                     tags=(iliski["id"],))
             
             self.logger.info(f"{len(iliskiler)} ilişki listelendi")
@@ -316,6 +381,9 @@ class DersYonetimi:
         self.selected_id = None
         self.ad_var.set("")
         self.haftalik_saat_var.set(4)  # Varsayılan değer
+        self.derslik_turu_var.set("normal")
+        self.derslik_turu_elle_secildi = False
+        self.derslik_listbox.selection_clear(0, tk.END)
         
         # İlişki listesini temizle
         for item in self.iliski_tree.get_children():
@@ -330,6 +398,8 @@ class DersYonetimi:
         """
         # Form verilerini al
         ad = self.ad_var.get().strip()
+        derslik_turu = self.derslik_turu_var.get()
+        derslik_idleri = [self.derslik_listbox.derslik_ids[i] for i in self.derslik_listbox.curselection()]
         
         try:
             haftalik_saat = int(self.haftalik_saat_var.get())
@@ -349,15 +419,18 @@ class DersYonetimi:
         try:
             if self.selected_id:
                 # Mevcut dersi güncelle
-                self.db.ders_guncelle(self.selected_id, ad, haftalik_saat)
+                self.db.ders_guncelle(self.selected_id, ad, haftalik_saat, derslik_turu)
                 messagebox.showinfo("Bilgi", f"{ad} dersi başarıyla güncellendi.")
                 self.logger.info(f"Ders güncellendi: {ad}")
             else:
                 # Yeni ders ekle
-                self.selected_id = self.db.ders_ekle(ad, haftalik_saat)
+                self.selected_id = self.db.ders_ekle(ad, haftalik_saat, derslik_turu)
                 messagebox.showinfo("Bilgi", f"{ad} dersi başarıyla eklendi.")
                 self.logger.info(f"Ders eklendi: {ad}")
             
+            # Dersin yapılabileceği derslikler
+            self.db.ders_dersliklerini_ayarla(self.selected_id, derslik_idleri)
+            
             # Listeyi yenile
             self.refresh_list()
             
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kapasite analizi modülü
+Model kurulmadan önce sayma sınırlarını NumPy ile kontrol eder ve çözümü
+kesinlikle imkansız kılan girdileri sorumlu öğretmen, sınıf, ders veya
+derslik türüyle birlikte listeler
+"""
+
+import logging
+import numpy as np
+
+class KapasiteAnalizcisi:
+    """
+    Öğretmen, sınıf, ilişki ve derslik türü bazında yük ve kapasiteyi karşılaştıran sınıf
+    
+    Analiz, verileri yüklenmiş ve compute_domains çağrılmış bir ProgramOlusturucu
+    üzerinde çalışır. Bulunan her ihlal bir sözlük olarak döndürülür: tur, varlik,
+    gereken, kapasite ve mesaj.
+    """
+    
+    def __init__(self, olusturucu):
+        """
+        Analizciyi başlatır
+        
+        Args:
+            olusturucu (ProgramOlusturucu): Verileri ve alanları hazır program oluşturucu
+        """
+        self.olusturucu = olusturucu
+        self.logger = logging.getLogger(__name__)
+        
+        o = olusturucu
+        self.gun_sayisi = o.gun_sayisi
+        self.saat_sayisi = o.saat_sayisi
+        self.haftalik_saatler = np.array([iliski["haftalik_saat"] for iliski in o.ders_sinif_iliskileri], dtype=np.int64)
+    
+    def analiz_et(self):
+        """
+        Tüm kapasite kontrollerini çalıştırır
+        
+        Returns:
+            list: İhlal sözlükleri (ihlal yoksa boş liste)
+        """
+        ihlaller = []
+        ihlaller.extend(self.ogretmen_yuku())
+        ihlaller.extend(self.sinif_yuku())
+        ihlaller.extend(self.iliski_yuku())
+        ihlaller.extend(self.derslik_arzi())
+        return ihlaller
+    
+    def _ihlal(self, tur, varlik, gereken, kapasite, mesaj):
+        """
+        İhlal sözlüğü oluşturur
+        """
+        return {"tur": tur, "varlik": varlik, "gereken": int(gereken), "kapasite": int(kapasite), "mesaj": mesaj}
+    
+    def _varlik_yukleri(self, varliklar, iliski_listeleri):
+        """
+        Her varlık (öğretmen, sınıf) için haftalık toplam ders yükünü döndürür
+        """
+        yukler = np.zeros(len(varliklar), dtype=np.int64)
+        for i, varlik in enumerate(varliklar):
+            iliskiler = iliski_listeleri.get(varlik["id"], [])
+            if iliskiler:
+                yukler[i] = self.haftalik_saatler[iliskiler].sum()
+        return yukler
+    
+    def ogretmen_yuku(self):
+        """
+        Öğretmen yükünü uygun saatlere ve günlük alt/üst sınırlara göre kontrol eder
+        
+        Öğretmenin bir gündeki kapasitesi o gün uygun olduğu saat sayısı ile günlük
+        üst sınırın küçüğüdür. Günlük alt sınır yalnızca ders verilen günlerde
+        geçerli olduğundan, yük k gün için [k × alt sınır, en büyük k günlük kapasite]
+        aralıklarından birine düşmelidir.
+        """
+        o = self.olusturucu
+        ogretmenler = o.ogretmenler
+        if not ogretmenler:
+            return []
+        
+        yukler = self._varlik_yukleri(ogretmenler, o.ogretmen_iliskileri)
+        
+        # Öğretmen başına (gün, saat) uygunluğu
+        ogretmen_sirasi = {ogretmen["id"]: t for t, ogretmen in enumerate(ogretmenler)}
+        uygun = np.ones((len(ogretmenler), self.gun_sayisi, self.saat_sayisi), dtype=bool)
+        for zaman in o.uygun_olmayan_zamanlar:
+            t = ogretmen_sirasi.get(zaman["ogretmen_id"])
+            if t is not None and 0 <= zaman["gun"] < self.gun_sayisi:
+                uygun[t, zaman["gun"], zaman["saat_baslangic"]:zaman["saat_bitis"]] = False
+        
+        gunluk_kapasite = np.minimum(uygun.sum(axis=2), o.ogretmen_gunluk_max)
+        ust_sinir = gunluk_kapasite.sum(axis=1)
+        
+        # k gün ders verilirse yük en az k × alt sınır, en fazla en büyük k günün kapasitesi kadar olabilir
+        sirali = -np.sort(-gunluk_kapasite, axis=1)
+        k = np.arange(1, self.gun_sayisi + 1)
+        gecerli = (
+            (k * o.ogretmen_gunluk_min <= yukler[:, np.newaxis])
+            & (np.cumsum(sirali, axis=1) >= yukler[:, np.newaxis])
+            & (sirali >= o.ogretmen_gunluk_min)
+        )
+        dagitilabilir = gecerli.any(axis=1) | (yukler == 0)
+        
+        ihlaller = []
+        for t in np.flatnonzero(yukler > ust_sinir):
+            ihlaller.append(self._ihlal(
+                "ogretmen", ogretmenler[t]["ad_soyad"], yukler[t], ust_sinir[t],
+                f"Öğretmen {ogretmenler[t]['ad_soyad']}: haftalık {yukler[t]} saat ders atanmış, uygun saatler ve "
+                f"günlük en fazla {o.ogretmen_gunluk_max} saat sınırıyla en fazla {ust_sinir[t]} saat verilebilir"
+            ))
+        for t in np.flatnonzero(~dagitilabilir & (yukler <= ust_sinir)):
+            ihlaller.append(self._ihlal(
+                "ogretmen", ogretmenler[t]["ad_soyad"], o.ogretmen_gunluk_min, yukler[t],
+                f"Öğretmen {ogretmenler[t]['ad_soyad']}: {yukler[t]} saatlik yük, ders verilen her gün en az "
+                f"{o.ogretmen_gunluk_min} saat olacak şekilde uygun günlere dağıtılamıyor"
+            ))
+        return ihlaller
+    
+    def sinif_yuku(self):
+        """
+        Sınıf yükünü günlük alt ve üst sınırlara göre kontrol eder
+        
+        Sınıfın günlük alt sınırı her gün geçerlidir.
+        """
+        o = self.olusturucu
+        siniflar = [sinif for sinif in o.siniflar if o.sinif_iliskileri.get(sinif["id"])]
+        if not siniflar:
+            return []
+        
+        yukler = self._varlik_yukleri(siniflar, o.sinif_iliskileri)
+        ust_sinir = self.gun_sayisi * min(o.sinif_gunluk_max, self.saat_sayisi)
+        alt_sinir = self.gun_sayisi * o.sinif_gunluk_min
+        
+        ihlaller = []
+        for s in np.flatnonzero(yukler > ust_sinir):
+            ad = f"{siniflar[s]['ad']}-{siniflar[s]['sube']}"
+            ihlaller.append(self._ihlal(
+                "sinif", ad, yukler[s], ust_sinir,
+                f"Sınıf {ad}: haftalık {yukler[s]} saat ders var, {self.gun_sayisi} gün × günlük en fazla "
+                f"{min(o.sinif_gunluk_max, self.saat_sayisi)} saat = {ust_sinir} saat sığabilir"
+            ))
+        for s in np.flatnonzero(yukler < alt_sinir):
+            ad = f"{siniflar[s]['ad']}-{siniflar[s]['sube']}"
+            ihlaller.append(self._ihlal(
+                "sinif", ad, alt_sinir, yukler[s],
+                f"Sınıf {ad}: haftalık {yukler[s]} saat ders var, her gün en az {o.sinif_gunluk_min} saat için "
+                f"{alt_sinir} saat gerekir"
+            ))
+        return ihlaller
+    
+    def iliski_yuku(self):
+        """
+        Her ilişkinin ve sınıf-ders çiftinin haftalık saatini sığabileceği saatlerle karşılaştırır
+        
+        Bir ilişki bir günde en fazla o gün uygun olduğu saat sayısı ile aynı ders
+        tekrar sınırının küçüğü kadar ders alabilir. Blok ders modunda haftalık saati
+        birden fazla olan ilişki günde tek blok aldığından, günlük sınır ayrıca en
+        uzun blok ile o günün en uzun kesintisiz uygun saat dizisiyle sınırlanır.
+        """
+        o = self.olusturucu
+        iliskiler = o.ders_sinif_iliskileri
+        
+        gunluk_sinir = np.full(len(iliskiler), o.ayni_ders_tekrar)
+        gunluk_uygun = o.uygun_zamanlar.sum(axis=2)
+        if o.blok_ders_arka_arkaya:
+            blok = self.haftalik_saatler > 1
+            gunluk_sinir[blok] = min(o.ayni_ders_tekrar, max(1, o.max_blok_ders))
+            
+            # Her ilişki ve gün için en uzun kesintisiz uygun saat dizisi
+            seri = np.zeros(gunluk_uygun.shape, dtype=int)
+            en_uzun_seri = np.zeros(gunluk_uygun.shape, dtype=int)
+            for saat in range(self.saat_sayisi):
+                seri = np.where(o.uygun_zamanlar[:, :, saat], seri + 1, 0)
+                en_uzun_seri = np.maximum(en_uzun_seri, seri)
+            gunluk_uygun[blok] = en_uzun_seri[blok]
+        
+        kapasite = np.minimum(gunluk_uygun, gunluk_sinir[:, None]).sum(axis=1)
+        
+        ihlaller = []
+        for r in np.flatnonzero(self.haftalik_saatler > kapasite):
+            ad = self.olusturucu.iliski_adi(iliskiler[r])
+            if o.blok_ders_arka_arkaya and self.haftalik_saatler[r] > 1:
+                aciklama = f"günde tek blok ve en fazla {gunluk_sinir[r]} saatlik blok sınırıyla"
+            else:
+                aciklama = f"günde en fazla {o.ayni_ders_tekrar} tekrar sınırıyla"
+            ihlaller.append(self._ihlal(
+                "iliski", ad, self.haftalik_saatler[r], kapasite[r],
+                f"{ad}: haftalık {self.haftalik_saatler[r]} saat, öğretmenin uygun saatleri ve "
+                f"{aciklama} en fazla {kapasite[r]} saat yerleştirilebilir"
+            ))
+        
+        # Aynı sınıfın aynı dersi farklı öğretmenlerle alması durumunda tekrar sınırı toplam için geçerlidir
+        ciftler = {}
+        for r, iliski in enumerate(iliskiler):
+            ciftler.setdefault((iliski["sinif_id"], iliski["ders_id"]), []).append(r)
+        
+        cift_kapasitesi = self.gun_sayisi * o.ayni_ders_tekrar
+        for cift_iliskileri in ciftler.values():
+            if len(cift_iliskileri) < 2:
+                continue
+            toplam = self.haftalik_saatler[cift_iliskileri].sum()
+            if toplam > cift_kapasitesi:
+                ad = self.olusturucu.iliski_adi(iliskiler[cift_iliskileri[0]])
+                ihlaller.append(self._ihlal(
+                    "iliski", ad, toplam, cift_kapasitesi,
+                    f"{ad}: farklı öğretmenlerle toplam {toplam} saat, günde en fazla {o.ayni_ders_tekrar} "
+                    f"tekrarla en fazla {cift_kapasitesi} saat yerleştirilebilir"
+                ))
+        return ihlaller
+    
+    def derslik_arzi(self):
+        """
+        Derslik türü arzını talep ile karşılaştırır
+        
+        İzinli derslik kümesi S olan her ders grubu için, izinli dersliklerinin
+        tamamı S içinde kalan derslerin toplam saati |S| × gün × saat sayısını
+        aşamaz. Hiç uygun dersliği olmayan dersler ayrıca listelenir.
+        """
+        o = self.olusturucu
+        uygun_derslikler = o.uygun_derslikler
+        iliskiler = o.ders_sinif_iliskileri
+        
+        ihlaller = []
+        for r in np.flatnonzero(~uygun_derslikler.any(axis=1)):
+            ad = self.olusturucu.iliski_adi(iliskiler[r])
+            ihlaller.append(self._ihlal(
+                "derslik", ad, self.haftalik_saatler[r], 0,
+                f"{ad}: bu ders için uygun derslik tanımlanmamış"
+            ))
+        
+        kumeler = {tuple(satir) for satir in uygun_derslikler if satir.any()}
+        kumeler.add(tuple(np.ones(len(o.derslikler), dtype=bool)))
+        saat_sayisi = self.gun_sayisi * self.saat_sayisi
+        
+        for kume in kumeler:
+            kume = np.array(kume, dtype=bool)
+            icerde = ~(uygun_derslikler & ~kume).any(axis=1) & uygun_derslikler.any(axis=1)
+            talep = self.haftalik_saatler[icerde].sum()
+            arz = int(kume.sum()) * saat_sayisi
+            if talep > arz:
+                adlar = ", ".join(derslik["ad"] for k, derslik in enumerate(o.derslikler) if kume[k])
+                ihlaller.append(self._ihlal(
+                    "derslik", adlar, talep, arz,
+                    f"Derslikler ({adlar}): bu dersliklerde yapılabilen dersler haftada {talep} saat, "
+                    f"derslikler toplam {arz} saat kullanılabilir"
+                ))
+        return ihlaller
@@ -8,6 +8,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
 
+from algorithm.arka_uclar import ARKA_UCLAR
+
 class KisitYonetimi:
     """
     Kısıt yönetimi arayüzü
@@ -71,6 +73,11 @@ class KisitYonetimi:
         self.general_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.general_frame, text="Genel Kısıtlar")
         self.create_general_constraints_widgets()
+        
+        # Çözücü Ayarları sekmesi
+        self.solver_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.solver_frame, text="Çözücü Ayarları")
+        self.create_solver_settings_widgets()
     
     def create_time_settings_widgets(self):
         """
@@ -178,9 +185,16 @@ class KisitYonetimi:
         self.maximize_radio = ttk.Radiobutton(self.bos_saat_frame, text="Maximize Et", variable=self.ogretmen_bos_saat_var, value="maximize")
         self.maximize_radio.pack(side=tk.LEFT, padx=5)
         
+        # Öğretmen boş saat modeli
+        ttk.Label(form_frame, text="Boş Saat Modeli:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.bos_saat_modeli_var = tk.StringVar(value="kompakt")
+        self.bos_saat_modeli_combo = ttk.Combobox(form_frame, textvariable=self.bos_saat_modeli_var, state="readonly", width=15)
+        self.bos_saat_modeli_combo["values"] = ["kompakt", "klasik"]
+        self.bos_saat_modeli_combo.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+        
         # Kaydet butonu
         self.save_teacher_button = ttk.Button(form_frame, text="Ayarları Kaydet", command=self.save_teacher_settings)
-        self.save_teacher_button.grid(row=3, column=0, columnspan=2, pady=20)
+        self.save_teacher_button.grid(row=4, column=0, columnspan=2, pady=20)
     
     def create_class_constraints_widgets(self):
         """
@@ -238,9 +252,15 @@ class KisitYonetimi:
         self.derslik_degisim_check = ttk.Checkbutton(form_frame, text="Sınıfların derslik değişimini minimize et", variable=self.derslik_degisim_var)
         self.derslik_degisim_check.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
         
+        # Ev dersliği modu
+        ttk.Label(form_frame, text="Ev Dersliği Modu:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.ev_dersligi_var = tk.BooleanVar(value=False)
+        self.ev_dersligi_check = ttk.Checkbutton(form_frame, text="Özel derslik gerektirmeyen dersleri sınıfın ev dersliğine sabitle", variable=self.ev_dersligi_var)
+        self.ev_dersligi_check.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        
         # Kaydet butonu
         self.save_classroom_button = ttk.Button(form_frame, text="Ayarları Kaydet", command=self.save_classroom_settings)
-        self.save_classroom_button.grid(row=2, column=0, columnspan=2, pady=20)
+        self.save_classroom_button.grid(row=3, column=0, columnspan=2, pady=20)
     
     def create_general_constraints_widgets(self):
         """
@@ -275,6 +295,116 @@ class KisitYonetimi:
         self.save_general_button = ttk.Button(form_frame, text="Ayarları Kaydet", command=self.save_general_settings)
         self.save_general_button.grid(row=3, column=0, columnspan=2, pady=20)
     
+    def create_solver_settings_widgets(self):
+        """
+        Çözücü ayarları sekmesi bileşenlerini oluşturur
+        """
+        # Başlık
+        ttk.Label(self.solver_frame, text="Çözücü Ayarları", font=("TkDefaultFont", 12, "bold")).pack(pady=10)
+        
+        # Form çerçevesi
+        form_frame = ttk.Frame(self.solver_frame)
+        form_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        
+        # İş parçacığı sayısı
+        ttk.Label(form_frame, text="İş Parçacığı Sayısı (0: otomatik):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.cozucu_is_parcacigi_var = tk.StringVar()
+        self.cozucu_is_parcacigi_entry = ttk.Entry(form_frame, textvariable=self.cozucu_is_parcacigi_var, width=10)
+        self.cozucu_is_parcacigi_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Rastgele tohum
+        ttk.Label(form_frame, text="Rastgele Tohum:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        self.cozucu_rastgele_tohum_var = tk.StringVar()
+        self.cozucu_rastgele_tohum_entry = ttk.Entry(form_frame, textvariable=self.cozucu_rastgele_tohum_var, width=10)
+        self.cozucu_rastgele_tohum_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Göreli fark sınırı
+        ttk.Label(form_frame, text="Göreli Fark Sınırı (0: kapalı, örn. 0.05):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.cozucu_goreli_fark_var = tk.StringVar()
+        self.cozucu_goreli_fark_entry = ttk.Entry(form_frame, textvariable=self.cozucu_goreli_fark_var, width=10)
+        self.cozucu_goreli_fark_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # İyileşme olmadan durma süresi
+        ttk.Label(form_frame, text="İyileşme Olmazsa Durma Süresi (saniye, 0: kapalı):").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.cozucu_iyilesmesiz_sure_var = tk.StringVar()
+        self.cozucu_iyilesmesiz_sure_entry = ttk.Entry(form_frame, textvariable=self.cozucu_iyilesmesiz_sure_var, width=10)
+        self.cozucu_iyilesmesiz_sure_entry.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Sıcak başlangıç
+        ttk.Label(form_frame, text="Sıcak Başlangıç:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
+        self.sicak_baslangic_var = tk.BooleanVar(value=True)
+        self.sicak_baslangic_check = ttk.Checkbutton(form_frame, text="Mevcut programı başlangıç çözümü olarak kullan", variable=self.sicak_baslangic_var)
+        self.sicak_baslangic_check.grid(row=4, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Bileşenlere ayırma
+        ttk.Label(form_frame, text="Bileşenlere Ayırma:").grid(row=5, column=0, sticky=tk.W, padx=5, pady=5)
+        self.bilesen_ayristirma_var = tk.BooleanVar(value=False)
+        self.bilesen_ayristirma_check = ttk.Checkbutton(form_frame, text="Bağımsız sınıf gruplarını ayrı süreçlerde çöz", variable=self.bilesen_ayristirma_var)
+        self.bilesen_ayristirma_check.grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Süreç sayısı
+        ttk.Label(form_frame, text="Süreç Sayısı (0: çekirdek sayısı):").grid(row=6, column=0, sticky=tk.W, padx=5, pady=5)
+        self.bilesen_surec_sayisi_var = tk.StringVar()
+        self.bilesen_surec_sayisi_entry = ttk.Entry(form_frame, textvariable=self.bilesen_surec_sayisi_var, width=10)
+        self.bilesen_surec_sayisi_entry.grid(row=6, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # İki aşamalı çözüm
+        ttk.Label(form_frame, text="İki Aşamalı Çözüm:").grid(row=7, column=0, sticky=tk.W, padx=5, pady=5)
+        self.iki_asamali_var = tk.BooleanVar(value=False)
+        self.iki_asamali_check = ttk.Checkbutton(form_frame, text="Önce zamanları çöz, derslikleri sonra eşleştirerek ata", variable=self.iki_asamali_var)
+        self.iki_asamali_check.grid(row=7, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Önbellek
+        ttk.Label(form_frame, text="Önbellek:").grid(row=8, column=0, sticky=tk.W, padx=5, pady=5)
+        self.onbellek_kullan_var = tk.BooleanVar(value=True)
+        self.onbellek_kullan_check = ttk.Checkbutton(form_frame, text="Girdiler değişmediyse önceki programı kullan", variable=self.onbellek_kullan_var)
+        self.onbellek_kullan_check.grid(row=8, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Önbellek boyutu
+        ttk.Label(form_frame, text="Önbellekte Tutulacak Program Sayısı:").grid(row=9, column=0, sticky=tk.W, padx=5, pady=5)
+        self.onbellek_boyutu_var = tk.StringVar()
+        self.onbellek_boyutu_entry = ttk.Entry(form_frame, textvariable=self.onbellek_boyutu_var, width=10)
+        self.onbellek_boyutu_entry.grid(row=9, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Sezgisel ipucu
+        ttk.Label(form_frame, text="Sezgisel İpucu:").grid(row=10, column=0, sticky=tk.W, padx=5, pady=5)
+        self.sezgisel_ipucu_var = tk.BooleanVar(value=True)
+        self.sezgisel_ipucu_check = ttk.Checkbutton(form_frame, text="Mevcut program yoksa hızlı taslağı başlangıç çözümü olarak kullan", variable=self.sezgisel_ipucu_var)
+        self.sezgisel_ipucu_check.grid(row=10, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Yerel arama süresi
+        ttk.Label(form_frame, text="Yerel Arama Süresi (saniye, 0: kapalı):").grid(row=11, column=0, sticky=tk.W, padx=5, pady=5)
+        self.yerel_arama_suresi_var = tk.StringVar()
+        self.yerel_arama_suresi_entry = ttk.Entry(form_frame, textvariable=self.yerel_arama_suresi_var, width=10)
+        self.yerel_arama_suresi_entry.grid(row=11, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Yarışta çalıştırılacak arka uçlar
+        ttk.Label(form_frame, text="Yarışan Arka Uçlar (virgülle):").grid(row=12, column=0, sticky=tk.W, padx=5, pady=5)
+        self.yaris_arka_uclari_var = tk.StringVar()
+        self.yaris_arka_uclari_entry = ttk.Entry(form_frame, textvariable=self.yaris_arka_uclari_var, width=40)
+        self.yaris_arka_uclari_entry.grid(row=12, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Ek kesmeler (gereksiz ama geçerli kısıtlar, her aile ayrı açılır)
+        ttk.Label(form_frame, text="Ek Kesmeler:").grid(row=13, column=0, sticky=tk.W, padx=5, pady=5)
+        self.kesme_frame = ttk.Frame(form_frame)
+        self.kesme_frame.grid(row=13, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        self.kesme_ogretmen_haftalik_var = tk.BooleanVar(value=False)
+        self.kesme_ogretmen_haftalik_check = ttk.Checkbutton(self.kesme_frame, text="Öğretmen haftalık toplamı", variable=self.kesme_ogretmen_haftalik_var)
+        self.kesme_ogretmen_haftalik_check.pack(side=tk.LEFT, padx=5)
+        
+        self.kesme_sinif_gunluk_var = tk.BooleanVar(value=False)
+        self.kesme_sinif_gunluk_check = ttk.Checkbutton(self.kesme_frame, text="Sınıf günlük zarfı", variable=self.kesme_sinif_gunluk_var)
+        self.kesme_sinif_gunluk_check.pack(side=tk.LEFT, padx=5)
+        
+        self.kesme_klik_var = tk.BooleanVar(value=False)
+        self.kesme_klik_check = ttk.Checkbutton(self.kesme_frame, text="Çakışma klikleri", variable=self.kesme_klik_var)
+        self.kesme_klik_check.pack(side=tk.LEFT, padx=5)
+        
+        # Kaydet butonu
+        self.save_solver_button = ttk.Button(form_frame, text="Ayarları Kaydet", command=self.save_solver_settings)
+        self.save_solver_button.grid(row=14, column=0, columnspan=2, pady=20)
+    
     def load_settings(self):
         """
         Ayarları veritabanından yükler
@@ -294,6 +424,7 @@ class KisitYonetimi:
             self.ogretmen_gunluk_max_var.set(self.db.ayar_getir("ogretmen_gunluk_max_ders", "6"))
             self.ogretmen_gunluk_min_var.set(self.db.ayar_getir("ogretmen_gunluk_min_ders", "2"))
             self.ogretmen_bos_saat_var.set(self.db.ayar_getir("ogretmen_bos_saat_tercihi", "minimize"))
+            self.bos_saat_modeli_var.set(self.db.ayar_getir("bos_saat_modeli", "kompakt"))
             
             # Sınıf kısıtları
             self.sinif_gunluk_max_var.set(self.db.ayar_getir("sinif_gunluk_max_ders", "8"))
@@ -303,12 +434,31 @@ class KisitYonetimi:
             # Derslik kısıtları
             self.ozel_derslik_var.set(self.db.ayar_getir("ozel_derslik_zorunlu", "1") == "1")
             self.derslik_degisim_var.set(self.db.ayar_getir("derslik_degisim_minimize", "1") == "1")
+            self.ev_dersligi_var.set(self.db.ayar_getir("ev_dersligi_modu", "0") == "1")
             
             # Genel kısıtlar
             self.blok_ders_var.set(self.db.ayar_getir("blok_ders_arka_arkaya", "1") == "1")
             self.max_blok_ders_var.set(self.db.ayar_getir("max_blok_ders", "2"))
             self.algoritma_sure_var.set(self.db.ayar_getir("algoritma_sure_siniri", "300"))
             
+            # Çözücü ayarları
+            self.cozucu_is_parcacigi_var.set(self.db.ayar_getir("cozucu_is_parcacigi", "0"))
+            self.cozucu_rastgele_tohum_var.set(self.db.ayar_getir("cozucu_rastgele_tohum", "0"))
+            self.cozucu_goreli_fark_var.set(self.db.ayar_getir("cozucu_goreli_fark", "0"))
+            self.cozucu_iyilesmesiz_sure_var.set(self.db.ayar_getir("cozucu_iyilesmesiz_sure", "0"))
+            self.sicak_baslangic_var.set(self.db.ayar_getir("sicak_baslangic", "1") == "1")
+            self.bilesen_ayristirma_var.set(self.db.ayar_getir("bilesen_ayristirma", "0") == "1")
+            self.bilesen_surec_sayisi_var.set(self.db.ayar_getir("bilesen_surec_sayisi", "0"))
+            self.iki_asamali_var.set(self.db.ayar_getir("iki_asamali_cozum", "0") == "1")
+            self.onbellek_kullan_var.set(self.db.ayar_getir("onbellek_kullan", "1") == "1")
+            self.onbellek_boyutu_var.set(self.db.ayar_getir("onbellek_boyutu", "20"))
+            self.sezgisel_ipucu_var.set(self.db.ayar_getir("sezgisel_ipucu", "1") == "1")
+            self.yerel_arama_suresi_var.set(self.db.ayar_getir("yerel_arama_suresi", "0"))
+            self.yaris_arka_uclari_var.set(self.db.ayar_getir("yaris_arka_uclari", "cp_sat,yerel_arama"))
+            self.kesme_ogretmen_haftalik_var.set(self.db.ayar_getir("kesme_ogretmen_haftalik", "0") == "1")
+            self.kesme_sinif_gunluk_var.set(self.db.ayar_getir("kesme_sinif_gunluk", "0") == "1")
+            self.kesme_klik_var.set(self.db.ayar_getir("kesme_klik", "0") == "1")
+            
             self.logger.info("Ayarlar başarıyla yüklendi")
         except Exception as e:
             self.logger.error(f"Ayarlar yüklenirken hata oluştu: {str(e)}")
@@ -384,6 +534,7 @@ class KisitYonetimi:
             self.db.ayar_ekle_veya_guncelle("ogretmen_gunluk_max_ders", self.ogretmen_gunluk_max_var.get(), "Öğretmen günlük maksimum ders saati")
             self.db.ayar_ekle_veya_guncelle("ogretmen_gunluk_min_ders", self.ogretmen_gunluk_min_var.get(), "Öğretmen günlük minimum ders saati")
             self.db.ayar_ekle_veya_guncelle("ogretmen_bos_saat_tercihi", self.ogretmen_bos_saat_var.get(), "Öğretmen boş saat tercihi")
+            self.db.ayar_ekle_veya_guncelle("bos_saat_modeli", self.bos_saat_modeli_var.get(), "Öğretmen boş saat amaç modeli (kompakt/klasik)")
             
             messagebox.showinfo("Bilgi", "Öğretmen kısıtları başarıyla kaydedildi.")
             self.logger.info("Öğretmen kısıtları kaydedildi")
@@ -440,6 +591,7 @@ class KisitYonetimi:
             # Ayarları kaydet
             self.db.ayar_ekle_veya_guncelle("ozel_derslik_zorunlu", "1" if self.ozel_derslik_var.get() else "0", "Özel derslik zorunluluğu")
             self.db.ayar_ekle_veya_guncelle("derslik_degisim_minimize", "1" if self.derslik_degisim_var.get() else "0", "Derslik değişim minimizasyonu")
+            self.db.ayar_ekle_veya_guncelle("ev_dersligi_modu", "1" if self.ev_dersligi_var.get() else "0", "Ev dersliği modu")
             
             messagebox.showinfo("Bilgi", "Derslik kısıtları başarıyla kaydedildi.")
             self.logger.info("Derslik kısıtları kaydedildi")
@@ -476,3 +628,72 @@ class KisitYonetimi:
         except Exception as e:
             self.logger.error(f"Genel kısıtlar kaydedilirken hata oluştu: {str(e)}")
             messagebox.showerror("Hata", f"Genel kısıtlar kaydedilirken bir hata oluştu:\n{str(e)}")
+    
+    def save_solver_settings(self):
+        """
+        Çözücü ayarlarını kaydeder
+        """
+        try:
+            # Veri doğrulama
+            is_parcacigi = int(self.cozucu_is_parcacigi_var.get())
+            int(self.cozucu_rastgele_tohum_var.get())
+            goreli_fark = float(self.cozucu_goreli_fark_var.get())
+            iyilesmesiz_sure = float(self.cozucu_iyilesmesiz_sure_var.get())
+            surec_sayisi = int(self.bilesen_surec_sayisi_var.get())
+            onbellek_boyutu = int(self.onbellek_boyutu_var.get())
+            yerel_arama_suresi = float(self.yerel_arama_suresi_var.get())
+            yaris_arka_uclari = [ad.strip() for ad in self.yaris_arka_uclari_var.get().split(",") if ad.strip()]
+            
+            if is_parcacigi < 0:
+                messagebox.showerror("Hata", "İş parçacığı sayısı negatif olamaz.")
+                return
+            
+            if goreli_fark < 0 or goreli_fark >= 1:
+                messagebox.showerror("Hata", "Göreli fark sınırı 0 ile 1 arasında olmalıdır.")
+                return
+            
+            if iyilesmesiz_sure < 0:
+                messagebox.showerror("Hata", "İyileşme olmazsa durma süresi negatif olamaz.")
+                return
+            
+            if surec_sayisi < 0:
+                messagebox.showerror("Hata", "Süreç sayısı negatif olamaz.")
+                return
+            
+            if onbellek_boyutu <= 0:
+                messagebox.showerror("Hata", "Önbellekte tutulacak program sayısı 0'dan büyük olmalıdır.")
+                return
+            
+            if yerel_arama_suresi < 0:
+                messagebox.showerror("Hata", "Yerel arama süresi negatif olamaz.")
+                return
+            
+            if not yaris_arka_uclari or any(ad not in ARKA_UCLAR for ad in yaris_arka_uclari):
+                messagebox.showerror("Hata", f"Yarışan arka uçlar şunlardan seçilmelidir: {', '.join(ARKA_UCLAR)}")
+                return
+            
+            # Ayarları kaydet
+            self.db.ayar_ekle_veya_guncelle("cozucu_is_parcacigi", self.cozucu_is_parcacigi_var.get(), "Çözücü iş parçacığı sayısı (0: otomatik)")
+            self.db.ayar_ekle_veya_guncelle("cozucu_rastgele_tohum", self.cozucu_rastgele_tohum_var.get(), "Çözücü rastgele tohumu")
+            self.db.ayar_ekle_veya_guncelle("cozucu_goreli_fark", self.cozucu_goreli_fark_var.get(), "Çözücü göreli fark sınırı (0: kapalı)")
+            self.db.ayar_ekle_veya_guncelle("cozucu_iyilesmesiz_sure", self.cozucu_iyilesmesiz_sure_var.get(), "İyileşme olmazsa aramayı durdurma süresi (saniye, 0: kapalı)")
+            self.db.ayar_ekle_veya_guncelle("sicak_baslangic", "1" if self.sicak_baslangic_var.get() else "0", "Mevcut programı başlangıç çözümü olarak kullan")
+            self.db.ayar_ekle_veya_guncelle("bilesen_ayristirma", "1" if self.bilesen_ayristirma_var.get() else "0", "Bağımsız sınıf gruplarını ayrı süreçlerde çöz")
+            self.db.ayar_ekle_veya_guncelle("bilesen_surec_sayisi", self.bilesen_surec_sayisi_var.get(), "Bileşenleri çözen süreç sayısı (0: çekirdek sayısı)")
+            self.db.ayar_ekle_veya_guncelle("iki_asamali_cozum", "1" if self.iki_asamali_var.get() else "0", "Önce zamanları çöz, derslikleri sonra eşleştirerek ata")
+            self.db.ayar_ekle_veya_guncelle("onbellek_kullan", "1" if self.onbellek_kullan_var.get() else "0", "Girdiler değişmediyse önbellekteki programı kullan")
+            self.db.ayar_ekle_veya_guncelle("onbellek_boyutu", self.onbellek_boyutu_var.get(), "Önbellekte tutulacak program sayısı")
+            self.db.ayar_ekle_veya_guncelle("sezgisel_ipucu", "1" if self.sezgisel_ipucu_var.get() else "0", "Mevcut program yoksa hızlı taslağı başlangıç çözümü olarak kullan")
+            self.db.ayar_ekle_veya_guncelle("yerel_arama_suresi", self.yerel_arama_suresi_var.get(), "Çözümü yerel aramayla iyileştirme süresi (saniye, 0: kapalı)")
+            self.db.ayar_ekle_veya_guncelle("yaris_arka_uclari", ",".join(yaris_arka_uclari), "Yarış seçildiğinde paralel çalıştırılan çözücü arka uçları")
+            self.db.ayar_ekle_veya_guncelle("kesme_ogretmen_haftalik", "1" if self.kesme_ogretmen_haftalik_var.get() else "0", "Öğretmen haftalık toplam kesmesi")
+            self.db.ayar_ekle_veya_guncelle("kesme_sinif_gunluk", "1" if self.kesme_sinif_gunluk_var.get() else "0", "Sınıf günlük zarf kesmesi")
+            self.db.ayar_ekle_veya_guncelle("kesme_klik", "1" if self.kesme_klik_var.get() else "0", "Çakışma kliği kesmesi")
+            
+            messagebox.showinfo("Bilgi", "Çözücü ayarları başarıyla kaydedildi.")
+            self.logger.info("Çözücü ayarları kaydedildi")
+        except ValueError:
+            messagebox.showerror("Hata", "Lütfen sayısal değerleri doğru formatta girin.")
+        except Exception as e:
+            self.logger.error(f"Çözücü ayarları kaydedilirken hata oluştu: {str(e)}")
+            messagebox.showerror("Hata", f"Çözücü ayarları kaydedilirken bir hata oluştu:\n{str(e)}")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Program oluşturucu önbellek modülü
+Bulunan çözümleri, girdilerin SHA-256 özeti altında diskte saklar. Kayıt sayısı
+sınırı aşıldığında en uzun süredir kullanılmayan kayıtlar silinir.
+"""
+
+import os
+import json
+import hashlib
+import logging
+
+class ModelOnbellegi:
+    """
+    Girdi özetiyle adreslenen çözüm önbelleği
+    
+    Her kayıt bir <özet>.json dosyasıdır (çözüm ve bilgiler). Dosyanın değiştirilme
+    zamanı son kullanım zamanı olarak kullanılır.
+    """
+    
+    def __init__(self, dizin, max_kayit=20):
+        """
+        Önbelleği başlatır
+        
+        Args:
+            dizin (str): Önbellek dizini
+            max_kayit (int): Saklanacak en fazla kayıt sayısı
+        """
+        self.dizin = dizin
+        self.max_kayit = max_kayit
+        self.logger = logging.getLogger(__name__)
+        
+        os.makedirs(self.dizin, exist_ok=True)
+    
+    @staticmethod
+    def ozet_hesapla(girdiler):
+        """
+        Girdilerin içerik özetini hesaplar
+        
+        Args:
+            girdiler (dict): JSON'a çevrilebilir girdiler
+            
+        Returns:
+            str: SHA-256 özeti (onaltılık)
+        """
+        metin = json.dumps(girdiler, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(metin.encode("utf-8")).hexdigest()
+    
+    def _yol(self, ozet, uzanti):
+        """
+        Kayıt dosyasının yolunu döndürür
+        """
+        return os.path.join(self.dizin, f"{ozet}.{uzanti}")
+    
+    def getir(self, ozet):
+        """
+        Özete ait kaydı getirir ve son kullanım zamanını günceller
+        
+        Args:
+            ozet (str): Girdi özeti
+            
+        Returns:
+            dict: Kayıt, yoksa None
+        """
+        yol = self._yol(ozet, "json")
+        if not os.path.exists(yol):
+            return None
+        
+        try:
+            with open(yol, "r", encoding="utf-8") as f:
+                kayit = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Önbellek kaydı okunamadı ({ozet}): {str(e)}")
+            return None
+        
+        os.utime(yol)
+        
+        return kayit
+    
+    def ipucu_getir(self, anahtar, deger):
+        """
+        Verilen alanı verilen değere eşit olan en son kullanılmış kaydı getirir
+        
+        Özeti tutmayan girdiler için sıcak başlangıç ipucu aramakta kullanılır.
+        
+        Args:
+            anahtar (str): Kayıttaki alan adı
+            deger: Aranan değer
+            
+        Returns:
+            dict: Kayıt, bulunamazsa None
+        """
+        for ozet in reversed(self._kayitlar()):
+            try:
+                with open(self._yol(ozet, "json"), "r", encoding="utf-8") as f:
+                    kayit = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if kayit.get(anahtar) == deger:
+                return self.getir(ozet)
+        return None
+    
+    def kaydet(self, ozet, kayit):
+        """
+        Kaydı önbelleğe yazar ve sınır aşıldıysa eski kayıtları siler
+        
+        Args:
+            ozet (str): Girdi özeti
+            kayit (dict): JSON'a çevrilebilir çözüm kaydı
+        """
+        # Yarım kalmış yazmaların okunmaması için önce geçici dosyaya yazılır
+        gecici = self._yol(ozet, "json.tmp")
+        with open(gecici, "w", encoding="utf-8") as f:
+            json.dump(kayit, f, ensure_ascii=False)
+        
+        os.replace(gecici, self._yol(ozet, "json"))
+        
+        self._temizle()
+    
+    def _kayitlar(self):
+        """
+        Kayıt özetlerini son kullanım zamanına göre (eskiden yeniye) döndürür
+        """
+        kayitlar = [ad[:-len(".json")] for ad in os.listdir(self.dizin) if ad.endswith(".json")]
+        return sorted(kayitlar, key=lambda ozet: os.path.getmtime(self._yol(ozet, "json")))
+    
+    def _temizle(self):
+        """
+        Sınırı aşan en eski kayıtları siler
+        """
+        kayitlar = self._kayitlar()
+        for ozet in kayitlar[:max(0, len(kayitlar) - self.max_kayit)]:
+            # Eski sürümlerin yazdığı .pb model dosyaları da kayıtla birlikte silinir
+            for uzanti in ("json", "pb"):
+                if os.path.exists(self._yol(ozet, uzanti)):
+                    os.remove(self._yol(ozet, uzanti))
+            self.logger.info(f"Önbellek kaydı silindi: {ozet}")
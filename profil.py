@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Model kurma profili modülü
+Model kuran yöntemlerin süresini, modele eklediği değişken ve kısıt sayısını
+ve bellek farkını ölçer
+"""
+
+import os
+import json
+import time
+import functools
+
+def bellek_mb():
+    """
+    Sürecin anlık bellek kullanımını (RSS) döndürür
+    
+    Returns:
+        float: Megabayt cinsinden bellek, ölçülemiyorsa (Linux dışı sistemler) None
+    """
+    try:
+        with open("/proc/self/statm") as dosya:
+            return int(dosya.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def kurma_olcumu(yontem):
+    """
+    Model kuran yöntemin süresini, eklediği değişken ve kısıt sayısını ve bellek farkını ölçer
+    
+    Sarılan yöntemin nesnesinde model, kurma_profili ve _kurma_derinligi
+    öznitelikleri bulunmalıdır. Ölçümler çağrı sırasıyla kurma_profili listesine
+    yazılır. İç içe çağrılar (add_constraints içindeki add_* yöntemleri gibi)
+    derinlik alanıyla ayırt edilir; dıştaki kaydın değerleri içtekileri de kapsar.
+    """
+    @functools.wraps(yontem)
+    def sarmalayici(self, *args, **kwargs):
+        def boyut():
+            if self.model is None:
+                return 0, 0
+            proto = self.model.Proto()
+            return len(proto.variables), len(proto.constraints)
+        
+        kayit = {"yontem": yontem.__name__, "derinlik": self._kurma_derinligi}
+        self.kurma_profili.append(kayit)
+        degisken, kisit = boyut()
+        bellek = bellek_mb()
+        baslangic = time.time()
+        
+        self._kurma_derinligi += 1
+        try:
+            return yontem(self, *args, **kwargs)
+        finally:
+            self._kurma_derinligi -= 1
+            kayit["sure"] = time.time() - baslangic
+            yeni_degisken, yeni_kisit = boyut()
+            kayit["degisken"] = yeni_degisken - degisken
+            kayit["kisit"] = yeni_kisit - kisit
+            son_bellek = bellek_mb()
+            kayit["bellek_mb"] = son_bellek - bellek if bellek is not None and son_bellek is not None else None
+    
+    return sarmalayici
+
+def profil_kaydi(model, profil, sure):
+    """
+    Kurma profilini ayrıştırılabilir tek satırlık bir log kaydına çevirir
+    
+    Args:
+        model (CpModel): Kurulan model
+        profil (list): kurma_olcumu kayıtları
+        sure (float): Toplam kurma süresi (saniye)
+        
+    Returns:
+        str: "Model kurma profili: {...}" biçiminde JSON kayıt
+    """
+    proto = model.Proto()
+    return "Model kurma profili: " + json.dumps({
+        "sure": round(sure, 4),
+        "degisken": len(proto.variables),
+        "kisit": len(proto.constraints),
+        "yontemler": [
+            dict(kayit, sure=round(kayit["sure"], 4), bellek_mb=None if kayit["bellek_mb"] is None else round(kayit["bellek_mb"], 2))
+            for kayit in profil
+        ]
+    }, ensure_ascii=False)
@@ -11,6 +11,7 @@ import threading
 import time
 
 from algorithm.scheduler import ProgramOlusturucu
+from algorithm.arka_uclar import ARKA_UCLAR
 
 class ProgramOlusturma:
     """
@@ -37,6 +38,11 @@ class ProgramOlusturma:
         # İş parçacığı
         self.thread = None
         self.is_running = False
+        self.iptal_edildi = False
+        
+        # Çözüm ilerlemesi
+        self.cozum_baslangic = None
+        self.cozum_gecmisi = []
         
         # Arayüz bileşenlerini oluştur
         self.create_widgets()
@@ -105,6 +111,20 @@ class ProgramOlusturma:
         self.save_settings_button = ttk.Button(self.settings_frame, text="Ayarları Kaydet", command=self.save_settings)
         self.save_settings_button.grid(row=0, column=2, padx=5, pady=5)
         
+        # Onarım modu
+        self.onarim_var = tk.BooleanVar(value=False)
+        self.onarim_check = ttk.Checkbutton(self.settings_frame, text="Yalnızca değişen kısmı onar (mevcut programı koru)", variable=self.onarim_var)
+        self.onarim_check.grid(row=1, column=0, columnspan=3, sticky=tk.W, padx=5, pady=5)
+        
+        # Çözücü arka ucu (ad -> açıklama; "yaris" seçili arka uçları aynı süre içinde yarıştırır)
+        self.arka_uc_adlari = {ad: arka_uc.aciklama for ad, arka_uc in ARKA_UCLAR.items()}
+        self.arka_uc_adlari["yaris"] = "Yarış (ayarlardaki arka uçlar paralel çalışır)"
+        ttk.Label(self.settings_frame, text="Çözücü:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.arka_uc_var = tk.StringVar()
+        self.arka_uc_combo = ttk.Combobox(self.settings_frame, textvariable=self.arka_uc_var, values=list(self.arka_uc_adlari.values()), state="readonly", width=40)
+        self.arka_uc_combo.grid(row=2, column=1, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        self.arka_uc_var.set(self.arka_uc_adlari.get(self.db.ayar_getir("cozucu_arka_ucu", "cp_sat"), ARKA_UCLAR["cp_sat"].aciklama))
+        
         # İlerleme çerçevesi
         self.progress_frame = ttk.LabelFrame(self.main_frame, text="İlerleme")
         self.progress_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -200,6 +220,7 @@ class ProgramOlusturma:
             
             # Ayarları kaydet
             self.db.ayar_ekle_veya_guncelle("algoritma_sure_siniri", str(sure_siniri), "Algoritma çalışma süresi sınırı (saniye)")
+            self.db.ayar_ekle_veya_guncelle("cozucu_arka_ucu", self.secili_arka_uc(), "Program oluşturmada kullanılan çözücü arka ucu")
             
             messagebox.showinfo("Bilgi", "Ayarlar başarıyla kaydedildi.")
             self.logger.info("Ayarlar kaydedildi")
@@ -209,6 +230,18 @@ class ProgramOlusturma:
             self.logger.error(f"Ayarlar kaydedilirken hata oluştu: {str(e)}")
             messagebox.showerror("Hata", f"Ayarlar kaydedilirken bir hata oluştu:\n{str(e)}")
     
+    def secili_arka_uc(self):
+        """
+        Seçili çözücü arka ucunun adını döndürür
+        
+        Returns:
+            str: ARKA_UCLAR anahtarı veya "yaris"
+        """
+        for ad, aciklama in self.arka_uc_adlari.items():
+            if aciklama == self.arka_uc_var.get():
+                return ad
+        return "cp_sat"
+    
     def create_schedule(self):
         """
         Program oluşturma işlemini başlatır
@@ -264,6 +297,7 @@ class ProgramOlusturma:
         
         # İş parçacığını başlat
         self.is_running = True
+        self.iptal_edildi = False
         self.thread = threading.Thread(target=self.run_scheduler)
         self.thread.daemon = True
         self.thread.start()
@@ -282,37 +316,120 @@ class ProgramOlusturma:
             # İlerleme çubuğunu güncelle
             self.update_progress(10)
             
-            # Verileri yükle
+            # Ayarları ve verileri yükle (kısıt yönetiminde yapılan değişiklikler için)
             self.update_status("Veriler yükleniyor...")
-            self.scheduler.load_data()
-            self.update_progress(20)
+            self.scheduler.load_settings()
+            self.cozum_gecmisi = []
+            atamalar = None
+            taslak = False
+            durum = None
+            arka_uc = self.secili_arka_uc()
             
-            # Modeli oluştur
-            self.update_status("Model oluşturuluyor...")
-            self.scheduler.create_model()
-            self.update_progress(30)
+            # Onarılan ve önbellekten alınan programlar yerel aramayla değiştirilmez
+            iyilestir = not self.onarim_var.get()
             
-            # Modeli çöz
-            self.update_status("Model çözülüyor...")
-            start_time = time.time()
-            success = self.scheduler.solve()
+            if self.onarim_var.get():
+                # Onarım modu verileri kendisi yükler ve gerekirse modeli birkaç kez kurar
+                self.update_status("Program onarılıyor...")
+                self.update_progress(30)
+                start_time = time.time()
+                self.cozum_baslangic = start_time
+                self.parent.after(0, self.update_solve_progress)
+                success = self.scheduler.repair(ilerleme_geri_cagirma=self.on_solution)
+            else:
+                self.scheduler.load_data()
+                self.update_progress(20)
+                
+                # Aynı girdilerle bulunmuş program önbellekte varsa yeniden çözülmez
+                start_time = time.time()
+                atamalar = self.scheduler.onbellekten_getir()
+                
+                if atamalar is not None:
+                    success = True
+                    iyilestir = False
+                    self.cozum_gecmisi = ["Aynı girdiler için önbellekte kayıtlı program kullanıldı."]
+                elif self.scheduler.check_capacity():
+                    # Kapasite yetersizse model kurulmaz
+                    success = False
+                else:
+                    # Seçilen arka uçla (veya arka uç yarışıyla) çöz
+                    self.update_status(f"{self.arka_uc_adlari[arka_uc]} ile çözülüyor...")
+                    self.update_progress(30)
+                    start_time = time.time()
+                    self.cozum_baslangic = start_time
+                    self.parent.after(0, self.update_solve_progress)
+                    sonuc = self.scheduler.solve_with_backend(arka_uc, ilerleme_geri_cagirma=self.on_solution)
+                    atamalar = sonuc.atamalar
+                    success = sonuc.basarili
+                    durum = sonuc.durum
+                    
+                    # Eksik veya ihlalli programlar taslak olarak kaydedilir ve önbelleğe alınmaz
+                    taslak = success and not sonuc.tam
+                    self.cozum_gecmisi.extend(self.sonuc_satirlari(sonuc))
             end_time = time.time()
+            self.cozum_baslangic = None
             self.update_progress(80)
             
+            # Model kurma profili (açıklama aşaması modeli yeniden kurmadan önce alınır)
+            profil = "\n".join(self.profil_satirlari())
+            
+            if success and iyilestir and self.scheduler.yerel_arama_suresi > 0:
+                # Bulunan programı yerel aramayla iyileştir
+                self.update_status("Program yerel aramayla iyileştiriliyor...")
+                atamalar = self.scheduler.improve_solution(atamalar)
+                end_time = time.time()
+            
             if success:
                 # Çözümü kaydet
                 self.update_status("Çözüm kaydediliyor...")
-                self.scheduler.save_solution()
+                # İptal edilen veya optimal olmayan programlar önbellekte yalnızca ipucu olur
+                self.scheduler.save_solution(atamalar, onbellege_al=not taslak, durum=None if self.iptal_edildi else durum)
                 self.update_progress(100)
                 
                 # Sonuç metnini güncelle
-                self.update_result(f"Program başarıyla oluşturuldu!\n\nÇözüm süresi: {end_time - start_time:.2f} saniye")
+                if taslak:
+                    baslik = "Taslak program oluşturuldu!"
+                elif self.iptal_edildi:
+                    baslik = "İşlem iptal edildi, bulunan en iyi program kaydedildi!"
+                else:
+                    baslik = "Program başarıyla oluşturuldu!"
+                self.update_result(f"{baslik}\n\nÇözüm süresi: {end_time - start_time:.2f} saniye\n\n" + "\n".join(self.cozum_gecmisi) + profil)
+                
+                # Durum etiketini güncelle
+                self.update_status("İptal edildi, en iyi çözüm kaydedildi" if self.iptal_edildi else "Program oluşturuldu")
+            elif self.iptal_edildi:
+                # Sonuç metnini güncelle
+                self.update_result(f"Program oluşturma işlemi iptal edildi.\n\nÇalışma süresi: {end_time - start_time:.2f} saniye\n\nİptal edilmeden önce bir çözüm bulunamadı.")
+                
+                # Durum etiketini güncelle
+                self.update_status("İptal edildi")
+            elif self.scheduler.kapasite_ihlalleri:
+                # Sonuç metnini güncelle
+                ihlaller = "\n".join(f"- {ihlal['mesaj']}" for ihlal in self.scheduler.kapasite_ihlalleri)
+                self.update_result(f"Program oluşturulamadı!\n\nNedeni: Aşağıdaki kapasite sınırları aşılıyor, bu girdilerle çözüm yok:\n\n{ihlaller}")
+                
+                # Durum etiketini güncelle
+                self.update_status("Kapasite yetersiz")
+            elif self.scheduler.cozumsuz_mu():
+                # Çözümsüzlüğe yol açan en küçük kısıt kümesini bul
+                self.update_status("Çakışan kısıtlar aranıyor...")
+                self.update_progress(90)
+                cekirdek = self.scheduler.explain_infeasibility()
+                
+                if cekirdek:
+                    kisitlar = "\n".join(f"- {aciklama}" for aciklama in cekirdek)
+                    neden = f"Aşağıdaki kısıtlar birlikte sağlanamıyor; en az birini gevşetmek gerekir:\n\n{kisitlar}"
+                else:
+                    neden = "Verilen kısıtlar altında uygun bir çözüm bulunamadı."
+                
+                # Sonuç metnini güncelle
+                self.update_result(f"Program oluşturulamadı!\n\nÇalışma süresi: {end_time - start_time:.2f} saniye\n\nNedeni: {neden}{profil}")
                 
                 # Durum etiketini güncelle
-                self.update_status("Program oluşturuldu")
+                self.update_status("Kısıtlar çelişiyor")
             else:
                 # Sonuç metnini güncelle
-                self.update_result(f"Program oluşturulamadı!\n\nÇalışma süresi: {end_time - start_time:.2f} saniye\n\nNedeni: Verilen kısıtlar altında uygun bir çözüm bulunamadı.")
+                self.update_result(f"Program oluşturulamadı!\n\nÇalışma süresi: {end_time - start_time:.2f} saniye\n\nNedeni: Verilen kısıtlar altında uygun bir çözüm bulunamadı.{profil}")
                 
                 # Durum etiketini güncelle
                 self.update_status("Program oluşturulamadı")
@@ -338,11 +455,85 @@ class ProgramOlusturma:
         if not messagebox.askyesno("Onay", "Program oluşturma işlemi iptal edilecek. Emin misiniz?"):
             return
         
-        # İş parçacığını sonlandır
-        self.is_running = False
+        # Çözücüyü durdur; bulunan en iyi çözüm iş parçacığı tarafından kaydedilir
+        self.iptal_edildi = True
+        self.scheduler.durdur()
         
         # Durum etiketini güncelle
-        self.update_status("İptal edildi")
+        self.update_status("İptal ediliyor...")
+    
+    def sonuc_satirlari(self, sonuc):
+        """
+        Arka uç sonucunu sonuç paneli satırlarına çevirir
+        
+        Args:
+            sonuc (CozumSonucu): Arka uç sonucu
+            
+        Returns:
+            list: Satırlar
+        """
+        satirlar = list(sonuc.bilgiler)
+        
+        if self.scheduler.yaris_sonuclari:
+            satirlar.append("Yarış sonuçları (ilk satır seçilen program):")
+            for aday in self.scheduler.yaris_sonuclari:
+                eksik = sum(e["eksik_saat"] for e in aday.eksikler)
+                satirlar.append(
+                    f"- {self.arka_uc_adlari[aday.arka_uc]}: {aday.durum}, amaç {aday.amac if aday.amac is not None else '-'}, "
+                    f"eksik {eksik} saat, {aday.sure:.1f} sn"
+                )
+        
+        if sonuc.eksikler:
+            iliskiler = {iliski["id"]: iliski for iliski in self.scheduler.ders_sinif_iliskileri}
+            satirlar.append(f"Yerleştirilemeyen {sum(eksik['eksik_saat'] for eksik in sonuc.eksikler)} ders saati (elle tamamlanmalı):")
+            satirlar.extend(f"- {self.scheduler.iliski_adi(iliskiler[eksik['iliski_id']])}: {eksik['eksik_saat']} saat" for eksik in sonuc.eksikler)
+        elif sonuc.ihlal:
+            satirlar.append(f"Programda {sonuc.ihlal} günlük sınır ihlali var, elle düzeltilmeli.")
+        
+        return satirlar
+    
+    def profil_satirlari(self):
+        """
+        Son model kurulumunun yöntem bazında profilini sonuç paneli satırlarına çevirir
+        
+        Returns:
+            list: Satırlar (model bu süreçte kurulmadıysa boş)
+        """
+        profil = self.scheduler.kurma_profili
+        if not profil:
+            return []
+        
+        satirlar = ["", "", "Model kurma profili (süre, eklenen değişken ve kısıt, bellek farkı):"]
+        for kayit in profil:
+            bellek = f", {kayit['bellek_mb']:+.1f} MB" if kayit["bellek_mb"] is not None else ""
+            satirlar.append(
+                f"{'    ' * kayit['derinlik']}- {kayit['yontem']}: {kayit['sure']:.2f} sn, "
+                f"{kayit['degisken']} değişken, {kayit['kisit']} kısıt{bellek}"
+            )
+        return satirlar
+    
+    def on_solution(self, bilgi):
+        """
+        Çözücü iyileşen bir çözüm bulduğunda çözücü iş parçacığından çağrılır
+        
+        Args:
+            bilgi (dict): Çözüm bilgileri (amaç, en iyi sınır, fark, süre)
+        """
+        satir = (f"Çözüm {bilgi['cozum_sayisi']}: amaç {bilgi['amac']:.0f}, en iyi sınır {bilgi['en_iyi_sinir']:.0f}, "
+                 f"fark %{bilgi['fark'] * 100:.1f}, süre {bilgi['sure']:.1f} sn")
+        self.cozum_gecmisi.append(satir)
+        self.update_status(satir)
+    
+    def update_solve_progress(self):
+        """
+        Çözüm sürerken ilerleme çubuğunu geçen süreye göre günceller
+        """
+        if self.cozum_baslangic is None:
+            return
+        
+        gecen = time.time() - self.cozum_baslangic
+        self.progress_var.set(30 + 50 * min(1.0, gecen / max(1, self.scheduler.algoritma_sure_siniri)))
+        self.parent.after(500, self.update_solve_progress)
     
     def update_ui_running(self):
         """
@@ -356,6 +547,8 @@ class ProgramOlusturma:
         
         # Giriş alanlarını devre dışı bırak
         self.sure_siniri_entry.config(state=tk.DISABLED)
+        self.onarim_check.config(state=tk.DISABLED)
+        self.arka_uc_combo.config(state=tk.DISABLED)
         
         # İlerleme çubuğunu sıfırla
         self.progress_var.set(0)
@@ -377,6 +570,8 @@ class ProgramOlusturma:
         
         # Giriş alanlarını etkinleştir
         self.sure_siniri_entry.config(state=tk.NORMAL)
+        self.onarim_check.config(state=tk.NORMAL)
+        self.arka_uc_combo.config(state="readonly")
     
     def update_status(self, text):
         """
@@ -5,10 +5,95 @@ Program oluşturma algoritması modülü
 Google OR-Tools kütüphanesini kullanarak kısıt programlama ile ders programı oluşturur
 """
 
+import os
 import time
 import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+import numpy as np
 from ortools.sat.python import cp_model
+from ortools.graph.python import linear_sum_assignment
+
+from algorithm.onbellek import ModelOnbellegi
+from algorithm.kapasite_analizi import KapasiteAnalizcisi
+from algorithm.sezgisel import HizliProgramOlusturucu
+from algorithm.yerel_arama import YerelAramaIyilestirici
+from algorithm.arka_uclar import ARKA_UCLAR, CozumSonucu
+from algorithm.profil import kurma_olcumu, profil_kaydi
+
+class CozumIzleyici(cp_model.CpSolverSolutionCallback):
+    """
+    Çözücünün bulduğu her iyileşen çözümü raporlayan geri çağırma sınıfı
+    """
+    
+    def __init__(self, geri_cagirma=None):
+        """
+        Çözüm izleyicisini başlatır
+        
+        Args:
+            geri_cagirma (callable, optional): Her çözümde çözüm bilgileri sözlüğüyle çağrılır
+        """
+        super().__init__()
+        self.geri_cagirma = geri_cagirma
+        self.cozum_sayisi = 0
+        self.son_bilgi = None
+        self.son_iyilesme = None
+        self.durdurma_istendi = False
+    
+    def on_solution_callback(self):
+        """
+        Çözücü yeni bir çözüm bulduğunda çağrılır
+        """
+        self.cozum_sayisi += 1
+        self.son_iyilesme = time.time()
+        
+        amac = self.ObjectiveValue()
+        sinir = self.BestObjectiveBound()
+        self.son_bilgi = {
+            "cozum_sayisi": self.cozum_sayisi,
+            "amac": amac,
+            "en_iyi_sinir": sinir,
+            "fark": abs(amac - sinir) / max(1.0, abs(amac)),
+            "sure": self.WallTime()
+        }
+        
+        if self.geri_cagirma:
+            self.geri_cagirma(self.son_bilgi)
+        
+        # Eski OR-Tools sürümlerinde çözücü dışarıdan durdurulamaz; bir sonraki çözümde durdur
+        if self.durdurma_istendi:
+            self.StopSearch()
+
+class AyarSozlugu:
+    """
+    Ayarları veritabanı yerine bir sözlükten okuyan kaynak
+    
+    Alt süreçlerde ProgramOlusturucu'ya veritabanı yerine verilir.
+    """
+    
+    def __init__(self, ayarlar):
+        """
+        Ayar kaynağını başlatır
+        
+        Args:
+            ayarlar (dict): Anahtar -> değer sözlüğü
+        """
+        self.ayarlar = ayarlar
+    
+    def ayar_getir(self, anahtar, varsayilan=None):
+        """
+        Ayar değerini getirir
+        
+        Args:
+            anahtar (str): Ayar anahtarı
+            varsayilan (any, optional): Ayar bulunamazsa döndürülecek değer. Defaults to None.
+            
+        Returns:
+            str: Ayar değeri
+        """
+        return self.ayarlar.get(anahtar, varsayilan)
 
 class ProgramOlusturucu:
     """
@@ -37,12 +122,80 @@ class ProgramOlusturucu:
         self.derslikler = []
         self.ders_sinif_iliskileri = []
         self.uygun_olmayan_zamanlar = []
+        self.ders_derslikleri = []
+        self.mevcut_program = []
+        
+        # Onarım modu: sabit tutulan ilişkiler ve serbest ilişkilerin önceki hücreleri
+        self.sabit_iliskiler = None
+        self.sabit_hucreler = None
+        self.onceki_hucreler = None
+        self.onarim_sapma_agirligi = 10
+        
+        # Bileşenlere ayırarak çözme raporu ve birleşik durum
+        self.bilesen_raporu = []
+        self.bilesen_durumu = None
+        
+        # Model ve çözüm önbelleği (ilk kullanımda oluşturulur)
+        self.onbellek = None
+        
+        # Son kapasite analizinde bulunan ihlaller
+        self.kapasite_ihlalleri = []
+        
+        # Son sezgisel taslakta yerleştirilemeyen ders saatleri
+        self.taslak_eksikleri = []
+        
+        # Son arka uç çalışmasının sonucu ve yarışta tüm arka uçların sonuçları
+        self.son_sonuc = None
+        self.yaris_sonuclari = []
+        
+        # Çözümsüzlük açıklaması: kısıt gruplarının etkinleştirme değişkenleri ve son çakışma çekirdeği
+        self.aciklama_modu = False
+        self.kisit_gruplari = {}
+        self.catisma_cekirdegi = []
+        self.gun_adlari = ["Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma"]
+        
+        # İlişki indeksleri
+        self.ogretmen_iliskileri = {}
+        self.sinif_iliskileri = {}
+        self.ders_iliskileri = {}
+        self.iliski_sozlugu = {}
+        self.ders_sozlugu = {}
+        self.ders_derslik_maskeleri = {}
         
         # Model değişkenleri
         self.model = None
-        self.ders_degiskenleri = {}
+        self.degiskenler = []
+        self.degisken_indeksleri = None
+        self.derslik_indeksleri = {}
+        
+        # Paylaşılan öğretmen doluluk değişkenleri: (ogretmen_id, gun) -> saat bazında BoolVar listesi
+        self.ogretmen_doluluklari = {}
+        
+        # Alan daraltma: uygun olmayan zaman ve derslikler için değişken oluşturulmaz
+        self.alan_daraltma = True
+        self.uygun_zamanlar = None
+        self.uygun_derslikler = None
+        self.ev_dersligi_iliskileri = None
         self.solver = None
         self.cozum = None
+        self.son_durum = None
+        
+        # İki aşamalı çözümde solve() sonunda eşleştirmeyle atanan derslikler
+        self.eslestirilen_atamalar = None
+        
+        # Çözüm izleme ve iptal
+        self.izleyici = None
+        self.durdurma_istendi = False
+        
+        # Alt süreçlerle paylaşılan durdurma olayı (yarış ve bileşen çözümü sırasında)
+        self._durdurma_olayi = None
+        
+        # Verilen ipucu solve() başında tüm değişkenlere genişletilecek mi? (bkz. ipucunu_tamamla)
+        self.ipucu_tamamlanacak = False
+        
+        # Son model kurulumunun yöntem bazında profili (bkz. profil.kurma_olcumu)
+        self.kurma_profili = []
+        self._kurma_derinligi = 0
         
         self.logger.info("Program oluşturucu başlatıldı")
     
@@ -61,6 +214,7 @@ class ProgramOlusturucu:
             self.ogretmen_gunluk_max = int(self.db.ayar_getir("ogretmen_gunluk_max_ders", "6"))
             self.ogretmen_gunluk_min = int(self.db.ayar_getir("ogretmen_gunluk_min_ders", "2"))
             self.ogretmen_bos_saat_tercihi = self.db.ayar_getir("ogretmen_bos_saat_tercihi", "minimize")
+            self.bos_saat_modeli = self.db.ayar_getir("bos_saat_modeli", "kompakt")
             
             # Sınıf kısıtları
             self.sinif_gunluk_max = int(self.db.ayar_getir("sinif_gunluk_max_ders", "8"))
@@ -70,12 +224,38 @@ class ProgramOlusturucu:
             # Derslik kısıtları
             self.ozel_derslik_zorunlu = self.db.ayar_getir("ozel_derslik_zorunlu", "1") == "1"
             self.derslik_degisim_minimize = self.db.ayar_getir("derslik_degisim_minimize", "1") == "1"
+            self.ev_dersligi_modu = self.db.ayar_getir("ev_dersligi_modu", "0") == "1"
             
             # Genel kısıtlar
             self.blok_ders_arka_arkaya = self.db.ayar_getir("blok_ders_arka_arkaya", "1") == "1"
             self.max_blok_ders = int(self.db.ayar_getir("max_blok_ders", "2"))
             self.algoritma_sure_siniri = int(self.db.ayar_getir("algoritma_sure_siniri", "300"))
             
+            # Çözücü ayarları
+            self.cozucu_is_parcacigi = int(self.db.ayar_getir("cozucu_is_parcacigi", "0"))
+            self.cozucu_rastgele_tohum = int(self.db.ayar_getir("cozucu_rastgele_tohum", "0"))
+            self.cozucu_goreli_fark = float(self.db.ayar_getir("cozucu_goreli_fark", "0"))
+            self.cozucu_iyilesmesiz_sure = float(self.db.ayar_getir("cozucu_iyilesmesiz_sure", "0"))
+            self.sicak_baslangic = self.db.ayar_getir("sicak_baslangic", "1") == "1"
+            self.bilesen_ayristirma = self.db.ayar_getir("bilesen_ayristirma", "0") == "1"
+            self.bilesen_surec_sayisi = int(self.db.ayar_getir("bilesen_surec_sayisi", "0"))
+            self.iki_asamali = self.db.ayar_getir("iki_asamali_cozum", "0") == "1"
+            self.sezgisel_ipucu = self.db.ayar_getir("sezgisel_ipucu", "1") == "1"
+            self.yerel_arama_suresi = float(self.db.ayar_getir("yerel_arama_suresi", "0"))
+            
+            # Ek kesmeler (her aile ayrı açılıp kapatılabilir)
+            self.kesme_ogretmen_haftalik = self.db.ayar_getir("kesme_ogretmen_haftalik", "0") == "1"
+            self.kesme_sinif_gunluk = self.db.ayar_getir("kesme_sinif_gunluk", "0") == "1"
+            self.kesme_klik = self.db.ayar_getir("kesme_klik", "0") == "1"
+            
+            # Çözücü arka ucu ("yaris": yaris_arka_uclari aynı süre içinde paralel çalıştırılır)
+            self.cozucu_arka_ucu = self.db.ayar_getir("cozucu_arka_ucu", "cp_sat")
+            self.yaris_arka_uclari = [ad for ad in self.db.ayar_getir("yaris_arka_uclari", "cp_sat,yerel_arama").split(",") if ad]
+            
+            # Önbellek ayarları
+            self.onbellek_kullan = self.db.ayar_getir("onbellek_kullan", "1") == "1"
+            self.onbellek_boyutu = int(self.db.ayar_getir("onbellek_boyutu", "20"))
+            
             # Gün ve saat bilgileri
             self.gun_sayisi = 5  # Pazartesi-Cuma
             self.saat_sayisi = self.max_gunluk_ders  # Günlük maksimum ders saati
@@ -90,6 +270,13 @@ class ProgramOlusturucu:
         Veritabanından verileri yükler
         """
         try:
+            # Yeni bir çalışma başlıyor
+            self.durdurma_istendi = False
+            self.model = None
+            self.cozum = None
+            self.son_durum = None
+            self.kurma_profili = []
+            
             # Sınıfları yükle
             self.siniflar = self.db.tum_siniflari_getir()
             self.logger.info(f"{len(self.siniflar)} sınıf yüklendi")
@@ -114,31 +301,138 @@ class ProgramOlusturucu:
             self.uygun_olmayan_zamanlar = self.db.tum_uygun_olmayan_zamanlari_getir()
             self.logger.info(f"{len(self.uygun_olmayan_zamanlar)} uygun olmayan zaman yüklendi")
             
-            # Veri doğrulama
-            if not self.siniflar:
-                raise ValueError("Hiç sınıf tanımlanmamış")
+            # Derslerin yapılabileceği derslikleri yükle
+            self.ders_derslikleri = self.db.tum_ders_dersliklerini_getir()
             
-            if not self.ogretmenler:
-                raise ValueError("Hiç öğretmen tanımlanmamış")
+            # Mevcut programı yükle (sıcak başlangıç için)
+            self.mevcut_program = self.db.tum_programi_getir()
+            self.logger.info(f"{len(self.mevcut_program)} mevcut program kaydı yüklendi")
             
-            if not self.dersler:
-                raise ValueError("Hiç ders tanımlanmamış")
+            self.validate_data()
             
-            if not self.ders_sinif_iliskileri:
-                raise ValueError("Hiç ders-sınıf ilişkisi tanımlanmamış")
+            # Kısıt kurulumunda kullanılacak indeksleri oluştur
+            self.build_indexes()
             
             return True
         except Exception as e:
             self.logger.error(f"Veriler yüklenirken hata oluştu: {str(e)}")
             raise
     
+    def set_data(self, veri):
+        """
+        Verileri veritabanı yerine bir sözlükten yükler
+        
+        Args:
+            veri (dict): siniflar, ogretmenler, dersler, derslikler, ders_sinif_iliskileri,
+                uygun_olmayan_zamanlar, ders_derslikleri ve mevcut_program listeleri
+        """
+        self.durdurma_istendi = False
+        self.siniflar = veri["siniflar"]
+        self.ogretmenler = veri["ogretmenler"]
+        self.dersler = veri["dersler"]
+        self.derslikler = veri["derslikler"]
+        self.ders_sinif_iliskileri = veri["ders_sinif_iliskileri"]
+        self.uygun_olmayan_zamanlar = veri["uygun_olmayan_zamanlar"]
+        self.ders_derslikleri = veri["ders_derslikleri"]
+        self.mevcut_program = veri["mevcut_program"]
+        
+        self.validate_data()
+        self.build_indexes()
+    
+    def validate_data(self):
+        """
+        Yüklenen verilerin program oluşturmaya yeterli olduğunu doğrular
+        """
+        # Veri doğrulama
+        if not self.siniflar:
+            raise ValueError("Hiç sınıf tanımlanmamış")
+        
+        if not self.ogretmenler:
+            raise ValueError("Hiç öğretmen tanımlanmamış")
+        
+        if not self.dersler:
+            raise ValueError("Hiç ders tanımlanmamış")
+        
+        if not self.ders_sinif_iliskileri:
+            raise ValueError("Hiç ders-sınıf ilişkisi tanımlanmamış")
+    
+    def build_indexes(self):
+        """
+        Öğretmen, sınıf ve ders bazında ilişki indekslerini oluşturur
+        
+        İndeksler ilişkilerin self.ders_sinif_iliskileri içindeki sıralarını tutar,
+        böylece kısıtlar tüm ilişki listesini taramadan kurulabilir.
+        """
+        self.ogretmen_iliskileri = {}
+        self.sinif_iliskileri = {}
+        self.ders_iliskileri = {}
+        
+        for r, iliski in enumerate(self.ders_sinif_iliskileri):
+            self.ogretmen_iliskileri.setdefault(iliski["ogretmen_id"], []).append(r)
+            self.sinif_iliskileri.setdefault(iliski["sinif_id"], []).append(r)
+            self.ders_iliskileri.setdefault(iliski["ders_id"], []).append(r)
+        
+        self.iliski_sozlugu = {iliski["id"]: iliski for iliski in self.ders_sinif_iliskileri}
+        self.ders_sozlugu = {ders["id"]: ders for ders in self.dersler}
+        self.derslik_indeksleri = {derslik["id"]: k for k, derslik in enumerate(self.derslikler)}
+        
+        # Derslik gereksinimi olan dersler için izinli derslik maskesi: gereken türdeki
+        # derslikler, derslik kümesi tanımlanmışsa yalnızca o kümedekiler
+        izinli_derslikler = {}
+        for kayit in self.ders_derslikleri:
+            izinli_derslikler.setdefault(kayit["ders_id"], set()).add(kayit["derslik_id"])
+        
+        self.ders_derslik_maskeleri = {}
+        for ders in self.dersler:
+            maske = np.ones(len(self.derslikler), dtype=bool)
+            if ders["derslik_turu"] != "normal":
+                maske &= np.array([derslik["tur"] == ders["derslik_turu"] for derslik in self.derslikler], dtype=bool)
+            if ders["id"] in izinli_derslikler:
+                maske &= np.array([derslik["id"] in izinli_derslikler[ders["id"]] for derslik in self.derslikler], dtype=bool)
+            if not maske.all():
+                self.ders_derslik_maskeleri[ders["id"]] = maske
+    
+    def check_capacity(self):
+        """
+        Model kurulmadan önce sayma sınırlarını kontrol eder
+        
+        Öğretmen yükü ile uygun saatleri, sınıf yükü ile günlük sınırları, ders
+        saatleri ile tekrar sınırını ve derslik türü arzı ile talebi karşılaştırır.
+        Bulunan ihlallerin her biri loglanır ve self.kapasite_ihlalleri'nde tutulur.
+        
+        Returns:
+            list: İhlal sözlükleri (ihlal yoksa boş liste)
+        """
+        try:
+            baslangic = time.time()
+            self.compute_domains()
+            self.kapasite_ihlalleri = KapasiteAnalizcisi(self).analiz_et()
+            
+            for ihlal in self.kapasite_ihlalleri:
+                self.logger.error(f"Kapasite yetersiz: {ihlal['mesaj']}")
+            
+            self.logger.info(f"Kapasite analizi {(time.time() - baslangic) * 1000:.1f} ms sürdü, {len(self.kapasite_ihlalleri)} ihlal bulundu")
+            return self.kapasite_ihlalleri
+        except Exception as e:
+            self.logger.error(f"Kapasite analizi yapılırken hata oluştu: {str(e)}")
+            raise
+    
     def create_model(self):
         """
         CP-SAT modeli oluşturur
         """
         try:
             # Yeni model oluştur
+            baslangic = time.time()
             self.model = cp_model.CpModel()
+            self.ipucu_tamamlanacak = False
+            self.ogretmen_doluluklari = {}
+            self.kisit_gruplari = {}
+            self.kurma_profili = []
+            self._kurma_derinligi = 0
+            
+            # Değişken alanlarını daralt
+            self.compute_domains()
             
             # Değişkenleri oluştur
             self.create_variables()
@@ -146,8 +440,17 @@ class ProgramOlusturucu:
             # Kısıtları ekle
             self.add_constraints()
             
-            # Amaç fonksiyonunu ekle
-            self.add_objective()
+            # Açıklama modunda yalnızca uygunluk aranır, amaç ve ipuçları eklenmez
+            if not self.aciklama_modu:
+                # Amaç fonksiyonunu ekle
+                self.add_objective()
+                
+                # Mevcut programı çözüm ipucu olarak ver
+                if self.sicak_baslangic:
+                    self.add_solution_hints()
+            
+            # Kurma profili ayrıştırılabilir tek satırlık bir kayıt olarak yazılır
+            self.logger.info(profil_kaydi(self.model, self.kurma_profili, time.time() - baslangic))
             
             self.logger.info("Model başarıyla oluşturuldu")
             return True
@@ -155,38 +458,216 @@ class ProgramOlusturucu:
             self.logger.error(f"Model oluşturulurken hata oluştu: {str(e)}")
             raise
     
+    def compute_domains(self):
+        """
+        Her ilişki için izin verilen zaman ve derslik kümelerini hesaplar
+        
+        Öğretmenin uygun olmadığı saatler ve dersin derslik gereksinimi önceden
+        elenir; alan daraltma açıksa create_variables yalnızca kalan hücreler için
+        değişken oluşturur. Alanlar kapasite analizi, derslik eşleştirmesi ve
+        bileşenlere ayırma için her durumda hesaplanır.
+        """
+        iliski_sayisi = len(self.ders_sinif_iliskileri)
+        self.uygun_zamanlar = np.ones((iliski_sayisi, self.gun_sayisi, self.saat_sayisi), dtype=bool)
+        self.uygun_derslikler = np.ones((iliski_sayisi, len(self.derslikler)), dtype=bool)
+        self.ev_dersligi_iliskileri = np.zeros(iliski_sayisi, dtype=bool)
+        
+        # Öğretmenin uygun olmadığı saatler
+        for zaman in self.uygun_olmayan_zamanlar:
+            ogretmen_iliskileri = self.ogretmen_iliskileri.get(zaman["ogretmen_id"], [])
+            gun = zaman["gun"]
+            if ogretmen_iliskileri and 0 <= gun < self.gun_sayisi:
+                self.uygun_zamanlar[ogretmen_iliskileri, gun, zaman["saat_baslangic"]:zaman["saat_bitis"]] = False
+        
+        # Derslik gereksinimi olan dersler yalnızca izinli dersliklerde yapılabilir
+        if self.ozel_derslik_zorunlu:
+            for ders_id, maske in self.ders_derslik_maskeleri.items():
+                iliskiler = self.ders_iliskileri.get(ders_id)
+                if iliskiler:
+                    self.uygun_derslikler[iliskiler] = maske
+        
+        # Ev dersliği modunda özel derslik gerektirmeyen dersler sınıfın kendi dersliğine sabitlenir
+        if self.ev_dersligi_modu:
+            self.ev_dersligi_sabitle()
+        
+        if not self.alan_daraltma:
+            return
+        
+        tam_boyut = iliski_sayisi * self.gun_sayisi * self.saat_sayisi * len(self.derslikler)
+        daraltilmis_boyut = int(self.uygun_zamanlar.sum(axis=(1, 2)) @ self.uygun_derslikler.sum(axis=1))
+        self.logger.info(
+            f"Alan daraltma: {tam_boyut} olası hücreden {daraltilmis_boyut} tanesi kaldı "
+            f"(zaman: {int(self.uygun_zamanlar.sum())}/{self.uygun_zamanlar.size}, "
+            f"derslik: {int(self.uygun_derslikler.sum())}/{self.uygun_derslikler.size})"
+        )
+    
+    def ev_dersligi_sabitle(self):
+        """
+        Ev dersliği olan sınıfların özel derslik gerektirmeyen derslerini o dersliğe sabitler
+        
+        Sabitlenen ilişkilerin izinli derslik kümesi tek elemanlı olur; böylece bu
+        dersler için derslik boyutu ortadan kalkar ve yalnızca zaman değişkenleri
+        oluşturulur. Özel derslik gerektiren dersler ile ev dersliği tanımlanmamış
+        (veya dersliği silinmiş) sınıfların dersleri derslik seçmeye devam eder.
+        """
+        sabitlenen = 0
+        for sinif in self.siniflar:
+            k = self.derslik_indeksleri.get(sinif["ev_derslik_id"])
+            if k is None:
+                continue
+            
+            for r in self.sinif_iliskileri.get(sinif["id"], []):
+                if self._ozel_derslik_gerektirir(self.ders_sinif_iliskileri[r]["ders_id"]):
+                    continue
+                self.uygun_derslikler[r] = False
+                self.uygun_derslikler[r, k] = True
+                self.ev_dersligi_iliskileri[r] = True
+                sabitlenen += 1
+        
+        self.logger.info(f"Ev dersliği: {sabitlenen}/{len(self.ders_sinif_iliskileri)} ilişki sınıfının dersliğine sabitlendi")
+    
+    def _ozel_derslik_gerektirir(self, ders_id):
+        """
+        Dersin özel derslik gerektirip gerektirmediğini döndürür
+        
+        Dersin derslik türü "normal" değilse veya yapılabileceği derslikler
+        tanımlanmışsa ders özel derslik gerektirir (bkz. build_indexes).
+        
+        Args:
+            ders_id (int): Ders ID'si
+            
+        Returns:
+            bool: Özel derslik gerekiyorsa True
+        """
+        return ders_id in self.ders_derslik_maskeleri
+    
+    @kurma_olcumu
     def create_variables(self):
         """
         Model değişkenlerini oluşturur
+        
+        Bir ilişkinin haftalık ders saatleri birbirinin yerine geçebildiği için her
+        (ilişki, gün, saat, derslik) hücresi için tek bir değişken oluşturulur.
+        Değişkenler düz bir listede tutulur; NumPy dizisi her hücre için değişkenin
+        listedeki sırasını (yoksa -1) saklar. Kısıtlar bu dizi dilimlenerek kurulur.
         """
         try:
-            # Her ders-sınıf ilişkisi için değişkenler oluştur
-            for iliski in self.ders_sinif_iliskileri:
-                iliski_id = iliski["id"]
-                sinif_id = iliski["sinif_id"]
-                ogretmen_id = iliski["ogretmen_id"]
-                ders_id = iliski["ders_id"]
-                haftalik_saat = iliski["haftalik_saat"]
-                
-                # Her ders saati için ayrı değişken oluştur
-                for ders_saati in range(haftalik_saat):
-                    for gun in range(self.gun_sayisi):
-                        for saat in range(self.saat_sayisi):
-                            # Derslik değişkenleri
-                            for derslik in self.derslikler:
-                                derslik_id = derslik["id"]
-                                
-                                # Değişken adı: iliski_id_ders_saati_gun_saat_derslik_id
-                                var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                
-                                # Boolean değişken: 1 = bu ders bu gün, saat ve derslikte yapılıyor, 0 = yapılmıyor
-                                self.ders_degiskenleri[var_name] = self.model.NewBoolVar(var_name)
-            
-            self.logger.info(f"{len(self.ders_degiskenleri)} değişken oluşturuldu")
+            # Yalnızca alan daraltmadan geçen hücreler için değişken oluştur
+            if self.iki_asamali:
+                # Birinci aşamada derslik seçilmez, derslik boyutu tek bir yer tutucudur
+                uygun = self.uygun_zamanlar[:, :, :, np.newaxis].copy()
+            elif self.alan_daraltma:
+                uygun = self.uygun_zamanlar[:, :, :, np.newaxis] & self.uygun_derslikler[:, np.newaxis, np.newaxis, :]
+            else:
+                uygun = np.ones(self.uygun_zamanlar.shape + (len(self.derslikler),), dtype=bool)
+                # Ev dersliğine sabitlenen ilişkiler alan daraltma kapalıyken de tek derslikle kurulur
+                uygun[self.ev_dersligi_iliskileri] &= self.uygun_derslikler[self.ev_dersligi_iliskileri][:, np.newaxis, np.newaxis, :]
+            
+            # Onarım modunda sabit ilişkiler yalnızca mevcut hücrelerinde kalabilir
+            if self.sabit_iliskiler is not None:
+                sabit_hucreler = self._model_hucreleri(self.sabit_hucreler)
+                uygun[self.sabit_iliskiler] &= sabit_hucreler[self.sabit_iliskiler]
+            
+            degisken_sayisi = int(uygun.sum())
+            
+            # Boolean değişken: 1 = bu ders bu gün, saat ve derslikte yapılıyor, 0 = yapılmıyor
+            self.degiskenler = [self.model.NewBoolVar("") for _ in range(degisken_sayisi)]
+            self.degisken_indeksleri = np.full(uygun.shape, -1, dtype=np.int32)
+            self.degisken_indeksleri[uygun] = np.arange(degisken_sayisi, dtype=np.int32)
+            
+            self.logger.info(f"{len(self.degiskenler)} değişken oluşturuldu")
         except Exception as e:
             self.logger.error(f"Değişkenler oluşturulurken hata oluştu: {str(e)}")
             raise
     
+    def _model_hucreleri(self, hucreler):
+        """
+        (ilişki, gün, saat, derslik) hücre dizisini değişken dizisinin biçimine getirir
+        
+        İki aşamalı çözümde derslik boyutu tek bir yer tutucu olduğundan hücreler
+        dersliklere göre birleştirilir.
+        
+        Args:
+            hucreler (numpy.ndarray): Derslik boyutu tam olan boolean dizi
+            
+        Returns:
+            numpy.ndarray: Değişken dizisiyle aynı biçimde boolean dizi
+        """
+        if self.iki_asamali:
+            return hucreler.any(axis=3, keepdims=True)
+        return hucreler
+    
+    def _degiskenleri_sec(self, iliski=None, gun=None, saat=None, derslik=None):
+        """
+        Değişken dizisini dilimleyerek seçilen hücrelerdeki değişkenleri döndürür
+        
+        Her boyut için None tüm değerleri seçer; tamsayı, dilim veya liste
+        verilebilir (liste yalnızca tek bir boyutta kullanılmalıdır).
+        
+        Args:
+            iliski (int|list|slice, optional): İlişki sırası
+            gun (int|slice, optional): Gün
+            saat (int|slice, optional): Saat
+            derslik (int|list|slice, optional): Derslik sırası
+            
+        Returns:
+            list: Seçilen BoolVar değişkenleri
+        """
+        secim = tuple(slice(None) if boyut is None else boyut for boyut in (iliski, gun, saat, derslik))
+        indeksler = np.ravel(self.degisken_indeksleri[secim])
+        return [self.degiskenler[i] for i in indeksler[indeksler >= 0]]
+    
+    def iliski_adi(self, iliski):
+        """
+        İlişkiyi kullanıcı mesajlarında kullanılacak biçimde adlandırır
+        
+        Args:
+            iliski (dict): Ders-sınıf ilişkisi
+            
+        Returns:
+            str: "Sınıf-Şube Ders (Öğretmen)" biçiminde ad
+        """
+        return f"{iliski['sinif_adi']}-{iliski['sinif_sube']} {iliski['ders_adi']} ({iliski['ogretmen_adi']})"
+    
+    def _kisit_grubu(self, aciklama):
+        """
+        Açıklama modunda bir kısıt grubu için etkinleştirme değişkeni oluşturur
+        
+        Grubun kısıtları yalnızca bu değişken doğruyken uygulanır; değişkenler
+        çözücüye varsayım olarak verilir ve çakışma çekirdeği bunlar üzerinden bulunur.
+        
+        Args:
+            aciklama (str): Grubun kullanıcıya gösterilecek açıklaması
+            
+        Returns:
+            BoolVar: Etkinleştirme değişkeni, açıklama modu kapalıysa None
+        """
+        if not self.aciklama_modu:
+            return None
+        
+        etkin = self.model.NewBoolVar(f"etkin_{len(self.kisit_gruplari)}")
+        self.kisit_gruplari[etkin.Index()] = (etkin, aciklama)
+        return etkin
+    
+    def _kisit_ekle(self, ifade, etkin=None, kosullar=()):
+        """
+        Kısıtı ekler ve varsa etkinleştirme değişkenine bağlar
+        
+        Args:
+            ifade: Doğrusal kısıt ifadesi
+            etkin (BoolVar, optional): _kisit_grubu() sonucu
+            kosullar (tuple): Kısıtın bağlı olduğu diğer değişkenler
+            
+        Returns:
+            Constraint: Eklenen kısıt
+        """
+        kosullar = list(kosullar) + ([etkin] if etkin is not None else [])
+        kisit = self.model.Add(ifade)
+        if kosullar:
+            kisit.OnlyEnforceIf(kosullar)
+        return kisit
+    
+    @kurma_olcumu
     def add_constraints(self):
         """
         Modele kısıtları ekler
@@ -202,10 +683,16 @@ class ProgramOlusturucu:
             self.add_class_conflicts_constraints()
             
             # Bir derslik aynı anda birden fazla ders için kullanılamaz
-            self.add_classroom_conflicts_constraints()
+            # (iki aşamalı çözümde derslikler sonra atanır, burada yalnızca kapasite aranır)
+            if self.iki_asamali:
+                self.add_room_capacity_constraints()
+            else:
+                self.add_classroom_conflicts_constraints()
             
             # Öğretmenin uygun olmadığı saatlerde ders atanamaz
-            self.add_teacher_unavailability_constraints()
+            # (alan daraltma açıkken bu hücreler için değişken oluşturulmaz)
+            if not self.alan_daraltma:
+                self.add_teacher_unavailability_constraints()
             
             # Öğretmenin günlük maksimum ve minimum ders saati kısıtları
             self.add_teacher_daily_hours_constraints()
@@ -217,160 +704,172 @@ class ProgramOlusturucu:
             self.add_same_course_daily_constraints()
             
             # Özel derslik zorunluluğu
-            if self.ozel_derslik_zorunlu:
+            if self.ozel_derslik_zorunlu and not self.alan_daraltma and not self.iki_asamali:
                 self.add_special_classroom_constraints()
             
             # Blok dersler arka arkaya olmalı
             if self.blok_ders_arka_arkaya:
                 self.add_block_course_constraints()
             
+            # Gereksiz ama geçerli ek kesmeler yayılımı hızlandırır
+            # (açıklama modunda kısıt grupları dışında kaldıkları için eklenmez)
+            if not self.aciklama_modu:
+                if self.kesme_ogretmen_haftalik:
+                    self.add_teacher_weekly_cuts()
+                if self.kesme_sinif_gunluk:
+                    self.add_class_daily_envelope_cuts()
+                if self.kesme_klik:
+                    self.add_conflict_clique_cuts()
+            
             self.logger.info("Kısıtlar başarıyla eklendi")
         except Exception as e:
             self.logger.error(f"Kısıtlar eklenirken hata oluştu: {str(e)}")
             raise
     
+    @kurma_olcumu
+    def add_room_capacity_constraints(self):
+        """
+        İki aşamalı çözümde her saat için derslik türü kapasitelerini uygular
+        
+        İzinli derslik kümesi S'nin alt kümesi olan dersler aynı saatte |S|'den fazla
+        olamaz. Ayrık veya iç içe derslik kümelerinde (normal/özel ayrımı gibi) bu koşul,
+        ikinci aşamadaki derslik eşleştirmesinin her saat için mümkün olmasını sağlar;
+        kümeler çakışırsa solve() gerektiğinde tek aşamalı modele döner.
+        """
+        kumeler = {tuple(satir) for satir in self.uygun_derslikler}
+        kumeler.add(tuple(self.uygun_derslikler.any(axis=0)))
+        
+        for kume in kumeler:
+            kume = np.array(kume, dtype=bool)
+            
+            # İzinli derslikleri tamamen bu küme içinde kalan ilişkiler
+            iliskiler = np.flatnonzero(~(self.uygun_derslikler & ~kume).any(axis=1)).tolist()
+            if len(iliskiler) <= kume.sum():
+                continue
+            
+            adlar = ", ".join(derslik["ad"] for k, derslik in enumerate(self.derslikler) if kume[k])
+            etkin = self._kisit_grubu(f"Derslik kapasitesi ({adlar})")
+            for gun in range(self.gun_sayisi):
+                for saat in range(self.saat_sayisi):
+                    degiskenler = self._degiskenleri_sec(iliski=iliskiler, gun=gun, saat=saat)
+                    if len(degiskenler) > kume.sum():
+                        self._kisit_ekle(sum(degiskenler) <= int(kume.sum()), etkin)
+    
+    @kurma_olcumu
     def add_weekly_hours_constraints(self):
         """
         Her ders-sınıf ilişkisi için haftalık ders saati kadar ders olmalı
         """
-        for iliski in self.ders_sinif_iliskileri:
-            iliski_id = iliski["id"]
-            haftalik_saat = iliski["haftalik_saat"]
+        for r, iliski in enumerate(self.ders_sinif_iliskileri):
+            # Bu ilişki için tüm olası gün, saat ve derslik kombinasyonları
+            iliski_degiskenleri = self._degiskenleri_sec(iliski=r)
             
-            # Her ders saati için değişkenleri topla
-            for ders_saati in range(haftalik_saat):
-                # Bu ders saati için tüm olası gün, saat ve derslik kombinasyonlarını topla
-                ders_saati_degiskenleri = []
-                
-                for gun in range(self.gun_sayisi):
-                    for saat in range(self.saat_sayisi):
-                        for derslik in self.derslikler:
-                            derslik_id = derslik["id"]
-                            var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                            if var_name in self.ders_degiskenleri:
-                                ders_saati_degiskenleri.append(self.ders_degiskenleri[var_name])
-                
-                # Her ders saati tam olarak bir kez yapılmalı
-                self.model.Add(sum(ders_saati_degiskenleri) == 1)
+            # Haftalık ders saati kadar hücre seçilmeli
+            etkin = self._kisit_grubu(f"{self.iliski_adi(iliski)} haftalık {iliski['haftalik_saat']} saat")
+            self._kisit_ekle(sum(iliski_degiskenleri) == iliski["haftalik_saat"], etkin)
     
+    @kurma_olcumu
     def add_teacher_conflicts_constraints(self):
         """
         Bir öğretmen aynı anda birden fazla derse giremez
         """
         # Her öğretmen, gün ve saat için
         for ogretmen in self.ogretmenler:
-            ogretmen_id = ogretmen["id"]
+            ogretmen_iliskileri = self.ogretmen_iliskileri.get(ogretmen["id"], [])
+            if not ogretmen_iliskileri:
+                continue
             
+            etkin = self._kisit_grubu(f"Öğretmen {ogretmen['ad_soyad']} aynı anda tek ders")
             for gun in range(self.gun_sayisi):
                 for saat in range(self.saat_sayisi):
-                    # Bu öğretmenin bu gün ve saatteki tüm olası derslerini bul
-                    ogretmen_ders_degiskenleri = []
-                    
-                    for iliski in self.ders_sinif_iliskileri:
-                        if iliski["ogretmen_id"] == ogretmen_id:
-                            iliski_id = iliski["id"]
-                            haftalik_saat = iliski["haftalik_saat"]
-                            
-                            for ders_saati in range(haftalik_saat):
-                                for derslik in self.derslikler:
-                                    derslik_id = derslik["id"]
-                                    var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                    if var_name in self.ders_degiskenleri:
-                                        ogretmen_ders_degiskenleri.append(self.ders_degiskenleri[var_name])
+                    # Bu öğretmenin bu gün ve saatteki tüm olası dersleri
+                    ogretmen_ders_degiskenleri = self._degiskenleri_sec(iliski=ogretmen_iliskileri, gun=gun, saat=saat)
                     
                     # Öğretmen aynı anda en fazla bir derse girebilir
                     if ogretmen_ders_degiskenleri:
-                        self.model.Add(sum(ogretmen_ders_degiskenleri) <= 1)
+                        self._kisit_ekle(sum(ogretmen_ders_degiskenleri) <= 1, etkin)
     
+    @kurma_olcumu
     def add_class_conflicts_constraints(self):
         """
         Bir sınıf aynı anda birden fazla ders alamaz
         """
         # Her sınıf, gün ve saat için
         for sinif in self.siniflar:
-            sinif_id = sinif["id"]
+            sinif_iliskileri = self.sinif_iliskileri.get(sinif["id"], [])
+            if not sinif_iliskileri:
+                continue
             
+            etkin = self._kisit_grubu(f"Sınıf {sinif['ad']}-{sinif['sube']} aynı anda tek ders")
             for gun in range(self.gun_sayisi):
                 for saat in range(self.saat_sayisi):
-                    # Bu sınıfın bu gün ve saatteki tüm olası derslerini bul
-                    sinif_ders_degiskenleri = []
-                    
-                    for iliski in self.ders_sinif_iliskileri:
-                        if iliski["sinif_id"] == sinif_id:
-                            iliski_id = iliski["id"]
-                            haftalik_saat = iliski["haftalik_saat"]
-                            
-                            for ders_saati in range(haftalik_saat):
-                                for derslik in self.derslikler:
-                                    derslik_id = derslik["id"]
-                                    var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                    if var_name in self.ders_degiskenleri:
-                                        sinif_ders_degiskenleri.append(self.ders_degiskenleri[var_name])
+                    # Bu sınıfın bu gün ve saatteki tüm olası dersleri
+                    sinif_ders_degiskenleri = self._degiskenleri_sec(iliski=sinif_iliskileri, gun=gun, saat=saat)
                     
                     # Sınıf aynı anda en fazla bir ders alabilir
                     if sinif_ders_degiskenleri:
-                        self.model.Add(sum(sinif_ders_degiskenleri) <= 1)
+                        self._kisit_ekle(sum(sinif_ders_degiskenleri) <= 1, etkin)
     
+    @kurma_olcumu
     def add_classroom_conflicts_constraints(self):
         """
         Bir derslik aynı anda birden fazla ders için kullanılamaz
+        
+        Yalnızca tek bir sınıfın kullanabildiği derslikler (ör. başka sınıfın
+        girmediği ev derslikleri) için sınıf çakışması kısıtı yeterlidir, bu
+        derslikler atlanır.
         """
+        sinif_sirasi = np.array([iliski["sinif_id"] for iliski in self.ders_sinif_iliskileri])
+        
         # Her derslik, gün ve saat için
-        for derslik in self.derslikler:
-            derslik_id = derslik["id"]
+        for k, derslik in enumerate(self.derslikler):
+            kullananlar = (self.degisken_indeksleri[:, :, :, k] >= 0).any(axis=(1, 2))
+            if len(set(sinif_sirasi[kullananlar].tolist())) <= 1:
+                continue
             
+            etkin = self._kisit_grubu(f"Derslik {derslik['ad']} aynı anda tek ders")
             for gun in range(self.gun_sayisi):
                 for saat in range(self.saat_sayisi):
-                    # Bu dersliğin bu gün ve saatteki tüm olası derslerini bul
-                    derslik_ders_degiskenleri = []
-                    
-                    for iliski in self.ders_sinif_iliskileri:
-                        iliski_id = iliski["id"]
-                        haftalik_saat = iliski["haftalik_saat"]
-                        
-                        for ders_saati in range(haftalik_saat):
-                            var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                            if var_name in self.ders_degiskenleri:
-                                derslik_ders_degiskenleri.append(self.ders_degiskenleri[var_name])
+                    # Bu dersliğin bu gün ve saatteki tüm olası dersleri
+                    derslik_ders_degiskenleri = self._degiskenleri_sec(gun=gun, saat=saat, derslik=k)
                     
                     # Derslik aynı anda en fazla bir ders için kullanılabilir
                     if derslik_ders_degiskenleri:
-                        self.model.Add(sum(derslik_ders_degiskenleri) <= 1)
+                        self._kisit_ekle(sum(derslik_ders_degiskenleri) <= 1, etkin)
     
+    @kurma_olcumu
     def add_teacher_unavailability_constraints(self):
         """
         Öğretmenin uygun olmadığı saatlerde ders atanamaz
         """
+        ogretmen_adlari = {ogretmen["id"]: ogretmen["ad_soyad"] for ogretmen in self.ogretmenler}
+        gruplar = {}
+        
         # Her uygun olmayan zaman için
         for zaman in self.uygun_olmayan_zamanlar:
-            ogretmen_id = zaman["ogretmen_id"]
+            ogretmen_iliskileri = self.ogretmen_iliskileri.get(zaman["ogretmen_id"], [])
+            if not ogretmen_iliskileri:
+                continue
+            
             gun = zaman["gun"]
-            saat_baslangic = zaman["saat_baslangic"]
-            saat_bitis = zaman["saat_bitis"]
+            if not 0 <= gun < self.gun_sayisi:
+                continue
             
-            # Bu öğretmenin bu zaman aralığındaki tüm olası derslerini bul
-            for saat in range(saat_baslangic, saat_bitis):
-                if saat >= self.saat_sayisi:
-                    continue
-                
-                ogretmen_ders_degiskenleri = []
-                
-                for iliski in self.ders_sinif_iliskileri:
-                    if iliski["ogretmen_id"] == ogretmen_id:
-                        iliski_id = iliski["id"]
-                        haftalik_saat = iliski["haftalik_saat"]
-                        
-                        for ders_saati in range(haftalik_saat):
-                            for derslik in self.derslikler:
-                                derslik_id = derslik["id"]
-                                var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                if var_name in self.ders_degiskenleri:
-                                    ogretmen_ders_degiskenleri.append(self.ders_degiskenleri[var_name])
+            # Aynı öğretmenin aynı gündeki uygun olmayan zamanları tek grup olarak açıklanır
+            anahtar = (zaman["ogretmen_id"], gun)
+            if anahtar not in gruplar:
+                gruplar[anahtar] = self._kisit_grubu(f"Öğretmen {ogretmen_adlari.get(zaman['ogretmen_id'])} {self.gun_adlari[gun]} uygun olmayan saatler")
+            etkin = gruplar[anahtar]
+            
+            # Bu öğretmenin bu zaman aralığındaki tüm olası dersleri
+            for saat in range(zaman["saat_baslangic"], min(zaman["saat_bitis"], self.saat_sayisi)):
+                ogretmen_ders_degiskenleri = self._degiskenleri_sec(iliski=ogretmen_iliskileri, gun=gun, saat=saat)
                 
                 # Bu zaman aralığında ders atanamaz
                 if ogretmen_ders_degiskenleri:
-                    self.model.Add(sum(ogretmen_ders_degiskenleri) == 0)
+                    self._kisit_ekle(sum(ogretmen_ders_degiskenleri) == 0, etkin)
     
+    @kurma_olcumu
     def add_teacher_daily_hours_constraints(self):
         """
         Öğretmenin günlük maksimum ve minimum ders saati kısıtları
@@ -378,28 +877,21 @@ class ProgramOlusturucu:
         # Her öğretmen ve gün için
         for ogretmen in self.ogretmenler:
             ogretmen_id = ogretmen["id"]
+            ogretmen_iliskileri = self.ogretmen_iliskileri.get(ogretmen_id, [])
+            if not ogretmen_iliskileri:
+                continue
             
             for gun in range(self.gun_sayisi):
-                # Bu öğretmenin bu gündeki tüm olası derslerini bul
-                ogretmen_gun_ders_degiskenleri = []
-                
-                for iliski in self.ders_sinif_iliskileri:
-                    if iliski["ogretmen_id"] == ogretmen_id:
-                        iliski_id = iliski["id"]
-                        haftalik_saat = iliski["haftalik_saat"]
-                        
-                        for ders_saati in range(haftalik_saat):
-                            for saat in range(self.saat_sayisi):
-                                for derslik in self.derslikler:
-                                    derslik_id = derslik["id"]
-                                    var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                    if var_name in self.ders_degiskenleri:
-                                        ogretmen_gun_ders_degiskenleri.append(self.ders_degiskenleri[var_name])
+                # Bu öğretmenin bu gündeki tüm olası dersleri
+                ogretmen_gun_ders_degiskenleri = self._degiskenleri_sec(iliski=ogretmen_iliskileri, gun=gun)
                 
                 # Öğretmenin günlük ders saati kısıtları
                 if ogretmen_gun_ders_degiskenleri:
+                    gun_adi = f"Öğretmen {ogretmen['ad_soyad']} {self.gun_adlari[gun]}"
+                    
                     # Maksimum kısıt
-                    self.model.Add(sum(ogretmen_gun_ders_degiskenleri) <= self.ogretmen_gunluk_max)
+                    etkin = self._kisit_grubu(f"{gun_adi} günlük en fazla {self.ogretmen_gunluk_max} saat")
+                    self._kisit_ekle(sum(ogretmen_gun_ders_degiskenleri) <= self.ogretmen_gunluk_max, etkin)
                     
                     # Minimum kısıt - eğer o gün hiç dersi yoksa minimum kısıt uygulanmaz
                     # Bunun için bir boolean değişken kullanılır
@@ -410,41 +902,40 @@ class ProgramOlusturucu:
                     self.model.Add(sum(ogretmen_gun_ders_degiskenleri) > 0).OnlyEnforceIf(has_lessons)
                     
                     # Eğer has_lessons = 1 ise, minimum kısıt uygulanır
-                    self.model.Add(sum(ogretmen_gun_ders_degiskenleri) >= self.ogretmen_gunluk_min).OnlyEnforceIf(has_lessons)
+                    etkin = self._kisit_grubu(f"{gun_adi} ders varsa en az {self.ogretmen_gunluk_min} saat")
+                    self._kisit_ekle(sum(ogretmen_gun_ders_degiskenleri) >= self.ogretmen_gunluk_min, etkin, [has_lessons])
     
+    @kurma_olcumu
     def add_class_daily_hours_constraints(self):
         """
         Sınıfın günlük maksimum ve minimum ders saati kısıtları
         """
         # Her sınıf ve gün için
         for sinif in self.siniflar:
-            sinif_id = sinif["id"]
+            sinif_iliskileri = self.sinif_iliskileri.get(sinif["id"], [])
+            if not sinif_iliskileri:
+                continue
             
             for gun in range(self.gun_sayisi):
-                # Bu sınıfın bu gündeki tüm olası derslerini bul
-                sinif_gun_ders_degiskenleri = []
-                
-                for iliski in self.ders_sinif_iliskileri:
-                    if iliski["sinif_id"] == sinif_id:
-                        iliski_id = iliski["id"]
-                        haftalik_saat = iliski["haftalik_saat"]
-                        
-                        for ders_saati in range(haftalik_saat):
-                            for saat in range(self.saat_sayisi):
-                                for derslik in self.derslikler:
-                                    derslik_id = derslik["id"]
-                                    var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                    if var_name in self.ders_degiskenleri:
-                                        sinif_gun_ders_degiskenleri.append(self.ders_degiskenleri[var_name])
+                # Bu sınıfın bu gündeki tüm olası dersleri
+                sinif_gun_ders_degiskenleri = self._degiskenleri_sec(iliski=sinif_iliskileri, gun=gun)
                 
                 # Sınıfın günlük ders saati kısıtları
+                gun_adi = f"Sınıf {sinif['ad']}-{sinif['sube']} {self.gun_adlari[gun]}"
                 if sinif_gun_ders_degiskenleri:
                     # Maksimum kısıt
-                    self.model.Add(sum(sinif_gun_ders_degiskenleri) <= self.sinif_gunluk_max)
-                    
-                    # Minimum kısıt
-                    self.model.Add(sum(sinif_gun_ders_degiskenleri) >= self.sinif_gunluk_min)
+                    etkin = self._kisit_grubu(f"{gun_adi} günlük en fazla {self.sinif_gunluk_max} saat")
+                    self._kisit_ekle(sum(sinif_gun_ders_degiskenleri) <= self.sinif_gunluk_max, etkin)
+                elif self.sinif_gunluk_min <= 0:
+                    continue
+                
+                # Minimum kısıt (alan daraltmayla o gün hiç değişkeni kalmayan sınıfta da
+                # eklenir; model çözümsüz olur ve grup çakışma çekirdeğinde görünür)
+                toplam = sum(sinif_gun_ders_degiskenleri) if sinif_gun_ders_degiskenleri else self.model.NewConstant(0)
+                etkin = self._kisit_grubu(f"{gun_adi} günlük en az {self.sinif_gunluk_min} saat")
+                self._kisit_ekle(toplam >= self.sinif_gunluk_min, etkin)
     
+    @kurma_olcumu
     def add_same_course_daily_constraints(self):
         """
         Aynı dersin aynı günde maksimum tekrarı
@@ -455,102 +946,172 @@ class ProgramOlusturucu:
             
             # Bu sınıfın aldığı dersleri bul
             sinif_dersleri = {}
-            for iliski in self.ders_sinif_iliskileri:
-                if iliski["sinif_id"] == sinif_id:
-                    ders_id = iliski["ders_id"]
-                    if ders_id not in sinif_dersleri:
-                        sinif_dersleri[ders_id] = []
-                    sinif_dersleri[ders_id].append(iliski)
+            for r in self.sinif_iliskileri.get(sinif_id, []):
+                sinif_dersleri.setdefault(self.ders_sinif_iliskileri[r]["ders_id"], []).append(r)
             
             # Her ders için
             for ders_id, iliskiler in sinif_dersleri.items():
+                ders_adi = self.ders_sinif_iliskileri[iliskiler[0]]["ders_adi"]
+                etkin = self._kisit_grubu(f"Sınıf {sinif['ad']}-{sinif['sube']} {ders_adi} günde en fazla {self.ayni_ders_tekrar} saat")
                 for gun in range(self.gun_sayisi):
-                    # Bu dersin bu gündeki tüm olası saatlerini bul
-                    ders_gun_degiskenleri = []
-                    
-                    for iliski in iliskiler:
-                        iliski_id = iliski["id"]
-                        haftalik_saat = iliski["haftalik_saat"]
-                        
-                        for ders_saati in range(haftalik_saat):
-                            for saat in range(self.saat_sayisi):
-                                for derslik in self.derslikler:
-                                    derslik_id = derslik["id"]
-                                    var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                    if var_name in self.ders_degiskenleri:
-                                        ders_gun_degiskenleri.append(self.ders_degiskenleri[var_name])
+                    # Bu dersin bu gündeki tüm olası saatleri
+                    ders_gun_degiskenleri = self._degiskenleri_sec(iliski=iliskiler, gun=gun)
                     
                     # Aynı dersin aynı günde maksimum tekrarı
                     if ders_gun_degiskenleri:
-                        self.model.Add(sum(ders_gun_degiskenleri) <= self.ayni_ders_tekrar)
+                        self._kisit_ekle(sum(ders_gun_degiskenleri) <= self.ayni_ders_tekrar, etkin)
     
+    @kurma_olcumu
     def add_special_classroom_constraints(self):
         """
         Özel derslik zorunluluğu
         """
-        # Özel derslikler
-        ozel_derslikler = [derslik for derslik in self.derslikler if derslik["tur"] == "ozel"]
-        ozel_derslik_ids = [derslik["id"] for derslik in ozel_derslikler]
-        
-        # Normal derslikler
-        normal_derslikler = [derslik for derslik in self.derslikler if derslik["tur"] == "normal"]
-        normal_derslik_ids = [derslik["id"] for derslik in normal_derslikler]
-        
-        # Her ders-sınıf ilişkisi için
-        for iliski in self.ders_sinif_iliskileri:
-            iliski_id = iliski["id"]
-            ders_id = iliski["ders_id"]
-            haftalik_saat = iliski["haftalik_saat"]
-            
-            # Dersin özel derslik gerektirip gerektirmediğini belirle
-            # Burada basit bir örnek olarak, ders adında "lab" geçen dersler özel derslik gerektirir varsayalım
-            ders = next((d for d in self.dersler if d["id"] == ders_id), None)
-            if ders and ("lab" in ders["ad"].lower() or "laboratuvar" in ders["ad"].lower()):
-                # Bu ders özel derslik gerektirir
-                for ders_saati in range(haftalik_saat):
-                    for gun in range(self.gun_sayisi):
-                        for saat in range(self.saat_sayisi):
-                            # Normal dersliklerdeki değişkenleri bul
-                            normal_derslik_degiskenleri = []
-                            for derslik_id in normal_derslik_ids:
-                                var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                if var_name in self.ders_degiskenleri:
-                                    normal_derslik_degiskenleri.append(self.ders_degiskenleri[var_name])
-                            
-                            # Normal dersliklerde bu ders yapılamaz
-                            if normal_derslik_degiskenleri:
-                                self.model.Add(sum(normal_derslik_degiskenleri) == 0)
+        # Derslik gereksinimi olan her ders ve o dersin ilişkileri için
+        for ders_id, maske in self.ders_derslik_maskeleri.items():
+            iliskiler = self.ders_iliskileri.get(ders_id)
+            if not iliskiler:
+                continue
+            
+            # İzin verilmeyen dersliklerin sıraları
+            yasak_derslikler = np.flatnonzero(~maske).tolist()
+            etkin = self._kisit_grubu(f"{self.ders_sozlugu[ders_id]['ad']} özel derslikte yapılmalı")
+            for r in iliskiler:
+                # İzin verilmeyen dersliklerdeki değişkenler
+                yasak_derslik_degiskenleri = self._degiskenleri_sec(iliski=r, derslik=yasak_derslikler)
+                
+                # Bu dersliklerde bu ders yapılamaz
+                if yasak_derslik_degiskenleri:
+                    self._kisit_ekle(sum(yasak_derslik_degiskenleri) == 0, etkin)
     
+    @kurma_olcumu
     def add_block_course_constraints(self):
         """
         Blok dersler arka arkaya olmalı
+        
+        Bir ilişkinin aynı gündeki dersleri en fazla max_blok_ders saatlik tek bir
+        blok oluşturur ve blok boyunca aynı derslikte yapılır. Her (gün, saat, uzunluk)
+        için bir blok başlangıcı değişkeni tutulur; yalnızca tüm saatleri uygun olan
+        başlangıçlar oluşturulur. Her saatteki ders sayısı o saati kapsayan
+        başlangıçların toplamına eşittir, böylece haftalık ders saati bloklara bölünür.
+        Derslik birliği saat bazında değil, (gün, derslik) başına tek bir kısıtla sağlanır.
         """
         # Her ders-sınıf ilişkisi için
-        for iliski in self.ders_sinif_iliskileri:
+        for r, iliski in enumerate(self.ders_sinif_iliskileri):
+            # Eğer haftalık ders saati 1'den fazla ise
+            if iliski["haftalik_saat"] <= 1:
+                continue
+            
             iliski_id = iliski["id"]
-            haftalik_saat = iliski["haftalik_saat"]
+            en_uzun = max(1, min(self.max_blok_ders, iliski["haftalik_saat"], self.saat_sayisi))
+            etkin = self._kisit_grubu(f"{self.iliski_adi(iliski)} en fazla {en_uzun} saatlik blok ders")
+            for gun in range(self.gun_sayisi):
+                # Bu ilişkinin bu gün değişkeni olan saatleri
+                uygun = (self.degisken_indeksleri[r, gun] >= 0).any(axis=1)
+                if not uygun.any():
+                    continue
+                
+                # Blok başlangıçları: (saat, uzunluk) -> BoolVar
+                baslangiclar = {}
+                for saat in range(self.saat_sayisi):
+                    for uzunluk in range(1, min(en_uzun, self.saat_sayisi - saat) + 1):
+                        if not uygun[saat:saat + uzunluk].all():
+                            break
+                        baslangiclar[(saat, uzunluk)] = self.model.NewBoolVar(f"iliski_{iliski_id}_gun_{gun}_saat_{saat}_blok_{uzunluk}")
+                
+                # Gün içinde en fazla bir blok
+                self._kisit_ekle(sum(baslangiclar.values()) <= 1, etkin)
+                
+                # Her saatteki ders, o saati kapsayan blok başlangıçlarıyla birebir örtüşür
+                for saat in np.flatnonzero(uygun):
+                    kapsayanlar = [var for (bas, uzunluk), var in baslangiclar.items() if bas <= saat < bas + uzunluk]
+                    self._kisit_ekle(sum(self._degiskenleri_sec(iliski=r, gun=gun, saat=int(saat))) == sum(kapsayanlar), etkin)
+                
+                # Blok boyunca aynı derslik: gün içinde en fazla bir derslik kullanılır
+                # (iki aşamalı çözümde derslik eşleştirmesi blokları mümkünse tek derslikte tutar)
+                if self.iki_asamali:
+                    continue
+                derslikler = np.flatnonzero((self.degisken_indeksleri[r, gun] >= 0).any(axis=0))
+                if len(derslikler) <= 1:
+                    continue
+                secimler = []
+                for k in derslikler:
+                    secim = self.model.NewBoolVar(f"iliski_{iliski_id}_gun_{gun}_derslik_{k}")
+                    self._kisit_ekle(sum(self._degiskenleri_sec(iliski=r, gun=gun, derslik=int(k))) <= en_uzun * secim, etkin)
+                    secimler.append(secim)
+                self._kisit_ekle(sum(secimler) <= 1, etkin)
+    
+    @kurma_olcumu
+    def add_teacher_weekly_cuts(self):
+        """
+        Ek kesme: öğretmenin haftalık toplam dersi, ilişkilerinin haftalık saatleri toplamına eşittir
+        
+        İlişki başına haftalık saat kısıtlarının toplamı olduğundan geçerlidir;
+        çözücüye öğretmen bazında tek bir toplam vererek yayılımı hızlandırır.
+        """
+        for ogretmen_id, iliskiler in self.ogretmen_iliskileri.items():
+            if len(iliskiler) <= 1:
+                continue
+            toplam = sum(self.ders_sinif_iliskileri[r]["haftalik_saat"] for r in iliskiler)
+            self.model.Add(sum(self._degiskenleri_sec(iliski=iliskiler)) == toplam)
+    
+    @kurma_olcumu
+    def add_class_daily_envelope_cuts(self):
+        """
+        Ek kesme: sınıfın haftalık toplamı ve günlük ders saati zarfları
+        
+        Sınıfın haftalık toplamı W, günlük alt ve üst sınırlar a_g ve u_g ise her
+        gün için W - Σ(diğer günlerin u) ≤ gün toplamı ≤ W - Σ(diğer günlerin a)
+        olmalıdır. u_g, sınıfın o gün değişkeni olan saat sayısıyla da sınırlanır.
+        Yalnızca mevcut günlük sınırlardan sıkı olan zarflar eklenir.
+        """
+        for sinif in self.siniflar:
+            iliskiler = self.sinif_iliskileri.get(sinif["id"], [])
+            if not iliskiler:
+                continue
             
-            # Eğer haftalık ders saati 1'den fazla ise
-            if haftalik_saat > 1:
-                # Her gün için
-                for gun in range(self.gun_sayisi):
-                    # Her ders saati için (son ders saati hariç)
-                    for ders_saati in range(haftalik_saat - 1):
-                        # Bu ders saatinin yapıldığı saat ve derslik
-                        for saat in range(self.saat_sayisi - 1):  # Son saatte blok ders başlayamaz
-                            for derslik in self.derslikler:
-                                derslik_id = derslik["id"]
-                                var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                
-                                if var_name in self.ders_degiskenleri:
-                                    # Bir sonraki ders saatinin aynı gün, bir sonraki saat ve aynı derslikte olması gerekir
-                                    next_var_name = f"{iliski_id}_{ders_saati+1}_{gun}_{saat+1}_{derslik_id}"
-                                    
-                                    if next_var_name in self.ders_degiskenleri:
-                                        # Eğer bu ders saati bu gün, saat ve derslikte yapılıyorsa,
-                                        # bir sonraki ders saati de bir sonraki saatte aynı derslikte yapılmalı
-                                        self.model.Add(self.ders_degiskenleri[next_var_name] >= self.ders_degiskenleri[var_name])
+            haftalik = sum(self.ders_sinif_iliskileri[r]["haftalik_saat"] for r in iliskiler)
+            self.model.Add(sum(self._degiskenleri_sec(iliski=iliskiler)) == haftalik)
+            
+            # Günlük sınırlar (değişkeni olmayan günlerde alt sınır uygulanmaz)
+            saatler = (self.degisken_indeksleri[iliskiler] >= 0).any(axis=(0, 3)).sum(axis=1)
+            ust = np.minimum(saatler, self.sinif_gunluk_max)
+            alt = np.where(saatler > 0, min(self.sinif_gunluk_min, self.sinif_gunluk_max), 0)
+            
+            for gun in range(self.gun_sayisi):
+                if saatler[gun] == 0:
+                    continue
+                gun_degiskenleri = self._degiskenleri_sec(iliski=iliskiler, gun=gun)
+                
+                en_az = haftalik - int(ust.sum() - ust[gun])
+                if en_az > alt[gun]:
+                    self.model.Add(sum(gun_degiskenleri) >= en_az)
+                
+                en_fazla = haftalik - int(alt.sum() - alt[gun])
+                if en_fazla < ust[gun]:
+                    self.model.Add(sum(gun_degiskenleri) <= en_fazla)
+    
+    @kurma_olcumu
+    def add_conflict_clique_cuts(self):
+        """
+        Ek kesme: çakışma grafındaki kliklerin her saat için AddAtMostOne kısıtı
+        
+        İlişkiler öğretmen veya sınıf paylaştıklarında çakışır. Bu graf, öğretmen-sınıf
+        iki parçalı grafının kenar grafı olduğundan en büyük klikleri tam olarak bir
+        öğretmenin ve bir sınıfın ilişkileridir. Bu klikler her (gün, saat) için doğrusal
+        toplam yerine doğrudan AddAtMostOne olarak verilir; çözücü bunları ön işlemede
+        aramak zorunda kalmaz ve klik kısıtı olarak yayar.
+        """
+        klikler = [iliskiler for iliskiler in self.ogretmen_iliskileri.values() if len(iliskiler) > 1]
+        klikler += [iliskiler for iliskiler in self.sinif_iliskileri.values() if len(iliskiler) > 1]
+        
+        for iliskiler in klikler:
+            for gun in range(self.gun_sayisi):
+                for saat in range(self.saat_sayisi):
+                    degiskenler = self._degiskenleri_sec(iliski=iliskiler, gun=gun, saat=saat)
+                    if len(degiskenler) > 1:
+                        self.model.AddAtMostOne(degiskenler)
     
+    @kurma_olcumu
     def add_objective(self):
         """
         Amaç fonksiyonunu ekler
@@ -560,15 +1121,20 @@ class ProgramOlusturucu:
             objective_terms = []
             
             # 1. Öğretmen boş saat minimizasyonu/maksimizasyonu
-            if self.ogretmen_bos_saat_tercihi == "minimize":
-                objective_terms.extend(self.get_teacher_idle_hours_terms(minimize=True))
+            minimize = self.ogretmen_bos_saat_tercihi == "minimize"
+            if self.bos_saat_modeli == "klasik":
+                objective_terms.extend(self.get_teacher_idle_hours_terms(minimize=minimize))
             else:
-                objective_terms.extend(self.get_teacher_idle_hours_terms(minimize=False))
+                objective_terms.extend(self.get_compact_teacher_idle_hours_terms(minimize=minimize))
             
-            # 2. Derslik değişim minimizasyonu
-            if self.derslik_degisim_minimize:
+            # 2. Derslik değişim minimizasyonu (iki aşamalı çözümde ikinci aşamada yapılır)
+            if self.derslik_degisim_minimize and not self.iki_asamali:
                 objective_terms.extend(self.get_classroom_change_terms())
             
+            # 3. Onarım modunda yayımlanmış programdan sapma
+            if self.onceki_hucreler is not None:
+                objective_terms.extend(self.get_repair_deviation_terms())
+            
             # Amaç fonksiyonunu ekle
             if objective_terms:
                 self.model.Minimize(sum(objective_terms))
@@ -578,6 +1144,7 @@ class ProgramOlusturucu:
             self.logger.error(f"Amaç fonksiyonu eklenirken hata oluştu: {str(e)}")
             raise
     
+    @kurma_olcumu
     def get_teacher_idle_hours_terms(self, minimize=True):
         """
         Öğretmen boş saat terimlerini döndürür
@@ -593,25 +1160,14 @@ class ProgramOlusturucu:
         # Her öğretmen ve gün için
         for ogretmen in self.ogretmenler:
             ogretmen_id = ogretmen["id"]
+            ogretmen_iliskileri = self.ogretmen_iliskileri.get(ogretmen_id, [])
             
             for gun in range(self.gun_sayisi):
                 # Bu öğretmenin bu gündeki her saat için ders değişkenleri
                 ogretmen_saat_degiskenleri = {}
                 
                 for saat in range(self.saat_sayisi):
-                    ogretmen_saat_degiskenleri[saat] = []
-                    
-                    for iliski in self.ders_sinif_iliskileri:
-                        if iliski["ogretmen_id"] == ogretmen_id:
-                            iliski_id = iliski["id"]
-                            haftalik_saat = iliski["haftalik_saat"]
-                            
-                            for ders_saati in range(haftalik_saat):
-                                for derslik in self.derslikler:
-                                    derslik_id = derslik["id"]
-                                    var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                    if var_name in self.ders_degiskenleri:
-                                        ogretmen_saat_degiskenleri[saat].append(self.ders_degiskenleri[var_name])
+                    ogretmen_saat_degiskenleri[saat] = self._degiskenleri_sec(iliski=ogretmen_iliskileri, gun=gun, saat=saat) if ogretmen_iliskileri else []
                 
                 # Öğretmenin ilk ve son dersi arasındaki boş saatleri hesapla
                 # İlk ders saati
@@ -742,144 +1298,817 @@ class ProgramOlusturucu:
         
         return terms
     
-    def get_classroom_change_terms(self):
+    def _ogretmen_dolulugu(self, ogretmen_id, gun):
         """
-        Derslik değişim terimlerini döndürür
+        Öğretmenin bir gündeki saat bazında doluluk değişkenlerini döndürür
+        
+        Öğretmen çakışma kısıtı nedeniyle her saatteki ders toplamı 0 veya 1 olduğundan
+        doluluk değişkeni doğrudan bu toplama eşitlenir. Değişkenler önbelleğe alınır
+        ve farklı amaç terimleri tarafından paylaşılır.
         
+        Args:
+            ogretmen_id (int): Öğretmen ID'si
+            gun (int): Gün
+            
         Returns:
-            list: Amaç fonksiyonu terimleri
+            list: Her saat için BoolVar
         """
-        terms = []
+        anahtar = (ogretmen_id, gun)
+        if anahtar not in self.ogretmen_doluluklari:
+            ogretmen_iliskileri = self.ogretmen_iliskileri.get(ogretmen_id, [])
+            doluluk = []
+            for saat in range(self.saat_sayisi):
+                dolu = self.model.NewBoolVar(f"ogretmen_{ogretmen_id}_gun_{gun}_saat_{saat}_dolu")
+                self.model.Add(dolu == sum(self._degiskenleri_sec(iliski=ogretmen_iliskileri, gun=gun, saat=saat)))
+                doluluk.append(dolu)
+            self.ogretmen_doluluklari[anahtar] = doluluk
+        return self.ogretmen_doluluklari[anahtar]
+    
+    @kurma_olcumu
+    def get_compact_teacher_idle_hours_terms(self, minimize=True):
+        """
+        Öğretmen boş saat terimlerini doğrusal boyutlu modelle döndürür
         
-        # Her sınıf ve gün için
-        for sinif in self.siniflar:
-            sinif_id = sinif["id"]
-            
+        Her öğretmen ve gün için "başladı" (bu saate kadar ders oldu) ve "bitmedi"
+        (bu saatte veya sonra ders var) zincirleri kurulur. İkisinin de doğru olduğu
+        saatler ilk ve son ders arasındaki aralıktır; boş saat sayısı bu aralığın
+        uzunluğundan ders sayısının çıkarılmasıyla bulunur.
+        
+        Args:
+            minimize (bool): True ise boş saatler minimize edilir, False ise maximize edilir
+            
+        Returns:
+            list: Amaç fonksiyonu terimleri
+        """
+        terms = []
+        
+        # Her öğretmen ve gün için
+        for ogretmen in self.ogretmenler:
+            ogretmen_id = ogretmen["id"]
+            if not self.ogretmen_iliskileri.get(ogretmen_id):
+                continue
+            
             for gun in range(self.gun_sayisi):
-                # Bu sınıfın bu gündeki her saat için derslik değişkenleri
-                sinif_saat_derslik = {}
+                dolu = self._ogretmen_dolulugu(ogretmen_id, gun)
                 
+                basladi = [self.model.NewBoolVar(f"ogretmen_{ogretmen_id}_gun_{gun}_saat_{saat}_basladi") for saat in range(self.saat_sayisi)]
+                bitmedi = [self.model.NewBoolVar(f"ogretmen_{ogretmen_id}_gun_{gun}_saat_{saat}_bitmedi") for saat in range(self.saat_sayisi)]
+                aralikta = [self.model.NewBoolVar(f"ogretmen_{ogretmen_id}_gun_{gun}_saat_{saat}_aralikta") for saat in range(self.saat_sayisi)]
+                
+                # basladi[saat] = basladi[saat - 1] VEYA dolu[saat]
+                self.model.Add(basladi[0] == dolu[0])
+                for saat in range(1, self.saat_sayisi):
+                    self.model.Add(basladi[saat] >= basladi[saat - 1])
+                    self.model.Add(basladi[saat] >= dolu[saat])
+                    self.model.Add(basladi[saat] <= basladi[saat - 1] + dolu[saat])
+                
+                # bitmedi[saat] = bitmedi[saat + 1] VEYA dolu[saat]
+                son = self.saat_sayisi - 1
+                self.model.Add(bitmedi[son] == dolu[son])
+                for saat in range(son - 1, -1, -1):
+                    self.model.Add(bitmedi[saat] >= bitmedi[saat + 1])
+                    self.model.Add(bitmedi[saat] >= dolu[saat])
+                    self.model.Add(bitmedi[saat] <= bitmedi[saat + 1] + dolu[saat])
+                
+                # aralikta[saat] = basladi[saat] VE bitmedi[saat]
                 for saat in range(self.saat_sayisi):
-                    sinif_saat_derslik[saat] = {}
-                    
-                    for derslik in self.derslikler:
-                        derslik_id = derslik["id"]
-                        sinif_saat_derslik[saat][derslik_id] = []
-                        
-                        for iliski in self.ders_sinif_iliskileri:
-                            if iliski["sinif_id"] == sinif_id:
-                                iliski_id = iliski["id"]
-                                haftalik_saat = iliski["haftalik_saat"]
-                                
-                                for ders_saati in range(haftalik_saat):
-                                    var_name = f"{iliski_id}_{ders_saati}_{gun}_{saat}_{derslik_id}"
-                                    if var_name in self.ders_degiskenleri:
-                                        sinif_saat_derslik[saat][derslik_id].append(self.ders_degiskenleri[var_name])
-                
-                # Her saat için derslik değişimi hesapla
+                    self.model.Add(aralikta[saat] <= basladi[saat])
+                    self.model.Add(aralikta[saat] <= bitmedi[saat])
+                    self.model.Add(aralikta[saat] >= basladi[saat] + bitmedi[saat] - 1)
+                
+                # Boş saat sayısı = aralık uzunluğu - ders sayısı
+                bos_saat_sayisi = sum(aralikta) - sum(dolu)
+                
+                # Amaç fonksiyonuna ekle (maksimize etmek için negatif)
+                terms.append(bos_saat_sayisi if minimize else -bos_saat_sayisi)
+        
+        return terms
+    
+    @kurma_olcumu
+    def get_classroom_change_terms(self):
+        """
+        Derslik değişim terimlerini döndürür
+        
+        Her sınıf, gün ve saat geçişi için tek bir değişim değişkeni oluşturulur.
+        Sınıf önceki saatte bir derslikteyken bu saatte ders alıp aynı derslikte
+        değilse değişim değişkeni 1 olmaya zorlanır (derslik başına bir kısıt).
+        
+        Returns:
+            list: Amaç fonksiyonu terimleri
+        """
+        terms = []
+        
+        # Her sınıf ve gün için
+        for sinif in self.siniflar:
+            sinif_id = sinif["id"]
+            sinif_iliskileri = self.sinif_iliskileri.get(sinif_id, [])
+            if not sinif_iliskileri:
+                continue
+            
+            for gun in range(self.gun_sayisi):
+                # Sınıfın her saat ve derslikteki doluluğu (sınıf çakışması nedeniyle 0 veya 1)
+                derslikte = [
+                    [sum(self._degiskenleri_sec(iliski=sinif_iliskileri, gun=gun, saat=saat, derslik=k)) for k in range(len(self.derslikler))]
+                    for saat in range(self.saat_sayisi)
+                ]
+                
+                # Her saat geçişi için derslik değişimi hesapla
                 for saat in range(1, self.saat_sayisi):
-                    # Önceki saatteki derslik
-                    for prev_derslik in self.derslikler:
-                        prev_derslik_id = prev_derslik["id"]
-                        
-                        # Bu saatteki derslik
-                        for curr_derslik in self.derslikler:
-                            curr_derslik_id = curr_derslik["id"]
-                            
-                            # Eğer derslik değişimi varsa
-                            if prev_derslik_id != curr_derslik_id:
-                                # Önceki saatte bu derslikte ders var mı?
-                                prev_derslik_vars = sinif_saat_derslik[saat-1].get(prev_derslik_id, [])
-                                
-                                # Bu saatte bu derslikte ders var mı?
-                                curr_derslik_vars = sinif_saat_derslik[saat].get(curr_derslik_id, [])
-                                
-                                if prev_derslik_vars and curr_derslik_vars:
-                                    # Derslik değişimi var mı?
-                                    has_change = self.model.NewBoolVar(f"sinif_{sinif_id}_gun_{gun}_saat_{saat}_derslik_degisimi_{prev_derslik_id}_{curr_derslik_id}")
-                                    
-                                    # Eğer önceki saatte bu derslikte ve bu saatte diğer derslikte ders varsa, değişim var
-                                    self.model.Add(sum(prev_derslik_vars) > 0).OnlyEnforceIf(has_change)
-                                    self.model.Add(sum(curr_derslik_vars) > 0).OnlyEnforceIf(has_change)
-                                    
-                                    # Amaç fonksiyonuna ekle
-                                    terms.append(has_change)
+                    # Bu saatte sınıfın dersi var mı?
+                    ders_var = sum(derslikte[saat])
+                    if isinstance(ders_var, int):
+                        continue
+                    
+                    has_change = self.model.NewBoolVar(f"sinif_{sinif_id}_gun_{gun}_saat_{saat}_derslik_degisimi")
+                    
+                    # Önceki saatte k dersliğinde ders vardı ve bu saatteki ders k dersliğinde değilse değişim var
+                    for k in range(len(self.derslikler)):
+                        if isinstance(derslikte[saat - 1][k], int):
+                            continue
+                        self.model.Add(has_change >= derslikte[saat - 1][k] + ders_var - derslikte[saat][k] - 1)
+                    
+                    # Amaç fonksiyonuna ekle
+                    terms.append(has_change)
         
         return terms
     
-    def solve(self):
+    @kurma_olcumu
+    def get_repair_deviation_terms(self):
+        """
+        Onarım modunda serbest ilişkilerin önceki hücrelerinden ayrılmasını cezalandıran terimleri döndürür
+        
+        Returns:
+            list: Amaç fonksiyonu terimleri
+        """
+        indeksler = self.degisken_indeksleri[self._model_hucreleri(self.onceki_hucreler)]
+        korunabilir = [self.degiskenler[i] for i in indeksler[indeksler >= 0]]
+        if not korunabilir:
+            return []
+        
+        # Önceki yerinde kalmayan her ders saati için ceza
+        return [self.onarim_sapma_agirligi * (len(korunabilir) - sum(korunabilir))]
+    
+    def mevcut_atamalar(self):
+        """
+        Mevcut program kayıtlarını model indekslerine çevirir
+        
+        Kayıtlar ders, sınıf ve öğretmen üçlüsüyle ilişkilere eşlenir. İlişkisi
+        silinmiş, dersliği olmayan veya artık izin verilmeyen hücreye düşen
+        kayıtlar atlanır. compute_domains'ten sonra çağrılmalıdır.
+        
+        Returns:
+            list: (ilişki, gün, saat, derslik) indeks demetleri
+        """
+        iliski_indeksleri = {
+            (iliski["ders_id"], iliski["sinif_id"], iliski["ogretmen_id"]): r
+            for r, iliski in enumerate(self.ders_sinif_iliskileri)
+        }
+        atamalar = []
+        for kayit in self.mevcut_program:
+            r = iliski_indeksleri.get((kayit["ders_id"], kayit["sinif_id"], kayit["ogretmen_id"]))
+            k = self.derslik_indeksleri.get(kayit["derslik_id"])
+            gun, saat = kayit["gun"], kayit["saat"]
+            
+            if r is None or k is None or not (0 <= gun < self.gun_sayisi and 0 <= saat < self.saat_sayisi):
+                continue
+            if not (self.uygun_zamanlar[r, gun, saat] and self.uygun_derslikler[r, k]):
+                continue
+            
+            atamalar.append((r, gun, saat, k))
+        
+        return atamalar
+    
+    @kurma_olcumu
+    def add_solution_hints(self):
+        """
+        Mevcut programı çözücüye başlangıç ipucu (AddHint) olarak ekler
+        
+        Programda yeri olan her ilişkinin tüm değişkenlerine ipucu verilir: programdaki
+        hücreler 1, diğerleri 0. Programda hiç yeri olmayan (yeni eklenmiş) ilişkiler
+        ipucusuz bırakılır, çözücü onları serbestçe yerleştirir. Kullanılabilir program
+        yoksa ve ayar açıksa sezgisel taslak ipucu olarak kullanılır.
+        """
+        try:
+            atamalar = self.mevcut_atamalar()
+            if not atamalar and self.sezgisel_ipucu:
+                atamalar, _ = HizliProgramOlusturucu(self).olustur()
+                self.logger.info("Mevcut program olmadığı için sezgisel taslak ipucu olarak kullanılacak")
+            
+            if not atamalar:
+                self.logger.info("Sıcak başlangıç için kullanılabilir program kaydı yok")
+                return
+            
+            secili = np.zeros((len(self.ders_sinif_iliskileri), self.gun_sayisi, self.saat_sayisi, len(self.derslikler)), dtype=bool)
+            secili[tuple(np.array(atamalar).T)] = True
+            secili = self._model_hucreleri(secili)
+            
+            ipuclu_iliskiler = np.unique([r for r, _, _, _ in atamalar])
+            indeksler = self.degisken_indeksleri[ipuclu_iliskiler]
+            gecerli = indeksler >= 0
+            degerler = secili[ipuclu_iliskiler][gecerli]
+            
+            for indeks, deger in zip(indeksler[gecerli], degerler):
+                self.model.AddHint(self.degiskenler[indeks], bool(deger))
+            
+            self.logger.info(f"Sıcak başlangıç: {len(atamalar)} ders saati {len(ipuclu_iliskiler)} ilişki için ipucu olarak eklendi")
+            
+            # İpucu, süresi model kurmaya sayılmasın diye solve() başında tamamlanır
+            self.ipucu_tamamlanacak = True
+        except Exception as e:
+            self.logger.error(f"Çözüm ipuçları eklenirken hata oluştu: {str(e)}")
+            raise
+    
+    def ipucunu_tamamla(self):
+        """
+        Ders değişkenlerine verilen ipucunu tüm model değişkenlerine genişletir
+        
+        CP-SAT, yalnızca ders değişkenlerini kapsayan ipucunu blok ve boş saat gibi
+        yardımcı değişkenlerle tamamlayamadığında ipucunu kullanmadan aramaya
+        başlar. Bu nedenle ipucu değerleri sabitlenmiş model kopyası kısa bir süre
+        çözülür ve bulunan ilk çözüm tüm değişkenler için ipucu olarak verilir.
+        Kopya çözülemezse mevcut ipucu olduğu gibi bırakılır. solve() tarafından
+        çağrılır; kopyanın çözücüsü self.solver olduğundan durdur() ile kesilebilir.
+        """
+        self.ipucu_tamamlanacak = False
+        if self.durdurma_istendi:
+            return
+        
+        baslangic = time.time()
+        proto = self.model.Proto()
+        kopya = self.model.Clone()
+        for indeks, deger in zip(proto.solution_hint.vars, proto.solution_hint.values):
+            kopya.Add(kopya.GetIntVarFromProtoIndex(indeks) == deger)
+        
+        cozucu = self.solver = cp_model.CpSolver()
+        cozucu.parameters.max_time_in_seconds = min(10, self.algoritma_sure_siniri / 10)
+        cozucu.parameters.stop_after_first_solution = True
+        durum = cozucu.Solve(kopya)
+        
+        if self.durdurma_istendi:
+            self.logger.info("İpucu tamamlama iptal edildi")
+            return
+        
+        if durum not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            self.logger.info(f"İpucu tamamlanamadı ({cozucu.StatusName(durum)}), yalnızca ders değişkenleri için ipucu verildi")
+            return
+        
+        self.model.ClearHints()
+        for indeks in range(len(proto.variables)):
+            degisken = self.model.GetIntVarFromProtoIndex(indeks)
+            self.model.AddHint(degisken, cozucu.Value(kopya.GetIntVarFromProtoIndex(indeks)))
+        
+        self.logger.info(f"İpucu {len(proto.variables)} değişkene {time.time() - baslangic:.2f} saniyede tamamlandı")
+    
+    def solve(self, ilerleme_geri_cagirma=None):
         """
         Modeli çözer
         
+        Args:
+            ilerleme_geri_cagirma (callable, optional): Her iyileşen çözümde çözüm bilgileriyle
+                (amaç, en iyi sınır, fark, geçen süre) çağrılan fonksiyon
+                
         Returns:
             bool: Çözüm bulundu mu?
         """
         try:
+            self.cozum = None
+            self.son_durum = None
+            self.eslestirilen_atamalar = None
+            
+            # Sıcak başlangıç ipucunu tüm değişkenlere genişlet
+            if self.ipucu_tamamlanacak:
+                self.ipucunu_tamamla()
+            
             # Çözücüyü oluştur
             self.solver = cp_model.CpSolver()
             
-            # Zaman sınırı
-            self.solver.parameters.max_time_in_seconds = self.algoritma_sure_siniri
+            # Zaman sınırı ve çözücü ayarları
+            self.apply_solver_parameters()
+            
+            # Çözüm izleyicisi
+            self.izleyici = CozumIzleyici(ilerleme_geri_cagirma)
+            
+            # Model kurulurken iptal istendiyse çözmeye başlama
+            if self.durdurma_istendi:
+                self.logger.warning("Çözüm başlamadan iptal edildi")
+                return False
+            
+            # Belirli bir süre iyileşme olmazsa aramayı durduran izleme iş parçacığı
+            cozum_bitti = threading.Event()
+            if self.cozucu_iyilesmesiz_sure > 0:
+                threading.Thread(target=self._durgunluk_izle, args=(self.izleyici, cozum_bitti), daemon=True).start()
             
             # Çözümü bul
             start_time = time.time()
-            status = self.solver.Solve(self.model)
+            try:
+                status = self.solver.Solve(self.model, self.izleyici)
+            finally:
+                cozum_bitti.set()
             end_time = time.time()
+            self.son_durum = status
             
-            # Çözüm durumunu kontrol et
+            if self.durdurma_istendi:
+                self.logger.warning(f"Çözüm kullanıcı tarafından durduruldu ({self.izleyici.cozum_sayisi} çözüm bulunmuştu)")
+            
+            # Çözüm durumunu kontrol et (durdurulduğunda bulunan en iyi çözüm korunur)
             if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
                 self.cozum = self.solver
-                self.logger.info(f"Çözüm bulundu! Süre: {end_time - start_time:.2f} saniye")
+                self.logger.info(f"Çözüm bulundu! Süre: {end_time - start_time:.2f} saniye, amaç: {self.solver.ObjectiveValue():.0f}")
+                if self.iki_asamali:
+                    return self._iki_asamayi_tamamla(ilerleme_geri_cagirma)
                 return True
             else:
-                self.logger.warning(f"Çözüm bulunamadı! Durum: {status}")
+                self.logger.warning(f"Çözüm bulunamadı! Durum: {self.solver.StatusName(status)}")
                 return False
         except Exception as e:
             self.logger.error(f"Model çözülürken hata oluştu: {str(e)}")
             raise
     
-    def save_solution(self):
+    def _iki_asamayi_tamamla(self, ilerleme_geri_cagirma):
+        """
+        İki aşamalı çözümde derslikleri atar; atanamazsa tek aşamalı modele döner
+        
+        Birinci aşamanın derslik kapasitesi kısıtları derslik kümeleri iç içe
+        olmadığında her saat için eşleştirme bulunacağını garanti etmez. Eşleştirme
+        bulunamazsa iki aşamalı çözüm bu çalışma için kapatılır ve model derslik
+        değişkenleriyle yeniden kurulup çözülür; cozum_atamalari() o zaman tek
+        aşamalı çözümü döndürür.
+        
+        Args:
+            ilerleme_geri_cagirma (callable, optional): solve() ile aynı
+            
+        Returns:
+            bool: Çözüm bulundu mu?
+        """
+        self.eslestirilen_atamalar = self.assign_rooms()
+        if self.eslestirilen_atamalar is not None:
+            return True
+        
+        self.cozum = None
+        if self.durdurma_istendi:
+            return False
+        
+        self.logger.warning("Derslikler eşleştirmeyle atanamadı, tek aşamalı modele geçiliyor")
+        self.iki_asamali = False
+        self.create_model()
+        return self.solve(ilerleme_geri_cagirma)
+    
+    def apply_solver_parameters(self):
+        """
+        Ayarlardaki çözücü parametrelerini çözücüye uygular ve etkin değerleri loglar
+        """
+        parametreler = self.solver.parameters
+        parametreler.max_time_in_seconds = self.algoritma_sure_siniri
+        
+        # 0: OR-Tools çekirdek sayısına göre kendisi belirler
+        if self.cozucu_is_parcacigi > 0:
+            parametreler.num_workers = self.cozucu_is_parcacigi
+        
+        parametreler.random_seed = self.cozucu_rastgele_tohum
+        
+        if self.cozucu_goreli_fark > 0:
+            parametreler.relative_gap_limit = self.cozucu_goreli_fark
+        
+        self.logger.info(
+            f"Çözücü parametreleri: süre sınırı={parametreler.max_time_in_seconds} sn, "
+            f"iş parçacığı={parametreler.num_workers or 'otomatik'}, "
+            f"rastgele tohum={parametreler.random_seed}, "
+            f"göreli fark sınırı={parametreler.relative_gap_limit}, "
+            f"iyileşmesiz durma={self.cozucu_iyilesmesiz_sure or 'kapalı'} sn"
+        )
+    
+    def _durgunluk_izle(self, izleyici, cozum_bitti):
+        """
+        Son iyileşmeden bu yana ayarlanan süre geçtiğinde aramayı durdurur
+        
+        Args:
+            izleyici (CozumIzleyici): Çalışan çözümün izleyicisi
+            cozum_bitti (threading.Event): Çözüm bittiğinde işaretlenir
+        """
+        while not cozum_bitti.wait(0.5):
+            # İlk çözüm bulunmadan durdurulmaz
+            if izleyici.son_iyilesme is None:
+                continue
+            
+            if time.time() - izleyici.son_iyilesme >= self.cozucu_iyilesmesiz_sure:
+                self.logger.info(f"{self.cozucu_iyilesmesiz_sure} saniyedir iyileşme olmadığı için arama durduruluyor")
+                self._aramayi_durdur()
+                return
+    
+    def durdur(self):
+        """
+        Çalışan çözümü durdurur
+        
+        Başka bir iş parçacığından çağrılabilir. Çözücü o ana kadar bulduğu en iyi
+        çözümle döner; model kurulurken çağrılırsa çözüm hiç başlatılmaz.
+        """
+        self.durdurma_istendi = True
+        self._aramayi_durdur()
+        if self._durdurma_olayi is not None:
+            self._durdurma_olayi.set()
+    
+    def _aramayi_durdur(self):
+        """
+        Çalışan CP-SAT aramasını durdurur
+        """
+        if self.solver is not None and hasattr(self.solver, "StopSearch"):
+            self.solver.StopSearch()
+        if self.izleyici is not None:
+            self.izleyici.durdurma_istendi = True
+    
+    def explain_infeasibility(self, sure_siniri=60, deneme_suresi=5):
+        """
+        Çözümsüz modelde birlikte sağlanamayan kısıt gruplarını bulur
+        
+        Model, her kısıt ailesi ve varlık (öğretmen, sınıf, ilişki, gün) grubu bir
+        etkinleştirme değişkenine bağlanarak yeniden kurulur ve tüm gruplar varsayım
+        olarak verilip çözülür. Çözücünün döndürdüğü çekirdek, gruplar tek tek
+        çıkarılıp model hâlâ çözümsüz mü diye denenerek küçültülür. Açıklama modunda
+        alan daraltma ve iki aşamalı çözüm kapatılır, böylece uygun olmayan zamanlar
+        ve derslik gereksinimleri de birer kısıt grubu olarak çekirdekte görünebilir.
+        Açıklama modunda amaç eklenmez; yalnızca uygulanabilirlik sorulur. Süre
+        bütçesi dolarsa küçültme yarıda bırakılır ve çekirdek en küçük olmayabilir.
+        load_data'dan sonra çağrılmalıdır.
+        
+        Args:
+            sure_siniri (float): Tüm denemeler için toplam süre bütçesi (saniye)
+            deneme_suresi (float): Küçültmedeki her deneme için süre sınırı (saniye);
+                süresi dolan denemenin grubu çekirdekte bırakılır
+                
+        Returns:
+            list: Çakışan kısıt gruplarının açıklamaları (bulunamazsa boş liste)
+        """
+        onceki_ayarlar = (self.alan_daraltma, self.iki_asamali, self.sabit_iliskiler)
+        try:
+            self.aciklama_modu = True
+            self.alan_daraltma = False
+            self.iki_asamali = False
+            self.sabit_iliskiler = None
+            self.catisma_cekirdegi = []
+            
+            baslangic = time.time()
+            self.create_model()
+            bitis = time.time() + sure_siniri
+            
+            def dene(varsayimlar, sure):
+                self.model.ClearAssumptions()
+                self.model.AddAssumptions(varsayimlar)
+                self.solver = cp_model.CpSolver()
+                self.solver.parameters.max_time_in_seconds = max(0.0, min(sure, bitis - time.time()))
+                # Çekirdek yalnızca tek iş parçacığında güvenilir şekilde raporlanır
+                self.solver.parameters.num_workers = 1
+                return self.solver.Solve(self.model)
+            
+            # İlk deneme çözümsüzlüğü kanıtlamak zorunda olduğundan bütçenin tamamını kullanabilir
+            durum = dene([etkin for etkin, _ in self.kisit_gruplari.values()], sure_siniri)
+            if durum != cp_model.INFEASIBLE:
+                self.logger.warning(f"Açıklama modelinde çözümsüzlük doğrulanamadı, durum: {self.solver.StatusName(durum)}")
+                return []
+            
+            cekirdek = list(self.solver.SufficientAssumptionsForInfeasibility())
+            self.logger.info(f"Çakışma çekirdeği {len(cekirdek)}/{len(self.kisit_gruplari)} kısıt grubuyla bulundu, küçültülüyor")
+            
+            # Silme tabanlı küçültme: çıkarıldığında model çözülebilir hale gelen grup çekirdekte kalır
+            i = 0
+            while i < len(cekirdek) and not self.durdurma_istendi:
+                if time.time() >= bitis:
+                    self.logger.warning("Açıklama süre bütçesi doldu, çekirdek en küçük olmayabilir")
+                    break
+                
+                deneme = cekirdek[:i] + cekirdek[i + 1:]
+                if dene([self.kisit_gruplari[indeks][0] for indeks in deneme], deneme_suresi) == cp_model.INFEASIBLE:
+                    # Çözücünün yeni çekirdeği daha küçükse onunla devam edilir; sıra korunduğu
+                    # için ilk i grup (hepsi gerekli olduğundan yeni çekirdekte de bulunur) yerinde kalır
+                    yeni = set(self.solver.SufficientAssumptionsForInfeasibility())
+                    cekirdek = [indeks for indeks in deneme if indeks in yeni] if yeni & set(deneme) else deneme
+                else:
+                    i += 1
+            
+            self.catisma_cekirdegi = [self.kisit_gruplari[indeks][1] for indeks in cekirdek]
+            self.logger.info(f"Çakışma çekirdeği {len(cekirdek)} kısıt grubuna {time.time() - baslangic:.2f} saniyede küçültüldü")
+            for aciklama in self.catisma_cekirdegi:
+                self.logger.error(f"Çakışan kısıt: {aciklama}")
+            return self.catisma_cekirdegi
+        except Exception as e:
+            self.logger.error(f"Çözümsüzlük açıklanırken hata oluştu: {str(e)}")
+            raise
+        finally:
+            self.aciklama_modu = False
+            self.alan_daraltma, self.iki_asamali, self.sabit_iliskiler = onceki_ayarlar
+            self.model = None
+    
+    def cozumsuz_mu(self):
+        """
+        Son çözümün, çözümsüzlüğü kanıtlanarak bittiğini döndürür
+        
+        Returns:
+            bool: Son durum INFEASIBLE ise True
+        """
+        return self.son_durum == cp_model.INFEASIBLE
+    
+    def cozum_atamalari(self):
+        """
+        Çözücünün bulduğu atamaları döndürür
+        
+        İki aşamalı çözümde derslikler bu aşamada eşleştirmeyle atanır.
+        
+        Returns:
+            list: (iliski_id, gun, saat, derslik_id) demetleri
+        """
+        if self.iki_asamali:
+            if self.eslestirilen_atamalar is not None:
+                return self.eslestirilen_atamalar
+            return self.assign_rooms()
+        
+        degerler = np.array([self.cozum.BooleanValue(var) for var in self.degiskenler], dtype=bool)
+        
+        # Değeri 1 olan hücreleri (ilişki, gün, saat, derslik) dizisinde bul
+        secili = np.zeros(self.degisken_indeksleri.shape, dtype=bool)
+        gecerli = self.degisken_indeksleri >= 0
+        secili[gecerli] = degerler[self.degisken_indeksleri[gecerli]]
+        
+        atamalar = []
+        for r, gun, saat, k in np.argwhere(secili):
+            atamalar.append((self.ders_sinif_iliskileri[r]["id"], int(gun), int(saat), self.derslikler[k]["id"]))
+        return atamalar
+    
+    def assign_rooms(self):
+        """
+        İki aşamalı çözümün ikinci aşaması: zamanı belli derslere derslik atar
+        
+        Her gün saat sırasıyla işlenir ve her saat için dersler dersliklerle en düşük
+        maliyetli eşleştirmeyle (Macar yöntemi) eşlenir. Sınıfın önceki saatteki
+        dersliğinden farklı bir derslik 1, blok dersin ortasında derslik değiştirmek 10
+        maliyetlidir; izin verilmeyen derslikler için kenar eklenmez. Blok ders modunda
+        blokun devam eden saatleri önceki saatin dersliğine sabitlenir; o saat için
+        eşleştirme bulunamazsa sabitleme kaldırılır ve bölünen bloklar raporlanır.
+        
+        Returns:
+            list: (iliski_id, gun, saat, derslik_id) demetleri, bir saat için
+                eşleştirme bulunamazsa None
+        """
+        degerler = np.array([self.cozum.BooleanValue(var) for var in self.degiskenler], dtype=bool)
+        indeksler = self.degisken_indeksleri[:, :, :, 0]
+        secili = np.zeros(indeksler.shape, dtype=bool)
+        secili[indeksler >= 0] = degerler[indeksler[indeksler >= 0]]
+        
+        derslik_sayisi = len(self.derslikler)
+        atamalar = []
+        degisim_sayisi = 0
+        bolunen_bloklar = []
+        
+        def eslestir(dersler, onceki, bloklari_sabitle):
+            eslestirme = linear_sum_assignment.SimpleLinearSumAssignment()
+            for i, r in enumerate(dersler):
+                sinif_onceki = onceki.get(self.ders_sinif_iliskileri[r]["sinif_id"])
+                blok_devami = sinif_onceki is not None and sinif_onceki[0] == r
+                for k in np.flatnonzero(self.uygun_derslikler[r]):
+                    if bloklari_sabitle and blok_devami and sinif_onceki[1] != k:
+                        continue
+                    maliyet = 0
+                    if sinif_onceki and sinif_onceki[1] != k:
+                        maliyet = 10 if blok_devami else 1
+                    eslestirme.add_arc_with_cost(i, int(k), maliyet)
+            
+            # Boş kalan derslikler için sıfır maliyetli yapay dersler (eşleştirme kare olmalı)
+            for i in range(len(dersler), derslik_sayisi):
+                for k in range(derslik_sayisi):
+                    eslestirme.add_arc_with_cost(i, k, 0)
+            
+            return eslestirme if eslestirme.solve() == eslestirme.OPTIMAL else None
+        
+        for gun in range(self.gun_sayisi):
+            # Sınıf -> (ilişki, derslik) önceki saatte
+            onceki = {}
+            for saat in range(self.saat_sayisi):
+                dersler = np.flatnonzero(secili[:, gun, saat])
+                if len(dersler) == 0:
+                    onceki = {}
+                    continue
+                
+                eslestirme = eslestir(dersler, onceki, True) if self.blok_ders_arka_arkaya else None
+                if eslestirme is None:
+                    eslestirme = eslestir(dersler, onceki, False)
+                if eslestirme is None:
+                    self.logger.warning(f"{gun + 1}. gün {saat + 1}. saat için derslik ataması yapılamadı")
+                    return None
+                
+                simdiki = {}
+                for i, r in enumerate(dersler):
+                    iliski = self.ders_sinif_iliskileri[r]
+                    k = eslestirme.right_mate(i)
+                    atamalar.append((iliski["id"], gun, saat, self.derslikler[k]["id"]))
+                    
+                    sinif_onceki = onceki.get(iliski["sinif_id"])
+                    if sinif_onceki and sinif_onceki[1] != k:
+                        degisim_sayisi += 1
+                        if self.blok_ders_arka_arkaya and sinif_onceki[0] == r:
+                            bolunen_bloklar.append(f"{self.iliski_adi(iliski)} {gun + 1}. gün {saat + 1}. saat")
+                    simdiki[iliski["sinif_id"]] = (r, k)
+                onceki = simdiki
+        
+        for blok in bolunen_bloklar:
+            self.logger.warning(f"Blok ders derslik değiştiriyor: {blok}")
+        self.logger.info(f"Derslikler eşleştirmeyle atandı ({degisim_sayisi} derslik değişimi)")
+        return atamalar
+    
+    def save_solution(self, atamalar=None, onbellege_al=True, durum=None):
         """
         Çözümü veritabanına kaydeder
         
+        Args:
+            atamalar (list, optional): (iliski_id, gun, saat, derslik_id) demetleri.
+                Verilmezse çözücünün bulduğu çözüm kaydedilir.
+            onbellege_al (bool): Program önbelleğe de yazılsın mı? (taslaklar yazılmaz)
+            durum (str, optional): Çözüm durumu (CozumSonucu.durum); yalnızca "OPTIMAL"
+                programlar önbellekten doğrudan kullanılır, diğerleri ipucu olur
+                
         Returns:
             bool: Başarılı mı?
         """
-        if not self.cozum:
-            self.logger.error("Kaydedilecek çözüm bulunamadı")
-            return False
+        if atamalar is None:
+            if not self.cozum:
+                self.logger.error("Kaydedilecek çözüm bulunamadı")
+                return False
+            atamalar = self.cozum_atamalari()
         
         try:
             # Önce mevcut programı temizle
             self.db.tum_programi_temizle()
             
             # Çözümü kaydet
-            for var_name, var in self.ders_degiskenleri.items():
-                # Değişken değeri 1 ise (bu ders bu gün, saat ve derslikte yapılıyor)
-                if self.cozum.Value(var) == 1:
-                    # Değişken adını parçala: iliski_id_ders_saati_gun_saat_derslik_id
-                    parts = var_name.split("_")
-                    iliski_id = int(parts[0])
-                    gun = int(parts[2])
-                    saat = int(parts[3])
-                    derslik_id = int(parts[4])
-                    
-                    # İlişki bilgilerini al
-                    iliski = next((i for i in self.ders_sinif_iliskileri if i["id"] == iliski_id), None)
-                    if iliski:
-                        sinif_id = iliski["sinif_id"]
-                        ogretmen_id = iliski["ogretmen_id"]
-                        ders_id = iliski["ders_id"]
-                        
-                        # Programa ekle
-                        self.db.program_ekle(sinif_id, ogretmen_id, ders_id, derslik_id, gun, saat)
+            for iliski_id, gun, saat, derslik_id in atamalar:
+                iliski = self.iliski_sozlugu[iliski_id]
+                
+                # Programa ekle
+                self.db.program_ekle(iliski["sinif_id"], iliski["ogretmen_id"], iliski["ders_id"], derslik_id, gun, saat)
             
             self.logger.info("Çözüm başarıyla kaydedildi")
+            
+            # Aynı girdilerle tekrar çalıştırıldığında kullanılmak üzere önbelleğe al
+            if onbellege_al:
+                self.onbellege_kaydet(atamalar, durum)
+            
             return True
         except Exception as e:
             self.logger.error(f"Çözüm kaydedilirken hata oluştu: {str(e)}")
             raise
     
+    def _onbellegi_ac(self):
+        """
+        Önbelleği açar; kapalıysa veya dizin belirlenemiyorsa None döndürür
+        
+        Dizin yapılandırmadaki cache/dir değeridir; yoksa veritabanının yanındaki
+        "onbellek" dizini kullanılır.
+        """
+        if not self.onbellek_kullan:
+            return None
+        
+        if self.onbellek is None:
+            dizin = self.config.get("cache", "dir") if self.config else None
+            if dizin is None:
+                db_yolu = getattr(self.db, "db_path", None)
+                if db_yolu is None:
+                    return None
+                dizin = os.path.join(os.path.dirname(os.path.abspath(db_yolu)), "onbellek")
+            self.onbellek = ModelOnbellegi(dizin, self.onbellek_boyutu)
+        
+        self.onbellek.max_kayit = self.onbellek_boyutu
+        return self.onbellek
+    
+    def girdi_ozeti(self):
+        """
+        load_data ve load_settings'in okuduğu girdilerin içerik özetini hesaplar
+        
+        Oluşturma/güncelleme zamanları gibi programı etkilemeyen sütunlar dışarıda
+        bırakılır. Mevcut program girdi sayılmaz.
+        
+        Returns:
+            str: SHA-256 özeti
+        """
+        def satirlar(kayitlar):
+            return [
+                {anahtar: kayit[anahtar] for anahtar in kayit.keys() if not anahtar.endswith("_tarihi")}
+                for kayit in kayitlar
+            ]
+        
+        return ModelOnbellegi.ozet_hesapla({
+            "siniflar": satirlar(self.siniflar),
+            "ogretmenler": satirlar(self.ogretmenler),
+            "dersler": satirlar(self.dersler),
+            "derslikler": satirlar(self.derslikler),
+            "ders_sinif_iliskileri": satirlar(self.ders_sinif_iliskileri),
+            "uygun_olmayan_zamanlar": satirlar(self.uygun_olmayan_zamanlar),
+            "ders_derslikleri": satirlar(self.ders_derslikleri),
+            "ayarlar": {ayar["anahtar"]: ayar["deger"] for ayar in self.db.tum_ayarlari_getir()},
+            "alan_daraltma": self.alan_daraltma
+        })
+    
+    def iliski_ozeti(self):
+        """
+        Ders-sınıf-öğretmen ilişki kümesinin içerik özetini hesaplar
+        
+        Önbellekteki bir programın satırlarının bu girdilerle eşlenip eşlenemeyeceğini
+        belirler; ayar ve kısıt değişiklikleri özeti etkilemez.
+        
+        Returns:
+            str: SHA-256 özeti
+        """
+        return ModelOnbellegi.ozet_hesapla(sorted(
+            [iliski["ders_id"], iliski["sinif_id"], iliski["ogretmen_id"]]
+            for iliski in self.ders_sinif_iliskileri
+        ))
+    
+    def onbellekten_getir(self):
+        """
+        Aynı girdiler için önbellekte kayıtlı kesin (OPTIMAL) programı döndürür
+        
+        load_data'dan sonra çağrılır. Kesin kayıt yoksa ve mevcut program boşsa, aynı
+        girdilerin kesin olmayan kaydı ya da aynı ilişki kümesiyle bulunmuş en son
+        program sıcak başlangıç ipucu olarak kullanılmak üzere mevcut programın yerine
+        konur.
+        
+        Returns:
+            list: (iliski_id, gun, saat, derslik_id) demetleri, kayıt yoksa None
+        """
+        try:
+            onbellek = self._onbellegi_ac()
+            if onbellek is None:
+                return None
+            
+            ozet = self.girdi_ozeti()
+            kayit = onbellek.getir(ozet)
+            
+            if kayit is None or not kayit.get("kesin"):
+                if self.sicak_baslangic and not self.mevcut_program:
+                    ipucu = kayit or onbellek.ipucu_getir("iliski_ozeti", self.iliski_ozeti())
+                    if ipucu is not None:
+                        self.mevcut_program = ipucu["program"]
+                        self.logger.info("Önbellekteki kesin olmayan çözüm başlangıç ipucu olarak kullanılacak")
+                return None
+            
+            iliski_indeksleri = {
+                (iliski["ders_id"], iliski["sinif_id"], iliski["ogretmen_id"]): iliski["id"]
+                for iliski in self.ders_sinif_iliskileri
+            }
+            atamalar = [
+                (iliski_indeksleri[(satir["ders_id"], satir["sinif_id"], satir["ogretmen_id"])], satir["gun"], satir["saat"], satir["derslik_id"])
+                for satir in kayit["program"]
+            ]
+            
+            self.logger.info(f"Aynı girdiler için önbellekte kayıtlı program bulundu ({ozet[:12]}, amaç: {kayit.get('amac')})")
+            return atamalar
+        except Exception as e:
+            # Önbellek hatası program oluşturmayı engellememeli
+            self.logger.warning(f"Önbellek okunurken hata oluştu: {str(e)}")
+            return None
+    
+    def onbellege_kaydet(self, atamalar, durum=None):
+        """
+        Çözümü girdi özeti altında önbelleğe yazar
+        
+        Program yalnızca durum "OPTIMAL" ise ve çalışma iptal edilmediyse kesin olarak
+        işaretlenir. Kesin bir kayıt kesin olmayan bir programla değiştirilmez.
+        
+        Args:
+            atamalar (list): (iliski_id, gun, saat, derslik_id) demetleri
+            durum (str, optional): Çözüm durumu
+        """
+        try:
+            onbellek = self._onbellegi_ac()
+            if onbellek is None:
+                return
+            
+            kesin = durum == "OPTIMAL" and not self.durdurma_istendi
+            ozet = self.girdi_ozeti()
+            mevcut = onbellek.getir(ozet)
+            if not kesin and mevcut is not None and mevcut.get("kesin"):
+                return
+            
+            program = []
+            for iliski_id, gun, saat, derslik_id in atamalar:
+                iliski = self.iliski_sozlugu[iliski_id]
+                program.append({
+                    "ders_id": iliski["ders_id"],
+                    "sinif_id": iliski["sinif_id"],
+                    "ogretmen_id": iliski["ogretmen_id"],
+                    "derslik_id": derslik_id,
+                    "gun": int(gun),
+                    "saat": int(saat)
+                })
+            
+            kayit = {
+                "program": program,
+                "kesin": kesin,
+                "durum": durum,
+                "iliski_ozeti": self.iliski_ozeti(),
+                "amac": self.cozum.ObjectiveValue() if self.cozum else None,
+                "tarih": datetime.now().isoformat()
+            }
+            onbellek.kaydet(ozet, kayit)
+        except Exception as e:
+            self.logger.warning(f"Önbelleğe yazılırken hata oluştu: {str(e)}")
+    
     def create_schedule(self):
         """
         Ders programı oluşturur
@@ -891,15 +2120,577 @@ class ProgramOlusturucu:
             # Verileri yükle
             self.load_data()
             
-            # Modeli oluştur
-            self.create_model()
+            # Aynı girdilerle daha önce bulunmuş program varsa doğrudan kullan
+            atamalar = self.onbellekten_getir()
+            if atamalar is not None:
+                return self.save_solution(atamalar)
+            
+            # Kesin olarak çözümsüz girdiler için model kurulmaz
+            if self.check_capacity():
+                return False
+            
+            # Seçilen arka uçla çöz
+            sonuc = self.solve_with_backend()
+            if sonuc.basarili:
+                # Çözümü yerel aramayla iyileştir ve kaydet (eksik taslaklar önbelleğe alınmaz)
+                return self.save_solution(self.improve_solution(sonuc.atamalar), onbellege_al=sonuc.tam, durum=sonuc.durum)
+            
+            # Çözümsüzlük kanıtlandıysa çakışan kısıtları bul
+            if self.cozumsuz_mu():
+                self.explain_infeasibility()
+            return False
+        except Exception as e:
+            self.logger.error(f"Program oluşturulurken hata oluştu: {str(e)}")
+            raise
+    
+    def solve_with_backend(self, arka_uc=None, ilerleme_geri_cagirma=None):
+        """
+        Programı seçilen çözücü arka ucuyla oluşturur
+        
+        load_data'dan sonra çağrılır. "yaris" seçilirse yaris_arka_uclari ayrı
+        süreçlerde aynı süre sınırıyla çalıştırılır ve en iyi sonuç seçilir.
+        
+        Args:
+            arka_uc (str, optional): ARKA_UCLAR anahtarı veya "yaris"; verilmezse ayar kullanılır
+            ilerleme_geri_cagirma (callable, optional): solve() ile aynı (yarışta kullanılmaz)
+            
+        Returns:
+            CozumSonucu: Sonuç
+        """
+        try:
+            arka_uc = arka_uc or self.cozucu_arka_ucu
+            self.yaris_sonuclari = []
+            
+            if arka_uc == "yaris":
+                self.son_sonuc = self.race(self.yaris_arka_uclari)
+            elif arka_uc in ARKA_UCLAR:
+                self.son_sonuc = ARKA_UCLAR[arka_uc]().coz(self, ilerleme_geri_cagirma)
+            else:
+                raise ValueError(f"Bilinmeyen çözücü arka ucu: {arka_uc}")
+            
+            return self.son_sonuc
+        except Exception as e:
+            self.logger.error(f"Arka uçla çözülürken hata oluştu: {str(e)}")
+            raise
+    
+    def race(self, adlar):
+        """
+        Birden fazla arka ucu ayrı süreçlerde aynı süre sınırıyla çalıştırır
+        
+        Her arka uç verilerin bir anlık görüntüsünü alır. Sonuçlar ortak ölçütle
+        (eksik ders saati, ihlal, amaç, süre sırasıyla) karşılaştırılır ve tümü
+        self.yaris_sonuclari listesinde tutulur. İlk tam sonuç gelince ve durdur()
+        çağrılınca diğer arka uçlar durdurulur.
+        
+        Args:
+            adlar (list): ARKA_UCLAR anahtarları
+            
+        Returns:
+            CozumSonucu: En iyi sonuç
+        """
+        try:
+            bilinmeyenler = [ad for ad in adlar if ad not in ARKA_UCLAR]
+            if not adlar or bilinmeyenler:
+                raise ValueError(f"Yarış için geçersiz arka uç listesi: {adlar}")
+            
+            surec_sayisi = len(adlar)
+            
+            # Süreçler çekirdekleri paylaştığı için CP-SAT iş parçacığı sayısı bölünür
+            ayarlar = {ayar["anahtar"]: ayar["deger"] for ayar in self.db.tum_ayarlari_getir()}
+            ayarlar["bilesen_ayristirma"] = "0"
+            ayarlar["onbellek_kullan"] = "0"
+            if self.cozucu_is_parcacigi == 0:
+                ayarlar["cozucu_is_parcacigi"] = str(max(1, (os.cpu_count() or 1) // surec_sayisi))
+            veri = self.anlik_goruntu(ayarlar)
+            
+            baslangic = time.time()
+            self._durdurma_olayi = durdurma_olayi = multiprocessing.Event()
+            havuz = ProcessPoolExecutor(max_workers=surec_sayisi, initializer=_alt_sureci_baslat, initargs=(durdurma_olayi,))
+            try:
+                gorevler = [havuz.submit(_arka_ucu_calistir, ad, veri) for ad in adlar]
+                for gorev in as_completed(gorevler):
+                    sonuc = gorev.result()
+                    self.yaris_sonuclari.append(sonuc)
+                    self.logger.info(f"Yarış: {sonuc.arka_uc} {sonuc.sure:.2f} saniyede bitti ({sonuc.durum}, amaç: {sonuc.amac})")
+                    
+                    # İlk tam sonuç yarışı bitirir: diğer arka uçlar durdurulur ve o ana
+                    # kadar buldukları en iyi sonuçla döner
+                    if sonuc.tam and not durdurma_olayi.is_set():
+                        self.logger.info(f"Yarış: {sonuc.arka_uc} tam sonuç buldu, diğer arka uçlar durduruluyor")
+                        durdurma_olayi.set()
+            finally:
+                self._durdurma_olayi = None
+                durdurma_olayi.set()
+                havuz.shutdown(wait=False, cancel_futures=True)
+            
+            self.yaris_sonuclari.sort(key=CozumSonucu.siralama_anahtari)
+            en_iyi = self.yaris_sonuclari[0]
+            self.logger.info(f"Yarış {time.time() - baslangic:.2f} saniyede tamamlandı, seçilen arka uç: {en_iyi.arka_uc}")
+            return en_iyi
+        except Exception as e:
+            self.logger.error(f"Arka uç yarışı sırasında hata oluştu: {str(e)}")
+            raise
+    
+    def anlik_goruntu(self, ayarlar):
+        """
+        Başka bir süreçte set_data ile yüklenebilecek tüm verilerin anlık görüntüsünü döndürür
+        
+        Args:
+            ayarlar (dict): Görüntüyle birlikte aktarılacak ayarlar
+            
+        Returns:
+            dict: Süreçler arası aktarılabilir veri
+        """
+        # sqlite3.Row nesneleri süreçler arasında aktarılamadığı için sözlüğe çevrilir
+        return {
+            "ayarlar": ayarlar,
+            "siniflar": [dict(sinif) for sinif in self.siniflar],
+            "ogretmenler": [dict(ogretmen) for ogretmen in self.ogretmenler],
+            "dersler": [dict(ders) for ders in self.dersler],
+            "derslikler": [dict(derslik) for derslik in self.derslikler],
+            "ders_sinif_iliskileri": [dict(iliski) for iliski in self.ders_sinif_iliskileri],
+            "uygun_olmayan_zamanlar": [dict(zaman) for zaman in self.uygun_olmayan_zamanlar],
+            "ders_derslikleri": [dict(kayit) for kayit in self.ders_derslikleri],
+            "mevcut_program": [dict(kayit) for kayit in self.mevcut_program]
+        }
+    
+    def improve_solution(self, atamalar=None):
+        """
+        Programı ayarlanan süre boyunca yerel aramayla iyileştirir
+        
+        Yerel arama süresi 0 ise atamalar olduğu gibi döndürülür.
+        
+        Args:
+            atamalar (list, optional): (iliski_id, gun, saat, derslik_id) demetleri.
+                Verilmezse çözücünün bulduğu çözüm kullanılır.
+                
+        Returns:
+            list: (iliski_id, gun, saat, derslik_id) demetleri
+        """
+        try:
+            if atamalar is None:
+                atamalar = self.cozum_atamalari()
+            
+            if self.yerel_arama_suresi <= 0 or not atamalar:
+                return atamalar
+            
+            return YerelAramaIyilestirici(self).iyilestir(atamalar, self.yerel_arama_suresi)
+        except Exception as e:
+            self.logger.error(f"Program iyileştirilirken hata oluştu: {str(e)}")
+            raise
+    
+    def create_draft(self):
+        """
+        Model kurmadan sezgisel bir taslak program oluşturur
+        
+        load_data'dan sonra çağrılır. Yerleştirilemeyen ders saatleri
+        self.taslak_eksikleri listesinde tutulur.
+        
+        Returns:
+            list: (iliski_id, gun, saat, derslik_id) demetleri
+        """
+        try:
+            self.compute_domains()
+            atamalar, self.taslak_eksikleri = HizliProgramOlusturucu(self).olustur()
+            
+            for eksik in self.taslak_eksikleri:
+                self.logger.warning(f"Taslakta yerleştirilemedi: {self.iliski_adi(eksik['iliski'])}, {eksik['eksik_saat']} saat")
+            
+            return [
+                (self.ders_sinif_iliskileri[r]["id"], gun, saat, self.derslikler[k]["id"])
+                for r, gun, saat, k in atamalar
+            ]
+        except Exception as e:
+            self.logger.error(f"Sezgisel taslak oluşturulurken hata oluştu: {str(e)}")
+            raise
+    
+    def bilesenleri_bul(self):
+        """
+        İlişki çakışma grafiğinin bağlı bileşenlerini bulur
+        
+        Aynı öğretmeni, aynı sınıfı paylaşan veya aynı derslikte yapılabilen iki ilişki
+        arasında kenar vardır. Farklı bileşenlerdeki ilişkiler hiçbir kısıtla birbirine
+        bağlı olmadığından ayrı modellerde çözülebilir. compute_domains'ten sonra
+        çağrılmalıdır.
+        
+        Returns:
+            list: Her bileşen için ilişki sıraları listesi (büyükten küçüğe)
+        """
+        ebeveyn = list(range(len(self.ders_sinif_iliskileri)))
+        
+        def kok(r):
+            while ebeveyn[r] != r:
+                ebeveyn[r] = ebeveyn[ebeveyn[r]]
+                r = ebeveyn[r]
+            return r
+        
+        def birlestir(iliskiler):
+            if len(iliskiler) == 0:
+                return
+            ilk = kok(iliskiler[0])
+            for r in iliskiler[1:]:
+                ebeveyn[kok(r)] = ilk
+        
+        for iliskiler in self.ogretmen_iliskileri.values():
+            birlestir(iliskiler)
+        for iliskiler in self.sinif_iliskileri.values():
+            birlestir(iliskiler)
+        for k in range(len(self.derslikler)):
+            birlestir(np.flatnonzero(self.uygun_derslikler[:, k]).tolist())
+        
+        bilesenler = {}
+        for r in range(len(self.ders_sinif_iliskileri)):
+            bilesenler.setdefault(kok(r), []).append(r)
+        
+        return sorted(bilesenler.values(), key=len, reverse=True)
+    
+    def _bilesen_verisi(self, iliskiler, ayarlar):
+        """
+        Bir bileşeni alt süreçte çözmek için gereken verileri hazırlar
+        
+        Args:
+            iliskiler (list): Bileşendeki ilişki sıraları
+            ayarlar (dict): Alt süreçte kullanılacak ayarlar
             
-            # Modeli çöz
-            if self.solve():
-                # Çözümü kaydet
+        Returns:
+            dict: set_data ile yüklenebilecek, süreçler arası aktarılabilir veri
+        """
+        bilesen_iliskileri = [self.ders_sinif_iliskileri[r] for r in iliskiler]
+        ogretmenler = {iliski["ogretmen_id"] for iliski in bilesen_iliskileri}
+        siniflar = {iliski["sinif_id"] for iliski in bilesen_iliskileri}
+        dersler = {iliski["ders_id"] for iliski in bilesen_iliskileri}
+        derslikler = self.uygun_derslikler[iliskiler].any(axis=0)
+        iliski_anahtarlari = {(iliski["ders_id"], iliski["sinif_id"], iliski["ogretmen_id"]) for iliski in bilesen_iliskileri}
+        
+        # sqlite3.Row nesneleri süreçler arasında aktarılamadığı için sözlüğe çevrilir
+        return {
+            "ayarlar": ayarlar,
+            "siniflar": [dict(sinif) for sinif in self.siniflar if sinif["id"] in siniflar],
+            "ogretmenler": [dict(ogretmen) for ogretmen in self.ogretmenler if ogretmen["id"] in ogretmenler],
+            "dersler": [dict(ders) for ders in self.dersler if ders["id"] in dersler],
+            "derslikler": [dict(derslik) for k, derslik in enumerate(self.derslikler) if derslikler[k]],
+            "ders_sinif_iliskileri": [dict(iliski) for iliski in bilesen_iliskileri],
+            "uygun_olmayan_zamanlar": [dict(zaman) for zaman in self.uygun_olmayan_zamanlar if zaman["ogretmen_id"] in ogretmenler],
+            "ders_derslikleri": [dict(kayit) for kayit in self.ders_derslikleri if kayit["ders_id"] in dersler],
+            "mevcut_program": [
+                dict(kayit) for kayit in self.mevcut_program
+                if (kayit["ders_id"], kayit["sinif_id"], kayit["ogretmen_id"]) in iliski_anahtarlari
+            ]
+        }
+    
+    def solve_components(self, ilerleme_geri_cagirma=None):
+        """
+        Bağımsız bileşenleri ayrı CP-SAT modelleri olarak süreç havuzunda çözer
+        
+        load_data'dan sonra çağrılır. Tek bileşen varsa model her zamanki gibi bu
+        süreçte kurulup çözülür. Bileşen raporu (ilişki ve değişken sayısı, kurma ve
+        çözme süresi, durum) self.bilesen_raporu listesinde tutulur. Birleşik durum
+        self.bilesen_durumu'dur: tüm bileşenler OPTIMAL ise OPTIMAL, çözülemeyen
+        bileşen varsa onun durumu, aksi halde FEASIBLE. durdur() alt süreçlerdeki
+        çözümleri de durdurur; başlamamış bileşenler iptal edilir.
+        
+        Args:
+            ilerleme_geri_cagirma (callable, optional): solve() ile aynı; yalnızca tek
+                bileşen bu süreçte çözülürken çağrılır
+                
+        Returns:
+            list: Birleştirilmiş (iliski_id, gun, saat, derslik_id) demetleri, çözüm yoksa None
+        """
+        try:
+            self.bilesen_raporu = []
+            self.bilesen_durumu = "UNKNOWN"
+            self.compute_domains()
+            bilesenler = self.bilesenleri_bul()
+            
+            self.logger.info(f"Çakışma grafiğinde {len(bilesenler)} bağımsız bileşen bulundu: {[len(b) for b in bilesenler]} ilişki")
+            
+            if len(bilesenler) <= 1:
+                self.create_model()
+                basarili = self.solve(ilerleme_geri_cagirma)
+                if self.son_durum is not None:
+                    self.bilesen_durumu = self.solver.StatusName(self.son_durum)
+                return self.cozum_atamalari() if basarili else None
+            
+            surec_sayisi = min(len(bilesenler), self.bilesen_surec_sayisi or os.cpu_count() or 1)
+            
+            # Süreçler çekirdekleri paylaştığı için CP-SAT iş parçacığı sayısı bölünür
+            ayarlar = {ayar["anahtar"]: ayar["deger"] for ayar in self.db.tum_ayarlari_getir()}
+            ayarlar["bilesen_ayristirma"] = "0"
+            ayarlar["onbellek_kullan"] = "0"
+            if self.cozucu_is_parcacigi == 0:
+                ayarlar["cozucu_is_parcacigi"] = str(max(1, (os.cpu_count() or 1) // surec_sayisi))
+            
+            atamalar = []
+            baslangic = time.time()
+            self._durdurma_olayi = durdurma_olayi = multiprocessing.Event()
+            havuz = ProcessPoolExecutor(max_workers=surec_sayisi, initializer=_alt_sureci_baslat, initargs=(durdurma_olayi,))
+            try:
+                gorevler = {
+                    havuz.submit(_bileseni_coz, self._bilesen_verisi(iliskiler, ayarlar)): i
+                    for i, iliskiler in enumerate(bilesenler)
+                }
+                
+                # İptal edilirse bileşenler o ana kadarki en iyi çözümleriyle döner
+                for gorev in as_completed(gorevler):
+                    sonuc = gorev.result()
+                    sonuc["bilesen"] = gorevler[gorev] + 1
+                    self.bilesen_raporu.append(sonuc)
+                    
+                    self.logger.info(
+                        f"Bileşen {sonuc['bilesen']}: {sonuc['iliski_sayisi']} ilişki, {sonuc['degisken_sayisi']} değişken, "
+                        f"kurma {sonuc['kurma_suresi']:.2f} sn, çözme {sonuc['cozum_suresi']:.2f} sn, durum: {sonuc['durum']}"
+                    )
+                    
+                    if sonuc["atamalar"] is None:
+                        self.bilesen_durumu = sonuc["durum"]
+                        self.logger.warning(f"Bileşen {sonuc['bilesen']} çözülemediği için program birleştirilemedi")
+                        return None
+                    
+                    atamalar.extend(sonuc["atamalar"])
+            finally:
+                # Çalışan alt çözümler durdurulur, başlamamış olanlar iptal edilir
+                self._durdurma_olayi = None
+                durdurma_olayi.set()
+                havuz.shutdown(wait=False, cancel_futures=True)
+            
+            self.bilesen_raporu.sort(key=lambda sonuc: sonuc["bilesen"])
+            self.bilesen_durumu = "OPTIMAL" if all(sonuc["durum"] == "OPTIMAL" for sonuc in self.bilesen_raporu) else "FEASIBLE"
+            self.logger.info(f"{len(bilesenler)} bileşen {time.time() - baslangic:.2f} saniyede çözülüp birleştirildi")
+            return atamalar
+        except Exception as e:
+            self.logger.error(f"Bileşenler çözülürken hata oluştu: {str(e)}")
+            raise
+    
+    def repair(self, ilerleme_geri_cagirma=None, max_genisletme=3):
+        """
+        Mevcut programı yalnızca değişen kısmı yeniden çözerek onarır
+        
+        Ders saati sayısı mevcut programla tutmayan (yeni, saati değişmiş, öğretmeni
+        değişmiş veya artık izin verilmeyen hücreye düşmüş) ilişkiler değişmiş kabul
+        edilir. Bu ilişkiler ve onlarla öğretmen, sınıf ya da derslik paylaşan ilişkiler
+        serbest bırakılır, diğerleri mevcut yerlerinde sabitlenir. Serbest kısım
+        çözülemezse komşuluk bir adım genişletilir; en sonunda tüm program çözülür.
+        Serbest ilişkilerin önceki yerlerinden ayrılması amaç fonksiyonunda cezalandırılır.
+        
+        Args:
+            ilerleme_geri_cagirma (callable, optional): solve() ile aynı
+            max_genisletme (int): Tüm programa geçmeden önce denenecek komşuluk adımı sayısı
+            
+        Returns:
+            bool: Çözüm bulundu mu?
+        """
+        try:
+            self.load_data()
+            if self.check_capacity():
+                return False
+            
+            atamalar = self.mevcut_atamalar()
+            iliski_sayisi = len(self.ders_sinif_iliskileri)
+            
+            mevcut_saatler = np.bincount([r for r, _, _, _ in atamalar], minlength=iliski_sayisi)
+            haftalik_saatler = np.array([iliski["haftalik_saat"] for iliski in self.ders_sinif_iliskileri])
+            degisenler = set(np.flatnonzero(mevcut_saatler != haftalik_saatler).tolist())
+            
+            if degisenler:
+                self.logger.info(f"Onarım: {len(degisenler)} ilişki değişmiş")
+            else:
+                self.logger.info("Mevcut program tüm ilişkilerle uyumlu, onarım için değişiklik bulunamadı")
+            
+            onceki = np.zeros((iliski_sayisi, self.gun_sayisi, self.saat_sayisi, len(self.derslikler)), dtype=bool)
+            if atamalar:
+                onceki[tuple(np.array(atamalar).T)] = True
+            
+            try:
+                for seviye in range(1, max_genisletme + 2):
+                    if seviye > max_genisletme:
+                        serbest = set(range(iliski_sayisi))
+                    else:
+                        serbest = self._onarim_komsulugu(degisenler, atamalar, seviye)
+                    
+                    self.sabit_iliskiler = np.ones(iliski_sayisi, dtype=bool)
+                    self.sabit_iliskiler[list(serbest)] = False
+                    self.sabit_hucreler = onceki
+                    self.onceki_hucreler = onceki & ~self.sabit_iliskiler[:, np.newaxis, np.newaxis, np.newaxis]
+                    
+                    self.logger.info(f"Onarım adımı {seviye}: {len(serbest)}/{iliski_sayisi} ilişki serbest")
+                    
+                    self.create_model()
+                    if self.solve(ilerleme_geri_cagirma):
+                        return True
+                    
+                    if self.durdurma_istendi or len(serbest) == iliski_sayisi:
+                        return False
+                    
+                    self.logger.info("Onarım komşuluğunda çözüm bulunamadı, komşuluk genişletiliyor")
+                
+                return False
+            finally:
+                self.sabit_iliskiler = None
+                self.sabit_hucreler = None
+                self.onceki_hucreler = None
+        except Exception as e:
+            self.logger.error(f"Program onarılırken hata oluştu: {str(e)}")
+            raise
+    
+    def _onarim_komsulugu(self, degisenler, atamalar, seviye):
+        """
+        Değişen ilişkilerden başlayarak serbest bırakılacak ilişki kümesini döndürür
+        
+        Her adımda kümedeki ilişkilerle öğretmen, sınıf veya derslik paylaşan ilişkiler
+        kümeye eklenir. Bir ilişkinin dokunduğu derslikler mevcut programda kullandığı
+        derslikler ile (yalnızca belirli dersliklerde yapılabiliyorsa) izinli dersliklerdir.
+        
+        Args:
+            degisenler (set): Değişen ilişki sıraları
+            atamalar (list): mevcut_atamalar() sonucu
+            seviye (int): Genişletme adımı sayısı
+            
+        Returns:
+            set: Serbest ilişki sıraları
+        """
+        iliski_derslikleri = {}
+        derslik_iliskileri = {}
+        for r, _, _, k in atamalar:
+            iliski_derslikleri.setdefault(r, set()).add(k)
+            derslik_iliskileri.setdefault(k, set()).add(r)
+        
+        serbest = set(degisenler)
+        sinir = set(degisenler)
+        for _ in range(seviye):
+            yeni = set()
+            for r in sinir:
+                iliski = self.ders_sinif_iliskileri[r]
+                yeni.update(self.ogretmen_iliskileri[iliski["ogretmen_id"]])
+                yeni.update(self.sinif_iliskileri[iliski["sinif_id"]])
+                
+                derslikler = set(iliski_derslikleri.get(r, ()))
+                if not self.uygun_derslikler[r].all():
+                    derslikler.update(np.flatnonzero(self.uygun_derslikler[r]).tolist())
+                for k in derslikler:
+                    yeni.update(derslik_iliskileri.get(k, ()))
+            
+            sinir = yeni - serbest
+            serbest |= yeni
+            if not sinir:
+                break
+        
+        return serbest
+    
+    def repair_schedule(self):
+        """
+        Mevcut programı onarır ve kaydeder
+        
+        Returns:
+            bool: Başarılı mı?
+        """
+        try:
+            if self.repair():
                 return self.save_solution()
             else:
                 return False
         except Exception as e:
-            self.logger.error(f"Program oluşturulurken hata oluştu: {str(e)}")
+            self.logger.error(f"Program onarılırken hata oluştu: {str(e)}")
             raise
+
+# Alt süreçte ana sürecin durdurma olayı (bkz. _alt_sureci_baslat)
+_durdurma_olayi = None
+
+def _alt_sureci_baslat(durdurma_olayi):
+    """
+    Süreç havuzu başlatıcısı: ana süreçle paylaşılan durdurma olayını saklar
+    
+    Olay süreç oluşturulurken aktarıldığından görev argümanı olarak
+    gönderilemeyen multiprocessing.Event kullanılabilir.
+    
+    Args:
+        durdurma_olayi (multiprocessing.Event): Ayarlandığında alt süreçteki çözüm durdurulur
+    """
+    global _durdurma_olayi
+    _durdurma_olayi = durdurma_olayi
+
+def _durdurma_izle(olusturucu, bitti):
+    """
+    Ana süreç durdurma olayını ayarladığında alt süreçteki çözümü durdurur
+    
+    Args:
+        olusturucu (ProgramOlusturucu): Alt süreçteki program oluşturucu
+        bitti (threading.Event): Görev bittiğinde ayarlanır
+    """
+    while not bitti.is_set():
+        if _durdurma_olayi.wait(0.1):
+            olusturucu.durdur()
+            return
+
+def _durdurulabilir_calistir(olusturucu, islev):
+    """
+    İşlevi, ana sürecin durdurma olayı izlenirken çalıştırır
+    
+    Args:
+        olusturucu (ProgramOlusturucu): Alt süreçteki program oluşturucu
+        islev (callable): Çalıştırılacak işlev
+        
+    Returns:
+        İşlevin döndürdüğü değer
+    """
+    if _durdurma_olayi is None:
+        return islev()
+    
+    bitti = threading.Event()
+    threading.Thread(target=_durdurma_izle, args=(olusturucu, bitti), daemon=True).start()
+    try:
+        return islev()
+    finally:
+        bitti.set()
+
+def _bileseni_coz(veri):
+    """
+    Bir bileşeni ayrı bir süreçte kurup çözer
+    
+    Süreç havuzunda çalıştırıldığı için modül düzeyinde tanımlıdır.
+    
+    Args:
+        veri (dict): ProgramOlusturucu._bilesen_verisi çıktısı
+        
+    Returns:
+        dict: Atamalar (çözüm yoksa None), ilişki ve değişken sayısı, süreler ve durum
+    """
+    olusturucu = ProgramOlusturucu(AyarSozlugu(veri["ayarlar"]), None)
+    olusturucu.set_data(veri)
+    
+    def kur_ve_coz():
+        baslangic = time.time()
+        olusturucu.create_model()
+        kurma_suresi = time.time() - baslangic
+        
+        baslangic = time.time()
+        basarili = olusturucu.solve()
+        return basarili, kurma_suresi, time.time() - baslangic
+    
+    basarili, kurma_suresi, cozum_suresi = _durdurulabilir_calistir(olusturucu, kur_ve_coz)
+    
+    return {
+        "atamalar": olusturucu.cozum_atamalari() if basarili else None,
+        "iliski_sayisi": len(olusturucu.ders_sinif_iliskileri),
+        "degisken_sayisi": len(olusturucu.degiskenler),
+        "kurma_suresi": kurma_suresi,
+        "cozum_suresi": cozum_suresi,
+        "durum": olusturucu.solver.StatusName(olusturucu.son_durum) if olusturucu.son_durum is not None else "UNKNOWN",
+        "amac": olusturucu.solver.ObjectiveValue() if basarili else None
+    }
+
+def _arka_ucu_calistir(ad, veri):
+    """
+    Bir arka ucu ayrı bir süreçte verilerin anlık görüntüsü üzerinde çalıştırır
+    
+    Süreç havuzunda çalıştırıldığı için modül düzeyinde tanımlıdır.
+    
+    Args:
+        ad (str): ARKA_UCLAR anahtarı
+        veri (dict): ProgramOlusturucu.anlik_goruntu çıktısı
+        
+    Returns:
+        CozumSonucu: Sonuç
+    """
+    olusturucu = ProgramOlusturucu(AyarSozlugu(veri["ayarlar"]), None)
+    olusturucu.set_data(veri)
+    return _durdurulabilir_calistir(olusturucu, lambda: ARKA_UCLAR[ad]().coz(olusturucu))
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sentetik okul verisi modülü
+Performans ölçümleri için sınıf, öğretmen, derslik, laboratuvar oranı,
+uygunsuzluk yoğunluğu ve haftalık ders saati parametreleriyle gerçekçi okul
+verisi üretir ve geçici bir veritabanına yazar
+"""
+
+import os
+import math
+import random
+import logging
+import tempfile
+
+from data.database import Database
+
+class SentetikOkulUretici:
+    """
+    Gerçekçi sentetik okul verisi üreten sınıf
+    
+    Her sınıf aynı ders çizelgesini alır: laboratuvar dersleri laboratuvar
+    kapasitesinin yaklaşık %70'ini dolduracak kadar, kalan saatler ders
+    havuzundan sırayla doldurulur. Öğretmenler derslere yüklerine göre
+    dağıtılır ve her sınıf-ders ilişkisi o dersin en az yüklü öğretmenine
+    verilir. Birden fazla kampüs istenirse sınıflar, öğretmenler ve derslikler
+    kampüslere bölünür; laboratuvar dersleri her kampüste yalnızca o kampüsün
+    laboratuvarlarında yapılabilen ayrı dersler olur. Üretim tohumla
+    tekrarlanabilirdir.
+    """
+    
+    # (ders adı, haftalık saat)
+    DERS_HAVUZU = [
+        ("Matematik", 6),
+        ("Türk Dili ve Edebiyatı", 5),
+        ("İngilizce", 4),
+        ("Fizik", 3),
+        ("Kimya", 3),
+        ("Biyoloji", 2),
+        ("Tarih", 2),
+        ("Coğrafya", 2),
+        ("Din Kültürü", 2),
+        ("Beden Eğitimi", 2),
+        ("Felsefe", 2),
+        ("Görsel Sanatlar", 2),
+        ("Müzik", 2),
+        ("Almanca", 2),
+        ("Rehberlik", 1)
+    ]
+    
+    # Özel derslik (laboratuvar) gerektiren dersler
+    LAB_DERSLERI = ["Fizik Laboratuvarı", "Kimya Laboratuvarı", "Biyoloji Laboratuvarı", "Bilişim Lab"]
+    
+    # Bir öğretmene verilecek en fazla haftalık ders saati (öğretmen sayısı otomatik seçilirken)
+    OGRETMEN_MAX_YUK = 24
+    
+    def __init__(self, sinif_sayisi=12, ogretmen_sayisi=None, derslik_sayisi=None, lab_orani=0.15,
+                 uygunsuzluk_yogunlugu=0.1, haftalik_saat=30, gunluk_ders=8, kampus_sayisi=1, tohum=1):
+        """
+        Üreticiyi başlatır
+        
+        Args:
+            sinif_sayisi (int): Sınıf sayısı
+            ogretmen_sayisi (int, optional): Öğretmen sayısı; verilmezse hiçbir öğretmene OGRETMEN_MAX_YUK saatten fazla ders düşmeyecek şekilde seçilir
+            derslik_sayisi (int, optional): Toplam derslik sayısı; verilmezse her sınıfa bir normal derslik düşecek şekilde seçilir
+            lab_orani (float): Dersliklerin laboratuvar (özel derslik) olan oranı
+            uygunsuzluk_yogunlugu (float): Öğretmen başına uygun olmayan saatlerin haftalık saatlere oranı
+            haftalik_saat (int): Her sınıfın haftalık toplam ders saati
+            gunluk_ders (int): Günlük ders saati sayısı (max_gunluk_ders ayarı)
+            kampus_sayisi (int): Öğretmen ve derslik paylaşmayan kampüs sayısı
+            tohum (int): Rastgele sayı üreteci tohumu
+            
+        Raises:
+            ValueError: Kampüs sayısı sınıf, öğretmen veya laboratuvar sayısından fazlaysa
+        """
+        self.sinif_sayisi = sinif_sayisi
+        self.lab_orani = lab_orani
+        self.uygunsuzluk_yogunlugu = uygunsuzluk_yogunlugu
+        self.haftalik_saat = haftalik_saat
+        self.gunluk_ders = gunluk_ders
+        self.gun_sayisi = 5
+        self.kampus_sayisi = kampus_sayisi
+        self.tohum = tohum
+        self.logger = logging.getLogger(__name__)
+        
+        if derslik_sayisi is None:
+            derslik_sayisi = math.ceil(sinif_sayisi / (1 - lab_orani)) if lab_orani < 1 else sinif_sayisi
+        self.derslik_sayisi = derslik_sayisi
+        self.lab_sayisi = min(derslik_sayisi, round(derslik_sayisi * lab_orani))
+        
+        self.cizelge = self._cizelge_olustur()
+        
+        if ogretmen_sayisi is None:
+            ogretmen_sayisi = sum(
+                max(sum(self._en_az_ogretmenler(len(siniflar))), math.ceil(len(siniflar) * haftalik_saat / 22))
+                for siniflar in self._kampuslere_bol(sinif_sayisi)
+            )
+        self.ogretmen_sayisi = ogretmen_sayisi
+        
+        if not 1 <= kampus_sayisi <= min(sinif_sayisi, ogretmen_sayisi) or 0 < self.lab_sayisi < kampus_sayisi:
+            raise ValueError(f"{kampus_sayisi} kampüs için sınıf, öğretmen veya laboratuvar sayısı yetersiz")
+    
+    def _cizelge_olustur(self):
+        """
+        Her sınıfın aldığı dersleri ve haftalık saatlerini belirler
+        
+        Returns:
+            list: (ders adı, haftalık saat) demetleri
+        """
+        cizelge = []
+        kalan = self.haftalik_saat
+        
+        # Laboratuvar dersleri: 2 saatlik dersler, laboratuvar kapasitesinin ~%70'i kadar
+        if self.lab_sayisi:
+            lab_kapasitesi = self.lab_sayisi * self.gun_sayisi * self.gunluk_ders
+            lab_saati = min(int(0.7 * lab_kapasitesi / self.sinif_sayisi) // 2 * 2, self.haftalik_saat // 3)
+            for i in range(lab_saati // 2):
+                cizelge.append((self.LAB_DERSLERI[i % len(self.LAB_DERSLERI)] + (f" {i // len(self.LAB_DERSLERI) + 1}" if i >= len(self.LAB_DERSLERI) else ""), 2))
+            kalan -= lab_saati
+        
+        # Kalan saatler ders havuzundan sırayla (gerekirse havuz tekrar edilerek) doldurulur
+        i = 0
+        while kalan > 0:
+            ad, saat = self.DERS_HAVUZU[i % len(self.DERS_HAVUZU)]
+            if i >= len(self.DERS_HAVUZU):
+                ad = f"{ad} {i // len(self.DERS_HAVUZU) + 1}"
+            saat = min(saat, kalan)
+            cizelge.append((ad, saat))
+            kalan -= saat
+            i += 1
+        
+        return cizelge
+    
+    def _kampuslere_bol(self, sayi):
+        """
+        Sıra numaralarını kampüslere olabildiğince eşit, ardışık dilimler halinde böler
+        
+        Args:
+            sayi (int): Bölünecek öğe sayısı
+            
+        Returns:
+            list: Her kampüs için range
+        """
+        taban, artan = divmod(sayi, self.kampus_sayisi)
+        dilimler = []
+        baslangic = 0
+        for kampus in range(self.kampus_sayisi):
+            uzunluk = taban + (1 if kampus < artan else 0)
+            dilimler.append(range(baslangic, baslangic + uzunluk))
+            baslangic += uzunluk
+        return dilimler
+    
+    def _en_az_ogretmenler(self, sinif_sayisi):
+        """
+        Her ders için yükü OGRETMEN_MAX_YUK sınırında taşıyacak en az öğretmen sayısı
+        
+        Args:
+            sinif_sayisi (int): Dersleri alan sınıf sayısı
+            
+        Returns:
+            list: Ders sırasına göre öğretmen sayıları
+        """
+        return [max(1, math.ceil(saat * sinif_sayisi / self.OGRETMEN_MAX_YUK)) for _, saat in self.cizelge]
+    
+    def _ogretmenleri_dagit(self, sinif_sayisi, ogretmen_sayisi):
+        """
+        Öğretmen sayısını derslere toplam yüklerine göre dağıtır
+        
+        Args:
+            sinif_sayisi (int): Dersleri alan sınıf sayısı
+            ogretmen_sayisi (int): Dağıtılacak öğretmen sayısı
+            
+        Returns:
+            list: Her ders için öğretmen sıraları listesi
+        """
+        yukler = [saat * sinif_sayisi for _, saat in self.cizelge]
+        toplam = sum(yukler)
+        
+        # Öğretmen sayısı dersten azsa dersler öğretmenleri sırayla paylaşır
+        if ogretmen_sayisi < len(self.cizelge):
+            return [[i % ogretmen_sayisi] for i in range(len(self.cizelge))]
+        
+        # Her derse en az sayıda öğretmen (yetmiyorsa birer öğretmen), kalanlar yüke göre en büyük kalan yöntemiyle
+        en_az = self._en_az_ogretmenler(sinif_sayisi)
+        if sum(en_az) > ogretmen_sayisi:
+            en_az = [1] * len(yukler)
+        paylar = [taban + (ogretmen_sayisi - sum(en_az)) * yuk / toplam for taban, yuk in zip(en_az, yukler)]
+        sayilar = [int(pay) for pay in paylar]
+        for i in sorted(range(len(paylar)), key=lambda i: paylar[i] - sayilar[i], reverse=True)[:ogretmen_sayisi - sum(sayilar)]:
+            sayilar[i] += 1
+        
+        dagilim = []
+        sira = 0
+        for sayi in sayilar:
+            dagilim.append(list(range(sira, sira + sayi)))
+            sira += sayi
+        return dagilim
+    
+    def _uygunsuz_zamanlar(self, rnd, yuk):
+        """
+        Bir öğretmen için uygun olmayan zaman aralıkları üretir
+        
+        Uygun olmayan saat sayısı, öğretmenin yükü ve her gün için bir saatlik pay
+        kalacak şekilde sınırlanır.
+        
+        Args:
+            rnd (random.Random): Rastgele sayı üreteci
+            yuk (int): Öğretmenin haftalık ders yükü
+            
+        Returns:
+            list: (gun, saat_baslangic, saat_bitis) demetleri (bitiş hariç)
+        """
+        haftalik = self.gun_sayisi * self.gunluk_ders
+        hedef = min(round(self.uygunsuzluk_yogunlugu * haftalik), haftalik - yuk - self.gun_sayisi)
+        
+        dolu = set()
+        araliklar = []
+        while len(dolu) < hedef:
+            gun = rnd.randrange(self.gun_sayisi)
+            uzunluk = min(rnd.randint(1, 3), hedef - len(dolu))
+            
+            # Öğretmenler çoğunlukla günün başını veya sonunu kapatır
+            baslangic = rnd.choice([0, self.gunluk_ders - uzunluk, rnd.randrange(self.gunluk_ders - uzunluk + 1)])
+            saatler = {(gun, saat) for saat in range(baslangic, baslangic + uzunluk)}
+            if saatler & dolu:
+                continue
+            dolu |= saatler
+            araliklar.append((gun, baslangic, baslangic + uzunluk))
+        
+        return araliklar
+    
+    def olustur(self, yol=None):
+        """
+        Sentetik okulu üretir ve veritabanına yazar
+        
+        Args:
+            yol (str, optional): Veritabanı dosyası; verilmezse geçici bir dizinde oluşturulur
+            
+        Returns:
+            Database: Verileri yazılmış veritabanı bağlantısı
+        """
+        try:
+            if yol is None:
+                yol = os.path.join(tempfile.mkdtemp(prefix="sentetik_okul_"), "okul.db")
+            elif os.path.exists(yol):
+                os.remove(yol)
+            
+            rnd = random.Random(self.tohum)
+            db = Database(yol)
+            
+            # Ayarlar (önbellek ölçümleri bozmaması için kapatılır)
+            db.ayar_ekle_veya_guncelle("max_gunluk_ders", str(self.gunluk_ders))
+            db.ayar_ekle_veya_guncelle("onbellek_kullan", "0")
+            
+            # Derslikler
+            normal_derslikler = [db.derslik_ekle(f"Derslik {i + 1}", "normal") for i in range(self.derslik_sayisi - self.lab_sayisi)]
+            laboratuvarlar = [db.derslik_ekle(f"Laboratuvar {i + 1}", "ozel") for i in range(self.lab_sayisi)]
+            
+            # Kampüsler: (sınıf, öğretmen, normal derslik, laboratuvar) sıra dilimleri
+            kampusler = list(zip(
+                self._kampuslere_bol(self.sinif_sayisi), self._kampuslere_bol(self.ogretmen_sayisi),
+                self._kampuslere_bol(len(normal_derslikler)), self._kampuslere_bol(self.lab_sayisi)
+            ))
+            
+            # Sınıflar: 9-12. sınıflar, her düzeyde A, B, C... şubeleri
+            # (kampüsünde normal derslik yettiği sürece her sınıfın bir ev dersliği olur)
+            duzey_basina = math.ceil(self.sinif_sayisi / 4)
+            ev_derslikleri = {}
+            for sinif_dilimi, _, derslik_dilimi, _ in kampusler:
+                for j, i in enumerate(sinif_dilimi):
+                    ev_derslikleri[i] = normal_derslikler[derslik_dilimi[j]] if j < len(derslik_dilimi) else None
+            siniflar = [
+                db.sinif_ekle(str(9 + i // duzey_basina), self._sube_adi(i % duzey_basina), self.haftalik_saat, ev_derslikleri[i])
+                for i in range(self.sinif_sayisi)
+            ]
+            
+            # Her sınıf-ders ilişkisi, sınıfın kampüsünde dersin en az yüklü öğretmenine verilir
+            yukler = [0] * self.ogretmen_sayisi
+            branslar = {}
+            atamalar = []
+            for c, (sinif_dilimi, ogretmen_dilimi, _, _) in enumerate(kampusler):
+                dagilim = [
+                    [ogretmen_dilimi[o] for o in ogretmen_siralari]
+                    for ogretmen_siralari in self._ogretmenleri_dagit(len(sinif_dilimi), len(ogretmen_dilimi))
+                ]
+                for s in sinif_dilimi:
+                    for d, (_, saat) in enumerate(self.cizelge):
+                        o = min(dagilim[d], key=lambda o: yukler[o])
+                        yukler[o] += saat
+                        atamalar.append((s, c, d, o))
+                
+                # Branş, öğretmenin ilk dağıtıldığı ders
+                for d, ogretmen_siralari in enumerate(dagilim):
+                    for o in ogretmen_siralari:
+                        branslar.setdefault(o, self.cizelge[d][0])
+            
+            # Dersler; tek kampüs yoksa laboratuvar dersleri kampüs başına ayrı ders olur
+            # ve yalnızca o kampüsün laboratuvarlarında yapılabilir
+            dersler = [[] for _ in kampusler]
+            for ad, saat in self.cizelge:
+                if not ad.startswith(tuple(self.LAB_DERSLERI)):
+                    ders_id = db.ders_ekle(ad, saat, "normal")
+                    for kampus_dersleri in dersler:
+                        kampus_dersleri.append(ders_id)
+                elif self.kampus_sayisi == 1:
+                    dersler[0].append(db.ders_ekle(ad, saat, "ozel"))
+                else:
+                    for c, (_, _, _, lab_dilimi) in enumerate(kampusler):
+                        ders_id = db.ders_ekle(f"{ad} (Kampüs {c + 1})", saat, "ozel")
+                        db.ders_dersliklerini_ayarla(ders_id, [laboratuvarlar[k] for k in lab_dilimi])
+                        dersler[c].append(ders_id)
+            
+            ogretmenler = [
+                db.ogretmen_ekle(f"Öğretmen {o + 1}", branslar.get(o, "Genel"), yukler[o])
+                for o in range(self.ogretmen_sayisi)
+            ]
+            
+            for s, c, d, o in atamalar:
+                db.ders_sinif_iliskisi_ekle(dersler[c][d], siniflar[s], ogretmenler[o], self.cizelge[d][1])
+            
+            # Uygun olmayan zamanlar
+            for o, ogretmen_id in enumerate(ogretmenler):
+                for gun, baslangic, bitis in self._uygunsuz_zamanlar(rnd, yukler[o]):
+                    db.uygun_olmayan_zaman_ekle(ogretmen_id, gun, baslangic, bitis)
+            
+            self.logger.info(
+                f"Sentetik okul oluşturuldu: {self.kampus_sayisi} kampüs, {self.sinif_sayisi} sınıf, {self.ogretmen_sayisi} öğretmen, "
+                f"{self.derslik_sayisi} derslik ({self.lab_sayisi} laboratuvar), {len(set().union(*dersler))} ders ({yol})"
+            )
+            return db
+        except Exception as e:
+            self.logger.error(f"Sentetik okul oluşturulurken hata oluştu: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _sube_adi(sira):
+        """
+        Sıra numarasından şube adı üretir (A, B, ..., Z, AA, AB, ...)
+        """
+        ad = ""
+        sira += 1
+        while sira:
+            sira, kalan = divmod(sira - 1, 26)
+            ad = chr(ord("A") + kalan) + ad
+        return ad
+    
+    def parametreler(self):
+        """
+        Üretim parametrelerini döndürür (ölçüm sonuçlarına eklemek için)
+        
+        Returns:
+            dict: Parametreler
+        """
+        return {
+            "sinif_sayisi": self.sinif_sayisi,
+            "ogretmen_sayisi": self.ogretmen_sayisi,
+            "derslik_sayisi": self.derslik_sayisi,
+            "lab_sayisi": self.lab_sayisi,
+            "uygunsuzluk_yogunlugu": self.uygunsuzluk_yogunlugu,
+            "haftalik_saat": self.haftalik_saat,
+            "gunluk_ders": self.gunluk_ders,
+            "kampus_sayisi": self.kampus_sayisi,
+            "tohum": self.tohum
+        }
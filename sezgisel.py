@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sezgisel program oluşturma modülü
+Model kurmadan, açgözlü bir yerleştirmeyle saniyenin altında taslak program
+oluşturur. Taslak elle düzenlemeye başlamak veya CP-SAT'a başlangıç ipucu
+vermek için kullanılır.
+"""
+
+import time
+import logging
+
+class HizliProgramOlusturucu:
+    """
+    En kısıtlı ilişkiden başlayarak dersleri tek tek yerleştiren açgözlü program oluşturucu
+    
+    Öğretmen, sınıf ve derslik doluluğu haftalık bit kümeleriyle (Python int'i,
+    gün × saat_sayisi + saat numaralı bit) tutulur. Her ilişki için her gün en
+    fazla bir ardışık blok (blok ders açıksa en fazla max_blok_ders saat), aynı
+    derslikte ve öğretmenin uygun saatlerinde yerleştirilir; öğretmen ve sınıf
+    günlük üst sınırları ile aynı ders tekrar sınırı uygulanır. Günlük alt sınırlar ve amaç fonksiyonu dikkate alınmaz,
+    yer bulunamayan ders saatleri eksik olarak raporlanır.
+    """
+    
+    def __init__(self, olusturucu):
+        """
+        Sezgisel oluşturucuyu başlatır
+        
+        Args:
+            olusturucu (ProgramOlusturucu): Verileri yüklenmiş ve compute_domains çağrılmış program oluşturucu
+        """
+        self.olusturucu = olusturucu
+        self.logger = logging.getLogger(__name__)
+        
+        self.gun_sayisi = olusturucu.gun_sayisi
+        self.saat_sayisi = olusturucu.saat_sayisi
+        self.gun_maskesi = (1 << self.saat_sayisi) - 1
+    
+    def _uygunluk_maskeleri(self):
+        """
+        Her ilişkinin uygun zamanlarını haftalık bit kümesine çevirir
+        """
+        agirliklar = [1 << (gun * self.saat_sayisi + saat) for gun in range(self.gun_sayisi) for saat in range(self.saat_sayisi)]
+        maskeler = []
+        for satir in self.olusturucu.uygun_zamanlar.reshape(len(self.olusturucu.ders_sinif_iliskileri), -1):
+            maske = 0
+            for bit, uygun in zip(agirliklar, satir.tolist()):
+                if uygun:
+                    maske |= bit
+            maskeler.append(maske)
+        return maskeler
+    
+    def _gun_dolulugu(self, bitler, gun):
+        """
+        Haftalık bit kümesinden bir günün saat sayısını döndürür
+        """
+        return ((bitler >> (gun * self.saat_sayisi)) & self.gun_maskesi).bit_count()
+    
+    def olustur(self):
+        """
+        Taslak programı oluşturur
+        
+        Returns:
+            tuple: (atamalar, eksikler). atamalar (ilişki, gün, saat, derslik) indeks
+                demetleri; eksikler yerleştirilemeyen ilişkiler için
+                {"iliski": ilişki, "eksik_saat": saat sayısı} sözlükleri
+        """
+        baslangic = time.time()
+        o = self.olusturucu
+        iliskiler = o.ders_sinif_iliskileri
+        
+        uygun_maskeler = self._uygunluk_maskeleri()
+        izinli_derslikler = [[int(k) for k in satir.nonzero()[0]] for satir in o.uygun_derslikler]
+        
+        ogretmen_dolu = {}
+        sinif_dolu = {}
+        derslik_dolu = [0] * len(o.derslikler)
+        tekrarlar = {}
+        sinif_derslikleri = {}
+        
+        # En kısıtlı önce: az dersliği, az boş zamanı ve çok saati olan ilişkiler önce yerleşir
+        sira = sorted(
+            range(len(iliskiler)),
+            key=lambda r: (len(izinli_derslikler[r]), uygun_maskeler[r].bit_count() - iliskiler[r]["haftalik_saat"], -iliskiler[r]["haftalik_saat"])
+        )
+        
+        atamalar = []
+        eksikler = []
+        for r in sira:
+            iliski = iliskiler[r]
+            ogretmen_id, sinif_id = iliski["ogretmen_id"], iliski["sinif_id"]
+            kalan = iliski["haftalik_saat"]
+            kullanilan_gunler = set()
+            
+            while kalan > 0:
+                secim = self._blok_sec(
+                    r, kalan, kullanilan_gunler, uygun_maskeler[r], izinli_derslikler[r],
+                    ogretmen_dolu.get(ogretmen_id, 0), sinif_dolu.get(sinif_id, 0), derslik_dolu,
+                    tekrarlar, sinif_derslikleri.get(sinif_id)
+                )
+                if secim is None:
+                    break
+                
+                gun, saat, uzunluk, k = secim
+                maske = ((1 << uzunluk) - 1) << (gun * self.saat_sayisi + saat)
+                ogretmen_dolu[ogretmen_id] = ogretmen_dolu.get(ogretmen_id, 0) | maske
+                sinif_dolu[sinif_id] = sinif_dolu.get(sinif_id, 0) | maske
+                derslik_dolu[k] |= maske
+                anahtar = (sinif_id, iliski["ders_id"], gun)
+                tekrarlar[anahtar] = tekrarlar.get(anahtar, 0) + uzunluk
+                sinif_derslikleri[sinif_id] = k
+                kullanilan_gunler.add(gun)
+                
+                atamalar.extend((r, gun, saat + i, k) for i in range(uzunluk))
+                kalan -= uzunluk
+            
+            if kalan > 0:
+                eksikler.append({"iliski": iliski, "eksik_saat": kalan})
+        
+        self.logger.info(
+            f"Sezgisel taslak {(time.time() - baslangic) * 1000:.0f} ms'de oluşturuldu: {len(atamalar)} ders saati yerleşti, "
+            f"{sum(eksik['eksik_saat'] for eksik in eksikler)} ders saati ({len(eksikler)} ilişki) yerleştirilemedi"
+        )
+        return atamalar, eksikler
+    
+    def _blok_sec(self, r, kalan, kullanilan_gunler, uygun, derslikler, ogretmen, sinif, derslik_dolu, tekrarlar, son_derslik):
+        """
+        İlişkinin bir sonraki bloğu için gün, başlangıç saati, uzunluk ve derslik seçer
+        
+        Mümkün olan en uzun blok, o gün en az dersi olan sınıf gününe ve en erken
+        saate yerleştirilir. Derslik olarak sınıfın son kullandığı derslik tercih edilir.
+        
+        Returns:
+            tuple: (gun, saat, uzunluk, derslik) veya yer yoksa None
+        """
+        o = self.olusturucu
+        iliski = o.ders_sinif_iliskileri[r]
+        if son_derslik in derslikler:
+            derslikler = [son_derslik] + [k for k in derslikler if k != son_derslik]
+        
+        en_iyi = None
+        for gun in range(self.gun_sayisi):
+            if gun in kullanilan_gunler:
+                continue
+            
+            sinif_yuku = self._gun_dolulugu(sinif, gun)
+            en_uzun = min(
+                kalan,
+                o.max_blok_ders if o.blok_ders_arka_arkaya else kalan,
+                o.ayni_ders_tekrar - tekrarlar.get((iliski["sinif_id"], iliski["ders_id"], gun), 0),
+                o.ogretmen_gunluk_max - self._gun_dolulugu(ogretmen, gun),
+                o.sinif_gunluk_max - sinif_yuku
+            )
+            if en_uzun <= 0 or (en_iyi is not None and (-en_uzun, sinif_yuku) >= en_iyi[0]):
+                continue
+            
+            kaydirma = gun * self.saat_sayisi
+            bos = (uygun & ~ogretmen & ~sinif) >> kaydirma & self.gun_maskesi
+            for uzunluk in range(en_uzun, 0, -1):
+                if en_iyi is not None and (-uzunluk, sinif_yuku) >= en_iyi[0]:
+                    break
+                blok = (1 << uzunluk) - 1
+                yer = self._yer_bul(bos, blok, uzunluk, kaydirma, derslikler, derslik_dolu)
+                if yer is not None:
+                    en_iyi = ((-uzunluk, sinif_yuku), (gun, yer[0], uzunluk, yer[1]))
+                    break
+        
+        return en_iyi[1] if en_iyi is not None else None
+    
+    def _yer_bul(self, bos, blok, uzunluk, kaydirma, derslikler, derslik_dolu):
+        """
+        Gün içinde bloğun sığdığı en erken saati ve boş dersliği bulur
+        
+        Returns:
+            tuple: (saat, derslik) veya yer yoksa None
+        """
+        for saat in range(self.saat_sayisi - uzunluk + 1):
+            maske = blok << saat
+            if bos & maske != maske:
+                continue
+            haftalik = maske << kaydirma
+            for k in derslikler:
+                if not derslik_dolu[k] & haftalik:
+                    return saat, k
+        return None
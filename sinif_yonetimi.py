@@ -13,6 +13,9 @@ class SinifYonetimi:
     Sınıf yönetimi arayüzü
     """
     
+    # Ev dersliği seçim kutusunda "ev dersliği yok" seçeneği
+    EV_DERSLIGI_YOK = "(Yok)"
+    
     def __init__(self, parent, db, config):
         """
         Sınıf yönetimi arayüzünü başlatır
@@ -86,7 +89,7 @@ class SinifYonetimi:
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Treeview
-        self.tree = ttk.Treeview(self.list_frame_inner, columns=("ad", "sube", "haftalik_saat"), 
+        self.tree = ttk.Treeview(self.list_frame_inner, columns=("ad", "sube", "haftalik_saat"),
                                 show="headings", selectmode="browse", yscrollcommand=self.scrollbar.set)
         self.tree.pack(fill=tk.BOTH, expand=True)
         
@@ -144,9 +147,16 @@ class SinifYonetimi:
         self.haftalik_saat_spinbox = ttk.Spinbox(self.form_frame, from_=0, to=50, textvariable=self.haftalik_saat_var)
         self.haftalik_saat_spinbox.grid(row=2, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
         
+        # Ev Dersliği (ev dersliği modunda özel derslik gerektirmeyen dersler bu derslikte yapılır)
+        ttk.Label(self.form_frame, text="Ev Dersliği:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.ev_derslik_var = tk.StringVar()
+        self.ev_derslik_combobox = ttk.Combobox(self.form_frame, textvariable=self.ev_derslik_var, state="readonly")
+        self.ev_derslik_combobox.grid(row=3, column=1, sticky=tk.W+tk.E, padx=5, pady=5)
+        self.ev_derslik_combobox.derslik_ids = {}
+        
         # Butonlar
         self.form_button_frame = ttk.Frame(self.form_frame)
-        self.form_button_frame.grid(row=3, column=0, columnspan=2, pady=10)
+        self.form_button_frame.grid(row=4, column=0, columnspan=2, pady=10)
         
         self.save_button = ttk.Button(self.form_button_frame, text="Kaydet", command=self.save_sinif)
         self.save_button.pack(side=tk.LEFT, padx=5)
@@ -155,11 +165,11 @@ class SinifYonetimi:
         self.cancel_button.pack(side=tk.LEFT, padx=5)
         
         # Sınıf Dersleri
-        ttk.Label(self.form_frame, text="Sınıf Dersleri:", font=("TkDefaultFont", 10, "bold")).grid(row=4, column=0, columnspan=2, sticky=tk.W, padx=5, pady=10)
+        ttk.Label(self.form_frame, text="Sınıf Dersleri:", font=("TkDefaultFont", 10, "bold")).grid(row=5, column=0, columnspan=2, sticky=tk.W, padx=5, pady=10)
         
         # Ders listesi çerçevesi
         self.ders_frame = ttk.Frame(self.form_frame)
-        self.ders_frame.grid(row=5, column=0, columnspan=2, sticky=tk.W+tk.E+tk.N+tk.S, padx=5, pady=5)
+        self.ders_frame.grid(row=6, column=0, columnspan=2, sticky=tk.W+tk.E+tk.N+tk.S, padx=5, pady=5)
         
         # Ders listesi
         self.ders_tree_frame = ttk.Frame(self.ders_frame)
@@ -170,7 +180,7 @@ class SinifYonetimi:
         self.ders_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Treeview
-        self.ders_tree = ttk.Treeview(self.ders_tree_frame, columns=("ders", "ogretmen", "saat"), 
+        self.ders_tree = ttk.Treeview(self.ders_tree_frame, columns=("ders", "ogretmen", "saat"),
                                     show="headings", selectmode="browse", yscrollcommand=self.ders_scrollbar.set)
         self.ders_tree.pack(fill=tk.BOTH, expand=True)
         
@@ -201,7 +211,21 @@ class SinifYonetimi:
         
         # Form alanlarını genişlet
         self.form_frame.columnconfigure(1, weight=1)
-        self.form_frame.rowconfigure(5, weight=1)
+        self.form_frame.rowconfigure(6, weight=1)
+    
+    def refresh_derslik_list(self):
+        """
+        Ev dersliği seçim kutusundaki derslikleri yeniler
+        """
+        try:
+            derslikler = self.db.tum_derslikleri_getir()
+            
+            # İlk seçenek ev dersliği olmadığını belirtir
+            self.ev_derslik_combobox["values"] = [self.EV_DERSLIGI_YOK] + [derslik["ad"] for derslik in derslikler]
+            self.ev_derslik_combobox.derslik_ids = {derslik["ad"]: derslik["id"] for derslik in derslikler}
+        except Exception as e:
+            self.logger.error(f"Derslik listesi yükleme hatası: {str(e)}")
+            messagebox.showerror("Hata", f"Derslik listesi yüklenirken bir hata oluştu:\n{str(e)}")
     
     def refresh_list(self):
         """
@@ -211,13 +235,16 @@ class SinifYonetimi:
         for item in self.tree.get_children():
             self.tree.delete(item)
         
+        # Derslikler başka sekmede değişmiş olabilir
+        self.refresh_derslik_list()
+        
         try:
             # Sınıfları getir
             siniflar = self.db.tum_siniflari_getir()
             
             # Listeye ekle
             for sinif in siniflar:
-                self.tree.insert("", tk.END, values=(sinif["ad"], sinif["sube"], sinif["haftalik_toplam_saat"]), 
+                self.tree.insert("", tk.END, values=(sinif["ad"], sinif["sube"], sinif["haftalik_toplam_saat"]),
                                 tags=(sinif["id"],))
             
             self.logger.info(f"{len(siniflar)} sınıf listelendi")
@@ -241,9 +268,9 @@ class SinifYonetimi:
             
             # Filtrele ve listeye ekle
             for sinif in siniflar:
-                if (search_term in sinif["ad"].lower() or 
+                if (search_term in sinif["ad"].lower() or
                     search_term in sinif["sube"].lower()):
-                    self.tree.insert("", tk.END, values=(sinif["ad"], sinif["sube"], sinif["haftalik_toplam_saat"]), 
+                    self.tree.insert("", tk.END, values=(sinif["ad"], sinif["sube"], sinif["haftalik_toplam_saat"]),
                                     tags=(sinif["id"],))
         except Exception as e:
             self.logger.error(f"Sınıf listesi filtreleme hatası: {str(e)}")
@@ -276,6 +303,10 @@ class SinifYonetimi:
             self.sube_var.set(sinif["sube"])
             self.haftalik_saat_var.set(sinif["haftalik_toplam_saat"])
             
+            # Ev dersliği
+            derslik_adlari = {derslik_id: ad for ad, derslik_id in self.ev_derslik_combobox.derslik_ids.items()}
+            self.ev_derslik_var.set(derslik_adlari.get(sinif["ev_derslik_id"], self.EV_DERSLIGI_YOK))
+            
             # Sınıfın derslerini getir
             self.refresh_ders_list()
             
@@ -301,7 +332,7 @@ class SinifYonetimi:
             
             # Listeye ekle
             for ders in dersler:
-                self.ders_tree.insert("", tk.END, values=(ders["ders_adi"], ders["ogretmen_adi"], ders["haftalik_saat"]), 
+                self.ders_tree.insert("", tk.END, values=(ders["ders_adi"], ders["ogretmen_adi"], ders["haftalik_saat"]),
                                     tags=(ders["id"],))
             
             self.logger.info(f"{len(dersler)} ders listelendi")
@@ -317,6 +348,7 @@ class SinifYonetimi:
         self.ad_var.set("")
         self.sube_var.set("")
         self.haftalik_saat_var.set(30)  # Varsayılan değer
+        self.ev_derslik_var.set(self.EV_DERSLIGI_YOK)
         
         # Ders listesini temizle
         for item in self.ders_tree.get_children():
@@ -332,6 +364,7 @@ class SinifYonetimi:
         # Form verilerini al
         ad = self.ad_var.get().strip()
         sube = self.sube_var.get().strip()
+        ev_derslik_id = self.ev_derslik_combobox.derslik_ids.get(self.ev_derslik_var.get())
         
         try:
             haftalik_saat = int(self.haftalik_saat_var.get())
@@ -355,12 +388,12 @@ class SinifYonetimi:
         try:
             if self.selected_id:
                 # Mevcut sınıfı güncelle
-                self.db.sinif_guncelle(self.selected_id, ad, sube, haftalik_saat)
+                self.db.sinif_guncelle(self.selected_id, ad, sube, haftalik_saat, ev_derslik_id)
                 messagebox.showinfo("Bilgi", f"{ad} {sube} sınıfı başarıyla güncellendi.")
                 self.logger.info(f"Sınıf güncellendi: {ad} {sube}")
             else:
                 # Yeni sınıf ekle
-                self.selected_id = self.db.sinif_ekle(ad, sube, haftalik_saat)
+                self.selected_id = self.db.sinif_ekle(ad, sube, haftalik_saat, ev_derslik_id)
                 messagebox.showinfo("Bilgi", f"{ad} {sube} sınıfı başarıyla eklendi.")
                 self.logger.info(f"Sınıf eklendi: {ad} {sube}")
             
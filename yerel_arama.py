@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yerel arama modülü
+Bulunmuş bir programı, zaman ve derslik atamalarını taşıyıp takas ederek
+öğretmen boş saatleri ve derslik değişimleri bakımından iyileştirir
+"""
+
+import math
+import time
+import random
+import logging
+import numpy as np
+
+class YerelAramaIyilestirici:
+    """
+    Benzetimli tavlama ile program iyileştirici
+    
+    Program, sınıf × gün × saat boyutlu iki NumPy dizisiyle (ilişki sırası ve
+    derslik sırası, boşsa -1) tutulur; öğretmen ve derslik doluluğu ayrı boolean
+    dizilerdedir. Her hamlede yalnızca etkilenen öğretmen-gün ve sınıf-gün
+    satırlarının maliyeti yeniden hesaplanır. Çakışma ve uygunluk kısıtları
+    hamle üretilirken korunur; günlük sınırlar, aynı ders tekrarı ve blok
+    kısıtlarının ihlal sayısı hiçbir hamlede artmaz.
+    """
+    
+    def __init__(self, olusturucu):
+        """
+        İyileştiriciyi başlatır
+        
+        Args:
+            olusturucu (ProgramOlusturucu): Verileri yüklenmiş ve compute_domains çağrılmış program oluşturucu
+        """
+        self.olusturucu = olusturucu
+        self.logger = logging.getLogger(__name__)
+        
+        o = olusturucu
+        self.gun_sayisi = o.gun_sayisi
+        self.saat_sayisi = o.saat_sayisi
+        self.rastgele = random.Random(o.cozucu_rastgele_tohum)
+        
+        # Amaç ağırlıkları ProgramOlusturucu.add_objective ile aynı
+        self.bos_saat_agirligi = 1 if o.ogretmen_bos_saat_tercihi == "minimize" else -1
+        self.degisim_agirligi = 1 if o.derslik_degisim_minimize else 0
+        
+        ogretmen_sirasi = {ogretmen["id"]: t for t, ogretmen in enumerate(o.ogretmenler)}
+        sinif_sirasi = {sinif["id"]: s for s, sinif in enumerate(o.siniflar)}
+        cift_sirasi = {}
+        
+        self.iliski_ogretmen = np.array([ogretmen_sirasi[iliski["ogretmen_id"]] for iliski in o.ders_sinif_iliskileri], dtype=np.int32)
+        self.iliski_sinif = np.array([sinif_sirasi[iliski["sinif_id"]] for iliski in o.ders_sinif_iliskileri], dtype=np.int32)
+        self.iliski_cifti = np.array([
+            cift_sirasi.setdefault((iliski["sinif_id"], iliski["ders_id"]), len(cift_sirasi))
+            for iliski in o.ders_sinif_iliskileri
+        ], dtype=np.int32)
+        self.izinli_derslikler = [np.flatnonzero(satir).tolist() for satir in o.uygun_derslikler]
+        self.cift_sayisi = len(cift_sirasi)
+    
+    def _yukle(self, atamalar):
+        """
+        (iliski_id, gun, saat, derslik_id) demetlerini dizilere yerleştirir
+        """
+        o = self.olusturucu
+        iliski_sirasi = {iliski["id"]: r for r, iliski in enumerate(o.ders_sinif_iliskileri)}
+        boyut = (len(o.siniflar), self.gun_sayisi, self.saat_sayisi)
+        
+        self.sinif_iliski = np.full(boyut, -1, dtype=np.int32)
+        self.sinif_derslik = np.full(boyut, -1, dtype=np.int32)
+        self.ogretmen_dolu = np.zeros((len(o.ogretmenler), self.gun_sayisi, self.saat_sayisi), dtype=bool)
+        self.derslik_dolu = np.zeros((len(o.derslikler), self.gun_sayisi, self.saat_sayisi), dtype=bool)
+        self.cift_gun = np.zeros((self.cift_sayisi, self.gun_sayisi), dtype=np.int32)
+        
+        for iliski_id, gun, saat, derslik_id in atamalar:
+            r = iliski_sirasi[iliski_id]
+            s = self.iliski_sinif[r]
+            self.sinif_iliski[s, gun, saat] = r
+            self.sinif_derslik[s, gun, saat] = o.derslik_indeksleri[derslik_id]
+            self.ogretmen_dolu[self.iliski_ogretmen[r], gun, saat] = True
+            self.derslik_dolu[o.derslik_indeksleri[derslik_id], gun, saat] = True
+            self.cift_gun[self.iliski_cifti[r], gun] += 1
+    
+    def _atamalar(self):
+        """
+        Dizilerdeki programı (iliski_id, gun, saat, derslik_id) demetlerine çevirir
+        """
+        o = self.olusturucu
+        atamalar = []
+        for s, gun, saat in zip(*np.nonzero(self.sinif_iliski >= 0)):
+            r = self.sinif_iliski[s, gun, saat]
+            k = self.sinif_derslik[s, gun, saat]
+            atamalar.append((o.ders_sinif_iliskileri[r]["id"], int(gun), int(saat), o.derslikler[k]["id"]))
+        return atamalar
+    
+    def _bos_saat(self, t, gun):
+        """
+        Öğretmenin bir gündeki boş saat sayısı
+        """
+        dolu = np.flatnonzero(self.ogretmen_dolu[t, gun])
+        if len(dolu) == 0:
+            return 0
+        return int(dolu[-1] - dolu[0] + 1 - len(dolu))
+    
+    def _derslik_degisimi(self, s, gun):
+        """
+        Sınıfın bir gündeki ardışık saatler arası derslik değişimi sayısı
+        """
+        derslikler = self.sinif_derslik[s, gun]
+        onceki, simdiki = derslikler[:-1], derslikler[1:]
+        return int(((onceki >= 0) & (simdiki >= 0) & (onceki != simdiki)).sum())
+    
+    def _ihlal(self, s, gun):
+        """
+        Sınıf-gün satırı ve o satırdaki öğretmen ve ilişkiler için yumuşatılmış kısıt ihlali sayısı
+        
+        Günlük alt/üst sınırlar, aynı ders tekrarı ve blok kısıtı (ilişki başına
+        günde en fazla max_blok_ders saatlik tek ardışık blok, blok boyunca aynı
+        derslik) sayılır.
+        """
+        o = self.olusturucu
+        ihlal = 0
+        
+        sayi = int((self.sinif_iliski[s, gun] >= 0).sum())
+        ihlal += max(0, sayi - o.sinif_gunluk_max) + max(0, o.sinif_gunluk_min - sayi)
+        
+        iliskiler = self.sinif_iliski[s, gun]
+        for r in set(iliskiler[iliskiler >= 0].tolist()):
+            ihlal += max(0, int(self.cift_gun[self.iliski_cifti[r], gun]) - o.ayni_ders_tekrar)
+            if o.blok_ders_arka_arkaya:
+                saatler = np.flatnonzero(iliskiler == r)
+                ihlal += int((np.diff(saatler) > 1).sum())
+                ihlal += max(0, len(saatler) - o.max_blok_ders)
+                ihlal += int((np.diff(self.sinif_derslik[s, gun, saatler]) != 0).sum())
+        
+        return ihlal
+    
+    def _ogretmen_ihlali(self, t, gun):
+        """
+        Öğretmenin bir gündeki günlük sınır ihlali sayısı
+        """
+        o = self.olusturucu
+        sayi = int(self.ogretmen_dolu[t, gun].sum())
+        if sayi == 0:
+            return 0
+        return max(0, sayi - o.ogretmen_gunluk_max) + max(0, o.ogretmen_gunluk_min - sayi)
+    
+    def _durum(self, siniflar, ogretmenler):
+        """
+        Etkilenen satırların (maliyet, ihlal) toplamını döndürür
+        
+        Args:
+            siniflar (set): (sınıf, gün) çiftleri
+            ogretmenler (set): (öğretmen, gün) çiftleri
+        """
+        maliyet = 0
+        ihlal = 0
+        for s, gun in siniflar:
+            maliyet += self.degisim_agirligi * self._derslik_degisimi(s, gun)
+            ihlal += self._ihlal(s, gun)
+        for t, gun in ogretmenler:
+            maliyet += self.bos_saat_agirligi * self._bos_saat(t, gun)
+            ihlal += self._ogretmen_ihlali(t, gun)
+        return maliyet, ihlal
+    
+    def _yerlestir(self, s, gun, saat, r, k):
+        """
+        Hücreye ders yerleştirir (r = -1 ise hücreyi boşaltır)
+        """
+        eski_r = self.sinif_iliski[s, gun, saat]
+        if eski_r >= 0:
+            self.ogretmen_dolu[self.iliski_ogretmen[eski_r], gun, saat] = False
+            self.derslik_dolu[self.sinif_derslik[s, gun, saat], gun, saat] = False
+            self.cift_gun[self.iliski_cifti[eski_r], gun] -= 1
+        
+        self.sinif_iliski[s, gun, saat] = r
+        self.sinif_derslik[s, gun, saat] = k
+        if r >= 0:
+            self.ogretmen_dolu[self.iliski_ogretmen[r], gun, saat] = True
+            self.derslik_dolu[k, gun, saat] = True
+            self.cift_gun[self.iliski_cifti[r], gun] += 1
+    
+    def _derslik_sec(self, r, s, gun, saat, mevcut):
+        """
+        Dersin taşınacağı hücre için boş ve izinli bir derslik seçer
+        
+        Sınıfın komşu saatlerde kullandığı derslik, sonra dersin mevcut dersliği tercih edilir.
+        """
+        adaylar = []
+        for komsu in (saat - 1, saat + 1):
+            if 0 <= komsu < self.saat_sayisi and self.sinif_derslik[s, gun, komsu] >= 0:
+                adaylar.append(int(self.sinif_derslik[s, gun, komsu]))
+        adaylar.append(mevcut)
+        izinli = self.izinli_derslikler[r]
+        adaylar.append(izinli[self.rastgele.randrange(len(izinli))])
+        
+        for k in adaylar:
+            if k in izinli and not self.derslik_dolu[k, gun, saat]:
+                return k
+        return None
+    
+    def _hamle(self):
+        """
+        Rastgele bir taşıma, takas veya derslik değiştirme hamlesi üretir
+        
+        Returns:
+            list: Geri alınabilmesi için (sınıf, gün, saat, eski_r, eski_k, yeni_r, yeni_k)
+                değişiklikleri; geçerli hamle üretilemezse None
+        """
+        o = self.olusturucu
+        dolu = self.dolu_hucreler
+        s, g1, p1 = dolu[self.rastgele.randrange(len(dolu))]
+        r1 = int(self.sinif_iliski[s, g1, p1])
+        k1 = int(self.sinif_derslik[s, g1, p1])
+        if r1 < 0:
+            return None
+        t1 = self.iliski_ogretmen[r1]
+        
+        tur = self.rastgele.random()
+        if tur < 0.15:
+            # Derslik değiştirme
+            k2 = self._derslik_sec(r1, s, g1, p1, k1)
+            if k2 is None or k2 == k1:
+                return None
+            return [(s, g1, p1, r1, k1, r1, k2)]
+        
+        g2 = self.rastgele.randrange(self.gun_sayisi)
+        p2 = self.rastgele.randrange(self.saat_sayisi)
+        if (g1, p1) == (g2, p2):
+            return None
+        r2 = int(self.sinif_iliski[s, g2, p2])
+        k2 = int(self.sinif_derslik[s, g2, p2])
+        
+        # Birinci ders yeni hücreye gidebilir mi?
+        if not o.uygun_zamanlar[r1, g2, p2]:
+            return None
+        if self.ogretmen_dolu[t1, g2, p2] and not (r2 >= 0 and self.iliski_ogretmen[r2] == t1):
+            return None
+        
+        if r2 < 0:
+            # Boş hücreye taşıma
+            self.derslik_dolu[k1, g1, p1] = False
+            yeni_k = self._derslik_sec(r1, s, g2, p2, k1)
+            self.derslik_dolu[k1, g1, p1] = True
+            if yeni_k is None:
+                return None
+            return [(s, g1, p1, r1, k1, -1, -1), (s, g2, p2, -1, -1, r1, yeni_k)]
+        
+        # Takas: ikinci ders birinci hücreye gidebilir mi?
+        if r2 == r1:
+            return None
+        t2 = self.iliski_ogretmen[r2]
+        if not o.uygun_zamanlar[r2, g1, p1]:
+            return None
+        if self.ogretmen_dolu[t2, g1, p1] and t2 != t1:
+            return None
+        
+        # Dersler derslikleriyle birlikte yer değiştirir; derslik diğer hücrede boş olmalı
+        if k1 != k2 and (self.derslik_dolu[k1, g2, p2] or self.derslik_dolu[k2, g1, p1]):
+            return None
+        return [(s, g1, p1, r1, k1, r2, k2), (s, g2, p2, r2, k2, r1, k1)]
+    
+    def _uygula(self, degisiklikler, geri=False):
+        """
+        Hamleyi uygular veya geri alır
+        """
+        # Önce tüm hücreler boşaltılır, sonra yeni dersler yerleştirilir (takaslarda doluluk karışmasın)
+        for s, gun, saat, eski_r, eski_k, yeni_r, yeni_k in degisiklikler:
+            self._yerlestir(s, gun, saat, -1, -1)
+        for s, gun, saat, eski_r, eski_k, yeni_r, yeni_k in degisiklikler:
+            r, k = (eski_r, eski_k) if geri else (yeni_r, yeni_k)
+            if r >= 0:
+                self._yerlestir(s, gun, saat, r, k)
+    
+    def _etkilenenler(self, degisiklikler):
+        """
+        Hamlenin etkilediği sınıf-gün ve öğretmen-gün satırlarını döndürür
+        """
+        siniflar = set()
+        ogretmenler = set()
+        for s, gun, saat, eski_r, eski_k, yeni_r, yeni_k in degisiklikler:
+            siniflar.add((s, gun))
+            for r in (eski_r, yeni_r):
+                if r >= 0:
+                    ogretmenler.add((int(self.iliski_ogretmen[r]), gun))
+        return siniflar, ogretmenler
+    
+    def toplam_maliyet(self):
+        """
+        Programın amaç değeri (boş saat ve derslik değişimi) ile ihlal sayısını döndürür
+        
+        Returns:
+            tuple: (maliyet, ihlal)
+        """
+        siniflar = {(s, gun) for s in range(self.sinif_iliski.shape[0]) for gun in range(self.gun_sayisi)}
+        ogretmenler = {(t, gun) for t in range(self.ogretmen_dolu.shape[0]) for gun in range(self.gun_sayisi)}
+        return self._durum(siniflar, ogretmenler)
+    
+    def degerlendir(self, atamalar):
+        """
+        Programın amaç değerini ve ihlal sayısını hesaplar
+        
+        Args:
+            atamalar (list): (iliski_id, gun, saat, derslik_id) demetleri
+            
+        Returns:
+            tuple: (maliyet, ihlal)
+        """
+        self._yukle(atamalar)
+        return self.toplam_maliyet()
+    
+    def iyilestir(self, atamalar, sure_siniri):
+        """
+        Programı verilen süre boyunca iyileştirir
+        
+        Args:
+            atamalar (list): (iliski_id, gun, saat, derslik_id) demetleri (save_solution biçimi)
+            sure_siniri (float): Süre sınırı (saniye)
+            
+        Returns:
+            list: İyileştirilmiş (iliski_id, gun, saat, derslik_id) demetleri
+        """
+        baslangic = time.time()
+        self._yukle(atamalar)
+        
+        maliyet, _ = self.toplam_maliyet()
+        ilk_maliyet = maliyet
+        en_iyi_maliyet = maliyet
+        en_iyi = (self.sinif_iliski.copy(), self.sinif_derslik.copy())
+        
+        # Hamleler yalnızca dersi olan sınıf-gün satırlarından başlar
+        self.dolu_hucreler = [tuple(hucre) for hucre in np.argwhere(self.sinif_iliski >= 0).tolist()]
+        if not self.dolu_hucreler:
+            return atamalar
+        
+        baslangic_sicakligi = 2.0
+        bitis_sicakligi = 0.05
+        hamle_sayisi = 0
+        kabul_sayisi = 0
+        
+        while True:
+            gecen = time.time() - baslangic
+            if gecen >= sure_siniri or self.olusturucu.durdurma_istendi:
+                break
+            sicaklik = baslangic_sicakligi * (bitis_sicakligi / baslangic_sicakligi) ** (gecen / sure_siniri)
+            
+            for _ in range(100):
+                degisiklikler = self._hamle()
+                if degisiklikler is None:
+                    continue
+                hamle_sayisi += 1
+                
+                siniflar, ogretmenler = self._etkilenenler(degisiklikler)
+                onceki_maliyet, onceki_ihlal = self._durum(siniflar, ogretmenler)
+                self._uygula(degisiklikler)
+                sonraki_maliyet, sonraki_ihlal = self._durum(siniflar, ogretmenler)
+                
+                fark = sonraki_maliyet - onceki_maliyet
+                if sonraki_ihlal > onceki_ihlal or (fark > 0 and self.rastgele.random() >= math.exp(-fark / sicaklik)):
+                    self._uygula(degisiklikler, geri=True)
+                    continue
+                
+                kabul_sayisi += 1
+                maliyet += fark
+                
+                # Taşınan ders yeni hücresinden de seçilebilsin
+                for s, gun, saat, eski_r, eski_k, yeni_r, yeni_k in degisiklikler:
+                    if eski_r < 0 and yeni_r >= 0:
+                        self.dolu_hucreler.append((s, gun, saat))
+                
+                if maliyet < en_iyi_maliyet:
+                    en_iyi_maliyet = maliyet
+                    en_iyi = (self.sinif_iliski.copy(), self.sinif_derslik.copy())
+            
+            # Boşalan hücreler ara sıra listeden temizlenir
+            if len(self.dolu_hucreler) > 2 * len(atamalar):
+                self.dolu_hucreler = [tuple(hucre) for hucre in np.argwhere(self.sinif_iliski >= 0).tolist()]
+        
+        # En iyi programı geri yükle
+        self.sinif_iliski, self.sinif_derslik = en_iyi
+        
+        self.logger.info(
+            f"Yerel arama {time.time() - baslangic:.2f} saniyede {hamle_sayisi} hamle denedi ({kabul_sayisi} kabul), "
+            f"amaç {ilk_maliyet} -> {en_iyi_maliyet}"
+        )
+        return self._atamalar()